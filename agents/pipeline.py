@@ -8,14 +8,58 @@ from google import genai
 from google.genai import types
 from google.adk import Agent
 from google.adk.tools import google_search
-from typing import Optional, Dict, Any, List
-import json
+from typing import Optional, Any, List, Union
+import asyncio
+import csv
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import orjson
 
 from config import settings
+from persistence.llm_cache import LLMCache, InMemoryCacheBackend, RedisCacheBackend
+from utils.http import http_client
+from utils.rate_limit import gemini_limiter
 
 
 # Initialize Gemini client
-client = genai.Client(api_key=settings.gemini_api_key)
+client = genai.Client(
+    api_key=settings.gemini_api_key,
+    http_options=types.HttpOptions(httpx_async_client=http_client)
+)
+
+
+def _embed_prompt(text: str) -> List[float]:
+    """Embed a prompt for semantic cache lookups."""
+    result = client.models.embed_content(model=settings.embedding_model, contents=text)
+    return result.embeddings[0].values
+
+
+# Export directory for the agent's file tools
+EXPORT_DIR = Path(settings.export_dir)
+_EXPORT_DIR_READY = False
+
+
+def _ensure_export_dir() -> Path:
+    """Create the export directory on first use only (app startup normally already has)."""
+    global _EXPORT_DIR_READY
+    if not _EXPORT_DIR_READY:
+        EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+        _EXPORT_DIR_READY = True
+    return EXPORT_DIR
+
+
+_ORJSON_EXPORT_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+# Shared response cache (Redis-backed when configured, so workers share hits)
+response_cache = LLMCache(
+    backend=RedisCacheBackend(settings.redis_url) if settings.redis_url else InMemoryCacheBackend(),
+    ttl=settings.llm_cache_ttl_seconds,
+    threshold=settings.semantic_cache_threshold,
+    embedder=_embed_prompt
+)
 
 
 def create_chronicle_agent() -> Agent:
@@ -62,8 +106,8 @@ def create_chronicle_agent() -> Agent:
         Returns:
             Structured finding with quality score
         """
-        required_fields = criteria.get("required_fields", [])
-        present_fields = [f for f in required_fields if f in raw_data and raw_data[f]]
+        required_fields = criteria.get("required_fields") or ()
+        present_fields = {f for f in required_fields if raw_data.get(f)}
         completeness = len(present_fields) / len(required_fields) if required_fields else 1.0
 
         return {
@@ -85,25 +129,27 @@ def create_chronicle_agent() -> Agent:
             Scoring results with gaps identified
         """
         threshold = criteria.get("quality_threshold", 0.8)
-        scores = [f.get("quality_score", 0) for f in findings]
 
-        low_quality = [f for f in findings if f.get("quality_score", 0) < threshold]
-        high_quality = [f for f in findings if f.get("quality_score", 0) >= threshold]
+        # Vectorized over a score column; only low-quality findings are revisited
+        scores = np.asarray([f.get("quality_score", 0) for f in findings], dtype=np.float64)
+        low_idx = np.flatnonzero(scores < threshold)
+
+        gaps = [
+            {
+                "finding_id": findings[i].get("id"),
+                "missing_fields": findings[i].get("missing_fields", []),
+                "current_score": findings[i].get("quality_score", 0)
+            }
+            for i in low_idx
+        ]
 
         return {
             "total_findings": len(findings),
-            "average_score": sum(scores) / len(scores) if scores else 0,
-            "high_quality_count": len(high_quality),
-            "low_quality_count": len(low_quality),
-            "needs_correction": len(low_quality) > 0,
-            "gaps": [
-                {
-                    "finding_id": f.get("id"),
-                    "missing_fields": f.get("missing_fields", []),
-                    "current_score": f.get("quality_score", 0)
-                }
-                for f in low_quality
-            ]
+            "average_score": float(scores.mean()) if scores.size else 0,
+            "high_quality_count": len(findings) - len(gaps),
+            "low_quality_count": len(gaps),
+            "needs_correction": len(gaps) > 0,
+            "gaps": gaps
         }
 
     def export_to_json(findings: list, filename: str) -> dict:
@@ -117,17 +163,17 @@ def create_chronicle_agent() -> Agent:
         Returns:
             Export result with file path
         """
-        import json
-        from pathlib import Path
-        from datetime import datetime
-
-        export_dir = Path("./exports")
-        export_dir.mkdir(parents=True, exist_ok=True)
-
-        filepath = export_dir / f"{filename}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-
-        with open(filepath, "w") as f:
-            json.dump(findings, f, indent=2, default=str)
+        ts = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+        filepath = _ensure_export_dir() / f"{filename}_{ts}.json"
+
+        # Encode one finding at a time straight into a large binary buffer
+        last = len(findings) - 1
+        with open(filepath, "wb", buffering=1 << 20) as f:
+            f.write(b"[\n")
+            for i, finding in enumerate(findings):
+                f.write(orjson.dumps(finding, default=str, option=_ORJSON_EXPORT_OPTIONS))
+                f.write(b",\n" if i < last else b"\n")
+            f.write(b"]")
 
         return {
             "status": "success",
@@ -147,30 +193,23 @@ def create_chronicle_agent() -> Agent:
         Returns:
             Export result with file path
         """
-        import csv
-        from pathlib import Path
-        from datetime import datetime
-
-        export_dir = Path("./exports")
-        export_dir.mkdir(parents=True, exist_ok=True)
-
-        filepath = export_dir / f"{filename}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        ts = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+        filepath = _ensure_export_dir() / f"{filename}_{ts}.csv"
 
         if not findings:
             return {"status": "error", "message": "No findings to export"}
 
-        # Get all unique keys
-        all_keys = set()
-        for f in findings:
-            all_keys.update(f.keys())
+        # Header is the sorted union of the keys present, built in one pass;
+        # csv.writer str()s list/dict cells itself (and writes None as "")
+        header = sorted(set().union(*findings))
 
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=sorted(all_keys))
-            writer.writeheader()
+        # Stream rows straight to a large write buffer
+        with open(filepath, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
             for finding in findings:
-                # Convert complex objects to strings
-                row = {k: str(v) if isinstance(v, (list, dict)) else v for k, v in finding.items()}
-                writer.writerow(row)
+                get = finding.get
+                writer.writerow([get(name) for name in header])
 
         return {
             "status": "success",
@@ -241,6 +280,7 @@ class ChronicleAgent:
     def __init__(self):
         self.agent = create_chronicle_agent()
         self.client = client
+        self.cache = response_cache
 
     async def run_mission(
         self,
@@ -284,22 +324,33 @@ Start by searching for relevant information about: {goal}
 """
 
         try:
-            # Run the agent
-            response = self.client.models.generate_content(
-                model=self.agent.model,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    tools=[types.Tool(google_search=types.GoogleSearch())],
-                    system_instruction=self.agent.instruction
-                )
+            # Reuse a cached answer for the same mission (exact match: the goal
+            # and criteria are a small part of this prompt's embedding)
+            text = await self.cache.aget(
+                self.agent.model, prompt, self.agent.instruction, use_search=True, semantic=False
             )
+            if text is None:
+                # Run the agent
+                response = await self.client.aio.models.generate_content(
+                    model=self.agent.model,
+                    contents=prompt,
+                    config=types.GenerateContentConfig(
+                        tools=[types.Tool(google_search=types.GoogleSearch())],
+                        system_instruction=self.agent.instruction
+                    )
+                )
+                text = response.text if hasattr(response, 'text') else str(response)
+                await self.cache.aset(
+                    self.agent.model, prompt, text, self.agent.instruction, use_search=True, semantic=False
+                )
 
             # Parse the response
             result = {
                 "status": "completed",
-                "response": response.text if hasattr(response, 'text') else str(response),
+                "response": text,
                 "findings": [],
-                "exports": []
+                "exports": [],
+                "cache_stats": dict(self.cache.stats)
             }
 
             return result
@@ -312,16 +363,42 @@ Start by searching for relevant information about: {goal}
                 "exports": []
             }
 
-    async def search(self, query: str) -> list:
-        """Execute a single search query."""
+    async def search(self, query: Union[str, List[str]]) -> list:
+        """
+        Execute a search query, or several independent ones concurrently.
+
+        Queries share the pooled HTTP session. Concurrency is bounded by
+        max_concurrent_queries, and each Gemini call takes a token from the
+        shared rate limiter. Results come back in query order.
+        """
+        queries = [query] if isinstance(query, str) else query
+        semaphore = asyncio.Semaphore(max(settings.max_concurrent_queries, 1))
+
+        async def bounded(q: str) -> dict:
+            async with semaphore:
+                return await self._search_one(q)
+
+        return list(await asyncio.gather(*(bounded(q) for q in queries)))
+
+    async def _search_one(self, query: str) -> dict:
+        """Run one grounded search without blocking the event loop."""
+        contents = f"Search and summarize results for: {query}"
         try:
-            response = self.client.models.generate_content(
-                model=settings.researcher_model,
-                contents=f"Search and summarize results for: {query}",
-                config=types.GenerateContentConfig(
-                    tools=[types.Tool(google_search=types.GoogleSearch())]
+            # Rephrased queries hit semantically; only the query itself is embedded
+            text = await self.cache.aget(settings.researcher_model, contents, use_search=True, semantic_text=query)
+            if text is None:
+                await gemini_limiter.acquire()
+                response = await self.client.aio.models.generate_content(
+                    model=settings.researcher_model,
+                    contents=contents,
+                    config=types.GenerateContentConfig(
+                        tools=[types.Tool(google_search=types.GoogleSearch())]
+                    )
                 )
-            )
-            return [{"query": query, "result": response.text if hasattr(response, 'text') else str(response)}]
+                text = response.text if hasattr(response, 'text') else str(response)
+                await self.cache.aset(
+                    settings.researcher_model, contents, text, use_search=True, semantic_text=query
+                )
+            return {"query": query, "result": text}
         except Exception as e:
-            return [{"query": query, "error": str(e)}]
+            return {"query": query, "error": str(e)}
@@ -2,19 +2,25 @@
 CHRONICLE - Marathon Research-to-Action Agent
 Main FastAPI Application
 """
-from fastapi import FastAPI
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse
 from pathlib import Path
 
 from config import settings
 from routes import research, status, control, export, findings
+from utils import ORJSONResponse
 
 # Create FastAPI app
 app = FastAPI(
     title="CHRONICLE",
     description="Marathon Research-to-Action Agent - Autonomous multi-day research with real deliverables",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -26,6 +32,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+class _NoStreamGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that passes SSE streams through untouched."""
+
+    async def __call__(self, scope, receive, send) -> None:
+        # Older Starlette releases gzip (and so buffer) text/event-stream
+        if scope["type"] == "http" and scope["path"].endswith("/stream"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Compress JSON responses (finding lists are large and repetitive; SSE is left alone)
+app.add_middleware(_NoStreamGZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include routers
 app.include_router(research.router, prefix="/api", tags=["Research"])
 app.include_router(status.router, prefix="/api", tags=["Status"])
@@ -36,9 +57,7 @@ app.include_router(findings.router, prefix="/api", tags=["Findings"])
 # Ensure export directory exists
 export_dir = Path(settings.export_dir)
 export_dir.mkdir(parents=True, exist_ok=True)
-
-# Mount static files for exports
-app.mount("/exports", StaticFiles(directory=str(export_dir)), name="exports")
+export_root = export_dir.resolve()
 
 # Data directory
 data_dir = Path("./data")
@@ -48,6 +67,11 @@ data_dir.mkdir(parents=True, exist_ok=True)
 @app.on_event("startup")
 async def startup_event():
     """Initialize on startup."""
+    # Concurrent store reads (asyncio.gather over to_thread) share this pool
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=settings.io_thread_pool_size)
+    )
+
     print("=" * 50)
     print("CHRONICLE - Marathon Research-to-Action Agent")
     print("=" * 50)
@@ -57,6 +81,19 @@ async def startup_event():
     print("=" * 50)
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Write any pending (coalesced) saves before exiting, then close the shared HTTP pool and PDF workers."""
+    from persistence import mission_store, checkpoint_store
+    from tools.file_export import shutdown_pdf_pool
+    from utils.http import http_client
+
+    await mission_store.flush()
+    await checkpoint_store.flush()
+    await http_client.aclose()
+    shutdown_pdf_pool()
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API info."""
@@ -80,3 +117,18 @@ async def root():
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "service": "chronicle"}
+
+
+@app.get("/exports/{file_path:path}")
+async def download_export(file_path: str):
+    """
+    Serve an exported file.
+
+    FileResponse streams from disk (via sendfile where the server supports
+    it) instead of reading the whole export inside the event loop.
+    """
+    path = (export_root / file_path).resolve()
+    if not path.is_relative_to(export_root) or not path.is_file():
+        raise HTTPException(status_code=404, detail="Export not found")
+
+    return FileResponse(path, filename=path.name)
@@ -1,6 +1,8 @@
 """
 CHRONICLE Configuration Settings
 """
+from functools import lru_cache
+
 # Force load .env file FIRST, overriding any system environment variables
 from dotenv import load_dotenv
 load_dotenv(override=True)
@@ -29,9 +31,17 @@ class Settings(BaseSettings):
     host: str = Field(default="0.0.0.0", alias="HOST")
     port: int = Field(default=8000, alias="PORT")
     debug: bool = Field(default=True, alias="DEBUG")
+    # Uvicorn worker processes. Missions, the mission cache and the event bus
+    # live in-process, so >1 needs those externalized (e.g. Redis); otherwise
+    # SSE clients miss events published by other workers.
+    workers: int = Field(default=1, alias="WORKERS")
+    io_thread_pool_size: int = 32   # Default executor workers (to_thread file I/O)
+    sse_ping_seconds: int = 15          # Keep-alive comment interval on idle SSE streams
+    sse_send_timeout_seconds: float = 5.0  # Drop SSE clients whose socket stops draining
 
     # Export Configuration
     export_dir: Path = Field(default=Path("./exports"), alias="EXPORT_DIR")
+    pdf_export_processes: int = 0   # Worker processes rendering PDFs (0 = one per CPU core)
 
     # Mission Configuration
     max_mission_duration_hours: int = 24
@@ -59,19 +69,35 @@ class Settings(BaseSettings):
 
     # Validation Phase
     validation_queries_per_entity: int = 2  # Verify key claims
+    validation_batch_size: int = 5          # Findings verified per LLM call
 
     # Time Management - Don't finish too fast!
     min_research_duration_minutes: int = 10   # Minimum time for "deep" research
     max_research_duration_minutes: int = 60   # Cap duration
     delay_between_queries_seconds: float = 1.0  # Rate limiting
+    gemini_rpm: int = 60                      # Gemini requests per minute (token-bucket rate)
+    max_concurrent_queries: int = 10          # In-flight Gemini calls per fan-out
+    max_concurrent_entities: int = 5          # Entities/pairs researched at once per phase
+    use_bundle_queries: bool = True           # One structured call per entity (False = 5 per-aspect calls)
 
     # Quality Thresholds for Semantic Scoring
     depth_score_threshold: float = 0.6      # Minimum depth score to pass
+    acceptable_depth_score: float = 0.75    # Average depth that, with no shallow finding, skips the LLM depth review
     max_deepening_iterations: int = 3       # Re-research attempts for shallow findings
 
     # Web Search - ENABLE for real-time data
     enable_google_search: bool = True       # Enable Gemini Google Search grounding
 
+    # ===========================================
+    # LLM RESPONSE CACHE
+    # ===========================================
+
+    llm_cache_ttl_seconds: int = 86400      # Cached responses expire after a day
+    llm_cache_stable_ttl_seconds: int = 604800  # Slow-changing facts (features, use cases, competitors): a week
+    semantic_cache_threshold: float = 0.92  # Cosine similarity for a semantic hit
+    embedding_model: str = "text-embedding-004"
+    redis_url: Optional[str] = Field(default=None, alias="REDIS_URL")  # Share cache across workers
+
     # Optional Google Cloud
     google_cloud_project: Optional[str] = Field(default=None, alias="GOOGLE_CLOUD_PROJECT")
 
@@ -81,5 +107,11 @@ class Settings(BaseSettings):
         extra = "ignore"
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build settings once per process and reuse the validated instance."""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
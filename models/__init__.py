@@ -6,7 +6,7 @@ from .responses import (
     ActionResult,
     StreamEvent
 )
-from .domain import Mission, ResearchPlan, Checkpoint, MissionState
+from .domain import Mission, MissionMeta, ResearchPlan, Checkpoint, MissionState
 
 __all__ = [
     "ResearchRequest",
@@ -17,6 +17,7 @@ __all__ = [
     "ActionResult",
     "StreamEvent",
     "Mission",
+    "MissionMeta",
     "ResearchPlan",
     "Checkpoint",
     "MissionState"
@@ -0,0 +1,83 @@
+"""
+CHRONICLE Serialization - Shared encode/decode for persisted models
+
+Missions and checkpoints are stored as MessagePack (msgspec); the JSON
+helpers cover legacy files and human-readable output.
+"""
+from typing import Any
+
+import msgspec
+import orjson
+from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError
+
+
+# Persisted files stay human-readable; orjson handles datetime/UUID natively.
+# Naive datetimes stay naive (no "+00:00") so they reload like pydantic's output.
+_DUMPS_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+_COMPACT_OPTIONS = _DUMPS_OPTIONS & ~orjson.OPT_INDENT_2
+
+_orjson_dumps = orjson.dumps
+
+loads = orjson.loads
+
+
+def _json_fallback(obj: Any) -> Any:
+    """Encode values orjson does not know: models by their fields, anything else as str."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    return str(obj)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode plain data (models allowed anywhere inside) to indented JSON bytes."""
+    return orjson.dumps(obj, default=_json_fallback, option=_DUMPS_OPTIONS)
+
+
+def dumps_compact(obj: Any) -> bytes:
+    """Encode plain data to single-line JSON bytes (wire payloads, SSE frames)."""
+    return _orjson_dumps(obj, default=_json_fallback, option=_COMPACT_OPTIONS)
+
+
+def dump_model(model: BaseModel) -> bytes:
+    """
+    Encode a Pydantic model with pydantic-core's serializer.
+
+    Free-form finding dicts can carry values pydantic cannot encode (NumPy
+    scalars, arbitrary objects); those models go through orjson instead,
+    which handles NumPy natively and stringifies anything else.
+    """
+    try:
+        return model.model_dump_json(indent=2).encode("utf-8")
+    except PydanticSerializationError:
+        return dumps(model.model_dump())
+
+
+# ===========================================
+# MESSAGEPACK (on-disk mission/checkpoint records)
+# ===========================================
+
+def _msgpack_fallback(obj: Any) -> Any:
+    """Encode values msgspec does not know: NumPy via tolist(), anything else as str."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    return str(obj)
+
+
+_msgpack_encoder = msgspec.msgpack.Encoder(enc_hook=_msgpack_fallback)
+_msgpack_decoder = msgspec.msgpack.Decoder()
+
+
+def pack(data: Any) -> bytes:
+    """Encode plain Python data to MessagePack bytes."""
+    return _msgpack_encoder.encode(data)
+
+
+def pack_model(model: BaseModel) -> bytes:
+    """Encode a Pydantic model to MessagePack bytes (enums/datetimes handled natively)."""
+    return _msgpack_encoder.encode(model.model_dump())
+
+
+def unpack(data: bytes) -> Any:
+    """Decode MessagePack bytes to plain Python data."""
+    return _msgpack_decoder.decode(data)
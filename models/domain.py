@@ -1,11 +1,22 @@
 """
 CHRONICLE Domain Models
 """
-from pydantic import BaseModel, Field, field_validator, model_validator
-from typing import Optional, List, Dict, Any, Union
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter, computed_field, field_validator, model_validator
+from typing import Callable, ClassVar, Optional, List, Dict, Any, Union, Tuple
 from datetime import datetime
 from enum import Enum
+import bisect
+import time
 import uuid
+from collections import Counter
+from itertools import chain
+from operator import attrgetter
+
+import numpy as np
+
+from utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 class MissionState(str, Enum):
@@ -75,34 +86,52 @@ class DeepFinding(BaseModel):
     discovered_at: datetime = Field(default_factory=datetime.utcnow)
     last_deepened: Optional[datetime] = None
 
+    # The 10 key attributes counted into attribute_count (fixed at class definition)
+    _COUNTABLE_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "pricing", "features", "pros", "cons", "use_cases",
+        "target_audience", "competitors", "integrations", "website", "description",
+    )
+    _countable_values: ClassVar[Callable[[Any], Tuple[Any, ...]]] = attrgetter(*_COUNTABLE_FIELDS)
+
+    def count_attributes(self) -> int:
+        """Count how many key attributes have been populated."""
+        # One C-level fetch of all ten values, truth-tested by map()
+        return sum(map(bool, self._countable_values(self)))
+
+    def recompute_attribute_count(self) -> int:
+        """Refresh attribute_count from the populated key attributes."""
+        self.attribute_count = self.count_attributes()
+        return self.attribute_count
+
+    # Fields sent to the synthesis prompt, with list caps (None = sent whole)
+    _SYNTHESIS_FIELDS: ClassVar[Tuple[Tuple[str, Optional[int]], ...]] = (
+        ("name", None), ("category", None), ("description", None), ("pricing", None),
+        ("features", 10), ("pros", 5), ("cons", 5), ("use_cases", 5),
+        ("target_audience", None), ("competitors", 5), ("depth_score", None),
+    )
+
+    def synthesis_view(self) -> Dict[str, Any]:
+        """
+        Projection of this finding for the synthesis prompt.
+
+        Lists are truncated to their caps and empty values are left out, so
+        the prompt carries no keys that say nothing (fewer tokens sent).
+        """
+        view: Dict[str, Any] = {}
+        for field, cap in self._SYNTHESIS_FIELDS:
+            value = getattr(self, field)
+            if cap is not None:
+                value = value[:cap]
+            if value or field in ("name", "depth_score"):
+                view[field] = value
+        return view
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for storage/export."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "category": self.category,
-            "description": self.description,
-            "pricing": self.pricing,
-            "features": self.features,
-            "pros": self.pros,
-            "cons": self.cons,
-            "use_cases": self.use_cases,
-            "target_audience": self.target_audience,
-            "competitors": self.competitors,
-            "website": self.website,
-            "founded": self.founded,
-            "funding": self.funding,
-            "integrations": self.integrations,
-            "reviews_summary": self.reviews_summary,
-            "comparison_notes": self.comparison_notes,
-            "attribute_count": self.attribute_count,
-            "depth_score": self.depth_score,
-            "source_count": self.source_count,
-            "sources": self.sources,
-            "research_iterations": self.research_iterations,
-            "quality_score": self.depth_score,  # Alias for compatibility
-            "verified": self.depth_score >= 0.7,
-        }
+        data = self.model_dump(mode="json")
+        data["quality_score"] = self.depth_score  # Alias for compatibility
+        data["verified"] = self.depth_score >= 0.7
+        return data
 
 
 class ResearchTask(BaseModel):
@@ -114,6 +143,10 @@ class ResearchTask(BaseModel):
     results: List[Dict[str, Any]] = Field(default_factory=list)
 
 
+# Validates a whole task list in pydantic-core instead of one model per loop iteration
+_TASKS_ADAPTER = TypeAdapter(List[ResearchTask])
+
+
 class ResearchPlan(BaseModel):
     """The research plan created by the Planner agent."""
     id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
@@ -126,21 +159,14 @@ class ResearchPlan(BaseModel):
     @field_validator('tasks', mode='before')
     @classmethod
     def convert_tasks(cls, v):
-        """Convert dict tasks to ResearchTask objects."""
+        """Convert dict/string tasks to ResearchTask objects in one validation pass."""
         if not v:
             return []
-        result = []
-        for task in v:
-            if isinstance(task, ResearchTask):
-                result.append(task)
-            elif isinstance(task, dict):
-                result.append(ResearchTask(**task))
-            elif isinstance(task, str):
-                result.append(ResearchTask(query=task))
-            else:
-                # Convert any unknown type to string and create a ResearchTask
-                result.append(ResearchTask(query=str(task)))
-        return result
+        normalized = [
+            task if isinstance(task, (ResearchTask, dict)) else {"query": str(task)}
+            for task in v
+        ]
+        return _TASKS_ADAPTER.validate_python(normalized)
 
 
 class Checkpoint(BaseModel):
@@ -150,11 +176,22 @@ class Checkpoint(BaseModel):
     state: MissionState
     plan: Optional[ResearchPlan] = None
     findings: List[Dict[str, Any]] = Field(default_factory=list)
+    findings_ref: Optional[Tuple[str, int]] = None  # (mission_id, findings count) at checkpoint time
     actions_completed: List[str] = Field(default_factory=list)
     current_task_index: int = 0
     thought_signature: Optional[str] = None  # Gemini thought signature for continuity
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+    # Mission findings list the checkpoint was taken from; sliced lazily on save
+    _findings_source: Optional[List[Dict[str, Any]]] = PrivateAttr(default=None)
+
+    def materialize_findings(self) -> List[Dict[str, Any]]:
+        """Copy the referenced findings into the checkpoint (only needed before writing to disk)."""
+        if self._findings_source is not None and self.findings_ref:
+            self.findings = self._findings_source[:self.findings_ref[1]]
+            self._findings_source = None
+        return self.findings
+
 
 class Mission(BaseModel):
     """Complete mission object."""
@@ -176,6 +213,27 @@ class Mission(BaseModel):
     # Synthesis report (comprehensive analysis from LLM)
     synthesis: Optional[Dict[str, Any]] = None
 
+    # Bumped on every add_finding so checkpoints can reference findings by count
+    _findings_version: int = PrivateAttr(default=0)
+
+    # Columnar copies of finding scores/ids plus running summary stats (kept in
+    # step with add_finding; rebuilt if `findings` is replaced wholesale).
+    # Findings are append-only: edit one with update_finding, never in place.
+    _score_buffer: np.ndarray = PrivateAttr(default_factory=lambda: np.empty(0, dtype=np.float64))  # Grows by doubling
+    _id_column: List[Optional[str]] = PrivateAttr(default_factory=list)
+    _findings_by_id: Dict[str, Dict[str, Any]] = PrivateAttr(default_factory=dict)
+    _sorted_scores: List[Tuple[float, int]] = PrivateAttr(default_factory=list)  # (score, index)
+    _verified_indices: List[int] = PrivateAttr(default_factory=list)
+    _source_counts: Counter = PrivateAttr(default_factory=Counter)
+    _quality_sum: float = PrivateAttr(default=0.0)
+    _scored_sum: float = PrivateAttr(default=0.0)  # Over findings with quality_score > 0
+    _scored_count: int = PrivateAttr(default=0)
+    _columns_source: Optional[List[Dict[str, Any]]] = PrivateAttr(default=None)
+
+    # Export actions split out of actions_completed (same lazy-rebuild scheme)
+    _export_actions: List[Dict[str, Any]] = PrivateAttr(default_factory=list)
+    _actions_source: Optional[List[Dict[str, Any]]] = PrivateAttr(default=None)
+
     @field_validator('plan', mode='before')
     @classmethod
     def convert_plan(cls, v):
@@ -186,26 +244,16 @@ class Mission(BaseModel):
             return v
         if isinstance(v, dict):
             try:
-                # Handle tasks that might be strings or dicts
-                tasks = v.get('tasks', [])
-                converted_tasks = []
-                for task in tasks:
-                    if isinstance(task, str):
-                        converted_tasks.append({'query': task})
-                    elif isinstance(task, dict):
-                        converted_tasks.append(task)
-                    else:
-                        # Convert unknown types to string query
-                        converted_tasks.append({'query': str(task)})
-                v['tasks'] = converted_tasks
+                # Tasks (strings or dicts) are normalized by ResearchPlan.convert_tasks
+                data = dict(v)
 
                 # Ensure goal is present (required by ResearchPlan)
-                if 'goal' not in v:
-                    v['goal'] = v.get('strategy', 'Research task')[:200]
+                if 'goal' not in data:
+                    data['goal'] = data.get('strategy', 'Research task')[:200]
 
-                return ResearchPlan(**v)
+                return ResearchPlan.model_validate(data)
             except Exception as e:
-                print(f"Error converting plan dict to ResearchPlan: {e}")
+                log.warning("Error converting plan dict to ResearchPlan: %s", e)
                 # Return a minimal valid ResearchPlan
                 return ResearchPlan(
                     goal=v.get('strategy', 'Research task')[:200],
@@ -226,34 +274,266 @@ class Mission(BaseModel):
 
     # Timestamps
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
     completed_at: Optional[datetime] = None
 
+    # Last explicitly assigned/loaded update time; serialized through `updated_at`
+    stored_updated_at: datetime = Field(default_factory=datetime.utcnow, alias="updated_at", exclude=True)
+
+    # Wall-clock epoch ns of the last in-process change (None = use stored_updated_at).
+    # Hot paths record this instead of allocating a datetime per call.
+    _updated_ns: Optional[int] = PrivateAttr(default=None)
+
+    @computed_field
+    @property
+    def updated_at(self) -> datetime:
+        """Last update time, converted from the nanosecond stamp only when read."""
+        if self._updated_ns is None:
+            return self.stored_updated_at
+        return datetime.utcfromtimestamp(self._updated_ns / 1e9)
+
+    @updated_at.setter
+    def updated_at(self, value: datetime) -> None:
+        self.stored_updated_at = value
+        self._updated_ns = None
+
+    # Storage dict reused across saves (see to_storage_dict)
+    _serialized: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    # Append-only lists referenced (not copied) by the storage dict
+    _LIVE_STORAGE_FIELDS: ClassVar[frozenset] = frozenset({"findings", "actions_completed"})
+
+    # Small nested containers that can be mutated in place; dumped on every call
+    _FRESH_STORAGE_FIELDS: ClassVar[frozenset] = frozenset(
+        {"criteria", "actions_config", "settings", "plan", "synthesis"}
+    )
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        # Keep the cached storage dict in step with top-level field assignments
+        if self._serialized is not None and name in type(self).model_fields:
+            if name in self._LIVE_STORAGE_FIELDS:
+                self._serialized[name] = value
+            elif name not in self._FRESH_STORAGE_FIELDS:
+                self._serialized.update(self.model_dump(include={name}))
+
+    def to_storage_dict(self) -> Dict[str, Any]:
+        """
+        Plain dict of the mission for persistence, equivalent to model_dump().
+
+        Built once and then patched per mutation: field assignments update
+        their key, and findings/actions are the live lists, so add_finding
+        and add_action cost nothing here. Saving a large mission no longer
+        re-walks every finding. The nested dicts (criteria, settings,
+        actions_config, synthesis, plan) are re-dumped on each call, so
+        in-place edits to them are picked up too.
+        """
+        if self._serialized is None:
+            serialized = self.model_dump(exclude=self._LIVE_STORAGE_FIELDS | self._FRESH_STORAGE_FIELDS)
+            for name in self._LIVE_STORAGE_FIELDS:
+                serialized[name] = getattr(self, name)
+            self._serialized = serialized
+        self._serialized.update(self.model_dump(include=self._FRESH_STORAGE_FIELDS))
+        self._serialized["updated_at"] = self.updated_at
+        return self._serialized
+
+    def touch(self):
+        """Mark the mission as updated now."""
+        self._updated_ns = time.time_ns()
+
     def update_state(self, new_state: MissionState, activity: str = None):
         """Update mission state and activity."""
         self.state = new_state
         if activity:
             self.current_activity = activity
-        self.updated_at = datetime.utcnow()
+        self.touch()
 
     def add_finding(self, finding: Dict[str, Any]):
         """Add a new finding to the mission."""
         self.findings.append(finding)
-        self.updated_at = datetime.utcnow()
+        self._findings_version += 1
+        if self._columns_source is self.findings:
+            self._track_finding(finding)
+        self.touch()
+
+    def update_finding(self, index: int, changes: Dict[str, Any]):
+        """
+        Apply `changes` to the finding at `index`.
+
+        The findings list is replaced rather than edited in place, so the
+        running stats are rebuilt and the store rewrites its findings log.
+        """
+        findings = list(self.findings)
+        findings[index] = {**findings[index], **changes}
+        self.findings = findings
+        self.touch()
+
+    def _track_finding(self, finding: Dict[str, Any]):
+        """Fold one finding (the last in `findings`) into the columns and stats."""
+        index = len(self._id_column)
+        score = finding.get("quality_score", 0)
+        if index == len(self._score_buffer):
+            grown = np.empty(max(16, 2 * index), dtype=np.float64)
+            grown[:index] = self._score_buffer
+            self._score_buffer = grown
+        self._score_buffer[index] = score
+        self._id_column.append(finding.get("id"))
+        self._findings_by_id.setdefault(finding.get("id"), finding)  # First match wins, as with a scan
+        bisect.insort(self._sorted_scores, (score, index))
+        self._quality_sum += score
+        if score > 0:
+            self._scored_sum += score
+            self._scored_count += 1
+        if finding.get("verified", False):
+            self._verified_indices.append(index)
+        self._source_counts.update(finding.get("sources", ("unknown",)))
+
+    def _sync_finding_columns(self):
+        """Rebuild the columns and stats if findings were loaded or reassigned."""
+        if self._columns_source is not self.findings or len(self._id_column) != len(self.findings):
+            # Bulk rebuild: each column is one comprehension/C-level pass
+            findings = self.findings
+            score_column = [f.get("quality_score", 0) for f in findings]
+            self._score_buffer = np.array(score_column, dtype=np.float64)
+            self._id_column = [f.get("id") for f in findings]
+            # Reversed so the first finding with a given id wins, as with a scan
+            self._findings_by_id = dict(zip(reversed(self._id_column), reversed(findings)))
+            self._sorted_scores = sorted(zip(score_column, range(len(findings))))
+            self._verified_indices = [i for i, f in enumerate(findings) if f.get("verified", False)]
+            self._source_counts = Counter(chain.from_iterable(f.get("sources", ("unknown",)) for f in findings))
+            # Vectorized reductions instead of Python-level sum loops
+            scores = self._score_buffer
+            scored = scores[scores > 0]
+            self._quality_sum = float(scores.sum())
+            self._scored_sum = float(scored.sum())
+            self._scored_count = int(scored.size)
+            self._columns_source = findings
+
+    def quality_scores(self) -> np.ndarray:
+        """
+        Quality scores of all findings as a float array (in findings order).
+
+        A read-only view of the maintained column, so no copy is made per
+        call; it is valid until the next add_finding.
+        """
+        self._sync_finding_columns()
+        scores = self._score_buffer[:len(self._id_column)]
+        scores.flags.writeable = False
+        return scores
+
+    def scored_quality_average(self) -> float:
+        """Average quality_score over scored findings (score > 0); 0.0 if none."""
+        self._sync_finding_columns()
+        return self._scored_sum / self._scored_count if self._scored_count else 0.0
+
+    @property
+    def findings_by_id(self) -> Dict[str, Dict[str, Any]]:
+        """Findings keyed by id, for O(1) lookup."""
+        self._sync_finding_columns()
+        return self._findings_by_id
+
+    def findings_summary(self) -> Dict[str, Any]:
+        """Summary statistics of the findings, served from the running totals."""
+        self._sync_finding_columns()
+        total = len(self._id_column)
+        if not total:
+            return {
+                "total_findings": 0,
+                "average_quality": 0.0,
+                "verified_count": 0,
+                "by_source": {}
+            }
+
+        verified_count = len(self._verified_indices)
+        return {
+            "total_findings": total,
+            "average_quality": float(self._quality_sum / total),
+            "min_quality": float(self._sorted_scores[0][0]),
+            "max_quality": float(self._sorted_scores[-1][0]),
+            "verified_count": verified_count,
+            "verification_rate": verified_count / total,
+            "by_source": dict(self._source_counts)
+        }
+
+    def filter_findings(self, min_score: Optional[float] = None, verified_only: bool = False) -> List[Dict[str, Any]]:
+        """Findings with quality_score >= min_score and/or verified, in findings order."""
+        if min_score is None and not verified_only:
+            return self.findings
+
+        self._sync_finding_columns()
+        indices = None
+        if min_score is not None:
+            start = bisect.bisect_left(self._sorted_scores, (min_score, -1))
+            indices = sorted(index for _, index in self._sorted_scores[start:])
+        if verified_only:
+            indices = self._verified_indices if indices is None else [
+                index for index in indices if self.findings[index].get("verified", False)
+            ]
+        return [self.findings[index] for index in indices]
+
+    @property
+    def findings_count(self) -> int:
+        """Number of findings; the one place to change if findings move off-process."""
+        return len(self.findings)
+
+    def finding_ids(self) -> List[Optional[str]]:
+        """Finding ids aligned with quality_scores()."""
+        self._sync_finding_columns()
+        return self._id_column
 
     def add_action(self, action: Dict[str, Any]):
         """Record a completed action."""
         self.actions_completed.append(action)
-        self.updated_at = datetime.utcnow()
+        if self._actions_source is self.actions_completed and action.get("action_type") == "export":
+            self._export_actions.append(action)
+        self.touch()
+
+    @property
+    def exports(self) -> List[Dict[str, Any]]:
+        """Completed export actions, in order."""
+        if self._actions_source is not self.actions_completed:
+            self._export_actions = [a for a in self.actions_completed if a.get("action_type") == "export"]
+            self._actions_source = self.actions_completed
+        return self._export_actions
 
     def to_checkpoint(self) -> Checkpoint:
-        """Create a checkpoint from current state."""
-        return Checkpoint(
+        """
+        Create a checkpoint from current state.
+
+        Findings are append-only, so the checkpoint records how many existed
+        and keeps a reference to the list instead of copying it. The slice is
+        taken by Checkpoint.materialize_findings() when the checkpoint is saved.
+        """
+        checkpoint = Checkpoint(
             mission_id=self.id,
             state=self.state,
             plan=self.plan,
-            findings=self.findings.copy(),
+            findings_ref=(self.id, len(self.findings)),
             actions_completed=[a.get("id", "") for a in self.actions_completed],
             current_task_index=self.completed_steps,
             thought_signature=self.thought_signature
         )
+        checkpoint._findings_source = self.findings
+        return checkpoint
+
+
+class MissionMeta(BaseModel):
+    """Lightweight mission header (no findings) for listings."""
+    id: str
+    goal: str
+    state: MissionState
+    current_activity: str = "Initializing..."
+    findings_count: int = 0
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_mission(cls, mission: Mission) -> "MissionMeta":
+        return cls(
+            id=mission.id,
+            goal=mission.goal,
+            state=mission.state,
+            current_activity=mission.current_activity,
+            findings_count=mission.findings_count,
+            created_at=mission.created_at,
+            updated_at=mission.updated_at
+        )
@@ -1,11 +1,13 @@
 """
 CHRONICLE Response Models
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
 
+from ._serde import dumps_compact
+
 
 class MissionStatusEnum(str, Enum):
     """Possible mission states."""
@@ -98,8 +100,45 @@ class StreamEventType(str, Enum):
     HEARTBEAT = "heartbeat"
 
 
+# "event: <type>\r\ndata: " per event type, built once
+_SSE_PREFIXES = {t: b"event: " + t.value.encode() + b"\r\ndata: " for t in StreamEventType}
+
+
 class StreamEvent(BaseModel):
-    """Server-Sent Event payload."""
+    """
+    Server-Sent Event payload.
+
+    The wire encodings are computed on first use and cached, so an event
+    fanned out to many subscribers is serialized once.
+    """
     type: StreamEventType
     data: Dict[str, Any]
     timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+    _sse_frame: Optional[bytes] = PrivateAttr(default=None)
+    _record_json: Optional[bytes] = PrivateAttr(default=None)
+
+    def sse_frame(self) -> bytes:
+        """
+        The complete SSE frame (`id:` + `event:` + `data:` lines) for this event.
+
+        The id is the event timestamp, so a reconnecting client's
+        Last-Event-ID (or `since`) replays what it missed. Heartbeats carry
+        no id: they are never replayed and must not move the client's cursor.
+        """
+        if self._sse_frame is None:
+            frame = _SSE_PREFIXES[self.type] + dumps_compact(self.data) + b"\r\n\r\n"
+            if self.type is not StreamEventType.HEARTBEAT:
+                frame = b"id: " + self.timestamp.isoformat().encode() + b"\r\n" + frame
+            self._sse_frame = frame
+        return self._sse_frame
+
+    def record_json(self) -> bytes:
+        """The event as a JSON object of type, data and timestamp (activity log)."""
+        if self._record_json is None:
+            self._record_json = dumps_compact({
+                "type": self.type.value,
+                "data": self.data,
+                "timestamp": self.timestamp  # Formatted by orjson in C, same text as isoformat()
+            })
+        return self._record_json
@@ -1,13 +1,54 @@
 """
 CHRONICLE Checkpoint Store - Persistence for pause/resume checkpoints
+
+Each mission's checkpoints live in one append-only log,
+`{mission_id}.log`, made of frames: a 4-byte big-endian length followed by
+the MessagePack-encoded checkpoint. Saving is a single append; an in-memory
+index of {checkpoint_id: offset} (built by one scan per mission) makes
+get/get_latest a single seek + read.
+
+Pending saves are flushed as a batch: one worker-thread hop for the whole
+batch and one write() per mission log, however many checkpoints queued up.
 """
-import json
-import aiofiles
+import asyncio
+import os
+import shutil
 from pathlib import Path
-from typing import Optional, List
-from datetime import datetime
+from typing import Optional, List, Dict, Set, Tuple, Union
+
+import msgspec
+
+from models._serde import loads, pack_model, unpack
+from models.domain import Checkpoint
+from utils.log import get_logger
+from .frames import append_batches, append_frame, encode_frames, read_frame, read_frames, truncate_torn_tail
+from .write_behind import WriteBehindQueue
+
+log = get_logger(__name__)
+
+
+def _decode_data(payload: bytes) -> dict:
+    # Frames written before the MessagePack switch hold JSON objects
+    return loads(payload) if payload[:1] == b"{" else unpack(payload)
+
+
+def _decode(payload: bytes) -> Checkpoint:
+    return Checkpoint(**_decode_data(payload))
+
 
-from models.domain import Checkpoint, MissionState
+class _CheckpointHeader(msgspec.Struct):
+    """The id of a checkpoint frame; decoding skips every other field without building it."""
+    id: Optional[str] = None
+
+
+_header_msgpack = msgspec.msgpack.Decoder(_CheckpointHeader)
+_header_json = msgspec.json.Decoder(_CheckpointHeader)
+
+
+def _decode_id(payload: bytes) -> Optional[str]:
+    # Index scans only need the id, not the findings and plan in every frame
+    decoder = _header_json if payload[:1] == b"{" else _header_msgpack
+    return decoder.decode(payload).id
 
 
 class CheckpointStore:
@@ -16,86 +57,197 @@ class CheckpointStore:
     def __init__(self, data_dir: str = "./data/checkpoints"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self._writes = WriteBehindQueue(batch_writer=self._write_batch)
+
+        # mission_id -> {checkpoint_id: frame offset}, in append order
+        self._index: Dict[str, Dict[str, int]] = {}
 
-    def _get_mission_dir(self, mission_id: str) -> Path:
-        """Get directory for mission checkpoints."""
-        path = self.data_dir / mission_id
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        # Logs known to end on a frame boundary (safe to append)
+        self._clean_logs: Set[Path] = set()
 
-    def _get_path(self, mission_id: str, checkpoint_id: str) -> Path:
-        """Get file path for a checkpoint."""
-        return self._get_mission_dir(mission_id) / f"{checkpoint_id}.json"
+    def _get_log_path(self, mission_id: str) -> Path:
+        """Get the append-log path for a mission's checkpoints."""
+        return self.data_dir / f"{mission_id}.log"
 
     async def save(self, checkpoint: Checkpoint) -> None:
-        """Save a checkpoint to storage."""
-        path = self._get_path(checkpoint.mission_id, checkpoint.id)
-        data = checkpoint.model_dump(mode="json")
+        """
+        Save a checkpoint to storage (written in the background).
 
-        async with aiofiles.open(path, "w") as f:
-            await f.write(json.dumps(data, indent=2, default=str))
+        The checkpoint is encoded here, so the staged bytes are a snapshot
+        that later changes to the mission can't affect; only the file append
+        is deferred to the write-behind flusher.
+        """
+        checkpoint.materialize_findings()
+        self._writes.schedule((checkpoint.mission_id, checkpoint.id), (checkpoint.id, pack_model(checkpoint)))
 
-    async def get(self, mission_id: str, checkpoint_id: str) -> Optional[Checkpoint]:
-        """Get a specific checkpoint."""
-        path = self._get_path(mission_id, checkpoint_id)
+    async def flush(self) -> None:
+        """Write any pending checkpoints to disk."""
+        await self._writes.flush()
+
+    async def _write_batch(self, batch: Dict[Tuple[str, str], Tuple[str, bytes]]) -> List[Tuple[str, str]]:
+        """Append a flush's staged checkpoints; returns the keys that failed."""
+        # Appends are serialized by the write-behind queue's flush lock
+        groups: Dict[str, List[Tuple[Tuple[str, str], str, bytes]]] = {}
+        for key, (checkpoint_id, payload) in batch.items():
+            groups.setdefault(key[0], []).append((key, checkpoint_id, payload))
+
+        failed = []
+        for mission_id, items in list(groups.items()):
+            try:
+                await self._get_index(mission_id)
+            except Exception as e:
+                log.error("Error indexing checkpoints for %s: %s", mission_id, e)
+                failed.extend(key for key, _, _ in items)
+                del groups[mission_id]
+
+        results = await asyncio.to_thread(self._append_logs, {
+            self._get_log_path(mission_id): [payload for _, _, payload in items]
+            for mission_id, items in groups.items()
+        })
+
+        for mission_id, items in groups.items():
+            offsets = results[self._get_log_path(mission_id)]
+            if isinstance(offsets, Exception):
+                log.error("Error writing checkpoints for %s: %s", mission_id, offsets)
+                failed.extend(key for key, _, _ in items)
+                continue
+
+            index = self._index[mission_id]
+            for (_, checkpoint_id, _), offset in zip(items, offsets):
+                index.pop(checkpoint_id, None)  # Re-saved checkpoints move to the end
+                index[checkpoint_id] = offset
+        return failed
+
+    def _append_logs(self, batches: Dict[Path, List[bytes]]) -> Dict[Path, Union[List[int], Exception]]:
+        """append_batches, first cutting any torn tail off logs not yet known clean."""
+        # Runs under the flush lock, so no append can land between the check and the cut
+        for path in batches:
+            if path not in self._clean_logs:
+                try:
+                    truncate_torn_tail(path)
+                except OSError as e:
+                    log.error("Error recovering checkpoint log %s: %s", path, e)
+        results = append_batches(batches)
+        for path, offsets in results.items():
+            if isinstance(offsets, Exception):
+                self._clean_logs.discard(path)  # A failed write may have left a torn tail
+            else:
+                self._clean_logs.add(path)
+        return results
+
+    async def _get_index(self, mission_id: str) -> Dict[str, int]:
+        """Build (once) the checkpoint offset index for a mission."""
+        index = self._index.get(mission_id)
+        if index is None:
+            index = await asyncio.to_thread(self._scan, mission_id)
+            self._index[mission_id] = index
+        return index
+
+    def _scan(self, mission_id: str) -> Dict[str, int]:
+        path = self._get_log_path(mission_id)
+        self._migrate_legacy_dir(mission_id, path)
         if not path.exists():
-            return None
+            return {}
 
-        try:
-            async with aiofiles.open(path, "r") as f:
-                content = await f.read()
-                data = json.loads(content)
+        index = {}
+        for offset, payload in read_frames(path):
+            checkpoint_id = _decode_id(payload)
+            index.pop(checkpoint_id, None)
+            index[checkpoint_id] = offset
+        return index
+
+    def _migrate_legacy_dir(self, mission_id: str, path: Path) -> None:
+        """Fold old one-file-per-checkpoint directories into the mission's log."""
+        legacy_dir = self.data_dir / mission_id
+        if not legacy_dir.is_dir():
+            return
 
-                # Convert state string back to enum
-                if "state" in data and isinstance(data["state"], str):
-                    data["state"] = MissionState(data["state"])
+        with os.scandir(legacy_dir) as entries:
+            legacy_files = [(entry.stat().st_mtime, entry.path) for entry in entries if entry.name.endswith(".json")]
+        for _, legacy_file in sorted(legacy_files):
+            try:
+                append_frame(path, pack_model(_decode(Path(legacy_file).read_bytes())))
+            except Exception as e:
+                log.error("Error migrating checkpoint %s: %s", legacy_file, e)
+        shutil.rmtree(legacy_dir, ignore_errors=True)
 
-                return Checkpoint(**data)
+    async def _load(self, mission_id: str, offset: int) -> Optional[Checkpoint]:
+        """Read and decode the checkpoint frame at offset."""
+        try:
+            payload = await asyncio.to_thread(read_frame, self._get_log_path(mission_id), offset)
+            return _decode(payload)
         except Exception as e:
-            print(f"Error loading checkpoint: {e}")
+            log.error("Error loading checkpoint: %s", e)
+            return None
+
+    async def get(self, mission_id: str, checkpoint_id: str) -> Optional[Checkpoint]:
+        """Get a specific checkpoint."""
+        await self.flush()
+        offset = (await self._get_index(mission_id)).get(checkpoint_id)
+        if offset is None:
             return None
+        return await self._load(mission_id, offset)
 
     async def get_latest(self, mission_id: str) -> Optional[Checkpoint]:
         """Get the most recent checkpoint for a mission."""
-        mission_dir = self._get_mission_dir(mission_id)
-
-        # Get all checkpoint files sorted by modification time
-        files = sorted(mission_dir.glob("*.json"), key=lambda x: x.stat().st_mtime, reverse=True)
-
-        if not files:
+        await self.flush()
+        index = await self._get_index(mission_id)
+        if not index:
             return None
 
-        checkpoint_id = files[0].stem
-        return await self.get(mission_id, checkpoint_id)
+        # Index is in append order, so the last entry is the latest frame
+        return await self._load(mission_id, next(reversed(index.values())))
 
     async def list_for_mission(self, mission_id: str) -> List[Checkpoint]:
-        """List all checkpoints for a mission."""
-        mission_dir = self._get_mission_dir(mission_id)
-        checkpoints = []
-
-        for path in sorted(mission_dir.glob("*.json"), reverse=True):
-            checkpoint = await self.get(mission_id, path.stem)
-            if checkpoint:
-                checkpoints.append(checkpoint)
+        """List all checkpoints for a mission, newest first."""
+        await self.flush()
+        index = await self._get_index(mission_id)
+        if not index:
+            return []
 
+        # One sequential read of the log instead of a seek per checkpoint
+        frames = dict(await asyncio.to_thread(read_frames, self._get_log_path(mission_id)))
+        checkpoints = []
+        for offset in reversed(index.values()):
+            try:
+                checkpoints.append(_decode(frames[offset]))
+            except Exception as e:
+                log.error("Error loading checkpoint: %s", e)
         return checkpoints
 
     async def delete(self, mission_id: str, checkpoint_id: str) -> bool:
-        """Delete a checkpoint."""
-        path = self._get_path(mission_id, checkpoint_id)
-        if path.exists():
-            path.unlink()
-            return True
-        return False
+        """Delete a checkpoint (rewrites the mission's log without it)."""
+        await self.flush()
+        # No append may land between reading the log and rewriting it
+        async with self._writes.exclusive():
+            index = await self._get_index(mission_id)
+            if checkpoint_id not in index:
+                return False
+
+            path = self._get_log_path(mission_id)
+            frames = dict(await asyncio.to_thread(read_frames, path))
+            keep = [frames[offset] for cid, offset in index.items() if cid != checkpoint_id]
+            await asyncio.to_thread(
+                path.write_bytes,
+                encode_frames(keep)
+            )
+
+            # Offsets shifted; rebuild on next access
+            self._index.pop(mission_id, None)
+            self._clean_logs.add(path)
+        return True
 
     async def delete_all_for_mission(self, mission_id: str) -> int:
         """Delete all checkpoints for a mission."""
-        mission_dir = self._get_mission_dir(mission_id)
-        count = 0
+        await self.flush()
+        async with self._writes.exclusive():
+            count = len(await self._get_index(mission_id))
 
-        for path in mission_dir.glob("*.json"):
-            path.unlink()
-            count += 1
+            path = self._get_log_path(mission_id)
+            if path.exists():
+                path.unlink()
+            self._index.pop(mission_id, None)
+            self._clean_logs.discard(path)
 
         return count
 
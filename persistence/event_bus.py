@@ -2,11 +2,13 @@
 CHRONICLE Event Bus - Real-time event streaming for SSE
 """
 import asyncio
-from typing import AsyncIterator, Dict, List, Any
-from datetime import datetime
-from collections import defaultdict
+import itertools
+from typing import AsyncIterator, Deque, Dict, List, Any, Optional
+from datetime import datetime, timezone
+from collections import defaultdict, deque
 
 from models.responses import StreamEvent, StreamEventType
+from utils.clock import coarse_clock
 
 
 class EventBus:
@@ -15,12 +17,23 @@ class EventBus:
 
     Supports multiple subscribers per mission and maintains
     an event history for late joiners.
+
+    Each mission has one bounded ring of events shared by all subscribers:
+    publishing appends once and wakes waiters through a single asyncio.Event,
+    and every subscriber reads the ring at its own cursor. A subscriber that
+    falls more than `queue_size` events behind (paused tab, dead TCP
+    connection) has lost events to the ring and is disconnected instead of
+    stalling publishers. Reconnecting clients can catch up from the history
+    via `replay_window`.
     """
 
-    def __init__(self, history_limit: int = 100):
-        self._subscribers: Dict[str, List[asyncio.Queue]] = defaultdict(list)
-        self._history: Dict[str, List[StreamEvent]] = defaultdict(list)
+    def __init__(self, history_limit: int = 100, queue_size: int = 256):
+        capacity = max(history_limit, queue_size)
+        self._rings: Dict[str, Deque[StreamEvent]] = defaultdict(lambda: deque(maxlen=capacity))
+        self._published: Dict[str, int] = defaultdict(int)  # Events ever published per mission
+        self._notify: Dict[str, asyncio.Event] = {}
         self._history_limit = history_limit
+        self._queue_size = queue_size
 
     async def publish(self, mission_id: str, event: StreamEvent) -> None:
         """
@@ -30,19 +43,18 @@ class EventBus:
             mission_id: The mission ID to publish to
             event: The event to publish
         """
-        # Add to history
-        self._history[mission_id].append(event)
-
-        # Trim history if needed
-        if len(self._history[mission_id]) > self._history_limit:
-            self._history[mission_id] = self._history[mission_id][-self._history_limit:]
-
-        # Notify all subscribers
-        for queue in self._subscribers[mission_id]:
-            try:
-                await queue.put(event)
-            except Exception as e:
-                print(f"Error publishing event: {e}")
+        # One append serves every subscriber (oldest event rotates out at capacity)
+        self._rings[mission_id].append(event)
+        self._published[mission_id] += 1
+
+        # Wake current waiters; later waits use a fresh Event, so no subscriber
+        # ever clears the signal out from under another
+        notify = self._notify.pop(mission_id, None)
+        if notify is not None:
+            # Someone is streaming: encode the SSE frame once here, so every
+            # subscriber just forwards the cached bytes
+            event.sse_frame()
+            notify.set()
 
     async def subscribe(self, mission_id: str) -> AsyncIterator[StreamEvent]:
         """
@@ -57,27 +69,70 @@ class EventBus:
         Yields:
             StreamEvent objects as they are published
         """
-        queue: asyncio.Queue = asyncio.Queue()
-        self._subscribers[mission_id].append(queue)
-
-        try:
-            while True:
-                try:
-                    # Wait for event with timeout for heartbeat
-                    event = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    yield event
-                except asyncio.TimeoutError:
-                    # Send heartbeat
-                    yield StreamEvent(
-                        type=StreamEventType.HEARTBEAT,
-                        data={"timestamp": datetime.utcnow().isoformat()}
-                    )
-        finally:
-            # Clean up subscriber
-            if queue in self._subscribers[mission_id]:
-                self._subscribers[mission_id].remove(queue)
-
-    async def get_history(self, mission_id: str, limit: int = 50) -> List[Dict[str, Any]]:
+        async for batch in self.subscribe_batches(mission_id):
+            for event in batch:
+                yield event
+
+    def cursor(self, mission_id: str) -> int:
+        """Position after the latest event published for a mission (see subscribe_batches)."""
+        return self._published[mission_id]
+
+    async def subscribe_batches(
+        self, mission_id: str, start: Optional[int] = None
+    ) -> AsyncIterator[List[StreamEvent]]:
+        """
+        Subscribe to events for a mission, a burst at a time.
+
+        Each wake-up yields every event published since the last one (or a
+        single heartbeat after 30 idle seconds), so a consumer can write a
+        burst in one go instead of one await per event.
+
+        Starts with the events published after `start` (a `cursor()` taken
+        earlier, e.g. alongside a replay), or from the first iteration when None.
+        """
+        ring = self._rings[mission_id]
+        cursor = self._published[mission_id] if start is None else start
+
+        while True:
+            behind = self._published[mission_id] - cursor
+            if behind:
+                if behind > self._queue_size or behind > len(ring):
+                    # Fell too far behind; end the stream so the client reconnects
+                    return
+                cursor += behind
+                yield list(itertools.islice(ring, len(ring) - behind, None))
+                continue
+
+            notify = self._notify.get(mission_id)
+            if notify is None:
+                notify = self._notify[mission_id] = asyncio.Event()
+            try:
+                # Wait for event with timeout for heartbeat
+                await asyncio.wait_for(notify.wait(), timeout=30.0)
+            except asyncio.TimeoutError:
+                # Send heartbeat (coarse cached clock; heartbeats aren't replayed)
+                yield [StreamEvent(
+                    type=StreamEventType.HEARTBEAT,
+                    data={"timestamp": coarse_clock.now_iso()},
+                    timestamp=coarse_clock.now()
+                )]
+
+    def _recent(self, mission_id: str, limit: Optional[int] = None) -> List[StreamEvent]:
+        """
+        The last `limit` (at most `history_limit`) events, oldest first.
+
+        Reads from the tail of the ring, so the cost is O(limit) rather
+        than a copy of the whole ring.
+        """
+        ring = self._rings.get(mission_id)
+        if not ring:
+            return []
+        count = self._history_limit if limit is None else min(limit, self._history_limit)
+        events = list(itertools.islice(reversed(ring), count))
+        events.reverse()
+        return events
+
+    async def get_history(self, mission_id: str, limit: int = 50) -> List[bytes]:
         """
         Get event history for a mission.
 
@@ -86,22 +141,37 @@ class EventBus:
             limit: Maximum number of events to return
 
         Returns:
-            List of event dictionaries
+            List of JSON-encoded event objects (each encoded once, then cached)
         """
-        events = self._history.get(mission_id, [])[-limit:]
-        return [
-            {
-                "type": e.type.value,
-                "data": e.data,
-                "timestamp": e.timestamp.isoformat()
-            }
-            for e in events
-        ]
+        events = self._recent(mission_id, limit if limit > 0 else None)
+        return [e.record_json() for e in events]
+
+    def replay_window(self, mission_id: str, since: Optional[datetime] = None) -> List[StreamEvent]:
+        """
+        Get the buffered events published after `since` (all of them if None).
+
+        Lets reconnecting clients fetch what they missed, e.g. after being
+        disconnected as a slow subscriber. An aware `since` is converted to
+        naive UTC, the form event timestamps are kept in.
+        """
+        if since is None:
+            return self._recent(mission_id)
+        if since.tzinfo is not None:
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+
+        # Walk back from the newest event only as far as the client missed
+        ring = self._rings.get(mission_id, ())
+        missed = list(itertools.takewhile(
+            lambda e: e.timestamp > since,
+            itertools.islice(reversed(ring), self._history_limit)
+        ))
+        missed.reverse()
+        return missed
 
     def clear_history(self, mission_id: str) -> None:
         """Clear event history for a mission."""
-        if mission_id in self._history:
-            del self._history[mission_id]
+        if mission_id in self._rings:
+            self._rings[mission_id].clear()
 
     # Convenience methods for publishing specific event types
 
@@ -0,0 +1,98 @@
+"""
+CHRONICLE Frames - Length-prefixed record logs shared by the stores
+
+A log is a sequence of frames: a 4-byte big-endian length followed by the
+payload bytes. Appends never rewrite earlier frames. Readers skip a torn
+tail left by a crash; the log's writer truncates it before appending again.
+"""
+import os
+import struct
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+
+FRAME_HEADER = struct.Struct(">I")
+
+
+def append_frame(path: Path, payload: bytes) -> int:
+    """Append one frame and return its offset."""
+    return append_frames(path, [payload])[0]
+
+
+def append_frames(path: Path, payloads: List[bytes]) -> List[int]:
+    """Append frames with a single write and return their offsets."""
+    offsets = []
+    chunks = []
+    with open(path, "ab") as f:
+        offset = f.tell()
+        for payload in payloads:
+            offsets.append(offset)
+            chunks.append(FRAME_HEADER.pack(len(payload)))
+            chunks.append(payload)
+            offset += FRAME_HEADER.size + len(payload)
+        f.write(b"".join(chunks))
+    return offsets
+
+
+def append_batches(batches: Dict[Path, List[bytes]]) -> Dict[Path, Union[List[int], Exception]]:
+    """Append each log's frames (one write per file); per-file errors are returned, not raised."""
+    results = {}
+    for path, payloads in batches.items():
+        try:
+            results[path] = append_frames(path, payloads)
+        except Exception as e:
+            results[path] = e
+    return results
+
+
+def read_frame(path: Path, offset: int) -> bytes:
+    """Read the frame payload starting at offset."""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        (length,) = FRAME_HEADER.unpack(f.read(FRAME_HEADER.size))
+        return f.read(length)
+
+
+def read_frames(path: Path) -> List[Tuple[int, bytes]]:
+    """Read every complete frame; a torn (or still being written) tail is ignored."""
+    data = path.read_bytes()
+    frames = []
+    pos = 0
+    while pos + FRAME_HEADER.size <= len(data):
+        (length,) = FRAME_HEADER.unpack_from(data, pos)
+        end = pos + FRAME_HEADER.size + length
+        if end > len(data):
+            break
+        frames.append((pos, data[pos + FRAME_HEADER.size:end]))
+        pos = end
+    return frames
+
+
+def truncate_torn_tail(path: Path) -> None:
+    """
+    Cut a torn frame left by a crash off the end of a log.
+
+    Only the log's writer may call this, serialized with its appends: a
+    reader's view of the file can be older than an append in progress.
+    """
+    try:
+        f = open(path, "r+b")
+    except FileNotFoundError:
+        return
+    with f:
+        size = f.seek(0, os.SEEK_END)
+        pos = 0
+        while pos + FRAME_HEADER.size <= size:
+            f.seek(pos)
+            (length,) = FRAME_HEADER.unpack(f.read(FRAME_HEADER.size))
+            end = pos + FRAME_HEADER.size + length
+            if end > size:
+                break
+            pos = end
+        if pos != size:
+            f.truncate(pos)
+
+
+def encode_frames(payloads: List[bytes]) -> bytes:
+    """Encode payloads as consecutive frames (for rewriting a whole log)."""
+    return b"".join(FRAME_HEADER.pack(len(payload)) + payload for payload in payloads)
@@ -0,0 +1,344 @@
+"""
+CHRONICLE LLM Cache - Exact and semantic response caching for Gemini calls
+
+Research missions repeat near-identical sub-queries ("best PM tools for remote
+teams" vs "top project management tools for remote teams"), so responses are
+cached under an exact-match key and, optionally, an embedding index that
+returns a stored response when cosine similarity clears the threshold.
+"""
+import asyncio
+import hashlib
+import itertools
+import json
+import math
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Callable, Set, Tuple
+
+from utils.log import get_logger
+
+try:
+    import faiss
+    import numpy as np
+except ImportError:  # Semantic lookups fall back to a linear scan
+    faiss = None
+    np = None
+
+log = get_logger(__name__)
+
+
+# Bound on embeddings held between an aget() miss and its aset()
+_MAX_MISS_VECTORS = 256
+
+# Default bound on embeddings held per semantic index partition
+_MAX_INDEX_ENTRIES = 4096
+
+# Default bound on responses held by the in-memory backend
+_MAX_BACKEND_ENTRIES = 4096
+
+
+class InMemoryCacheBackend:
+    """Process-local key/value storage for cached responses (LRU, at most `max_entries`)."""
+
+    def __init__(self, max_entries: int = _MAX_BACKEND_ENTRIES):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()  # Least recently used first
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at < time.time():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        self._data[key] = (value, time.time() + ttl)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    async def aget(self, key: str) -> Optional[str]:
+        return self.get(key)
+
+    async def aset(self, key: str, value: str, ttl: float) -> None:
+        self.set(key, value, ttl)
+
+
+class RedisCacheBackend:
+    """Redis storage so cached responses are shared across worker processes."""
+
+    def __init__(self, url: str, prefix: str = "chronicle:llm:"):
+        import redis  # Optional dependency, only needed when REDIS_URL is set
+
+        self._redis = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._redis.get(self._prefix + key)
+        return value.decode("utf-8") if value is not None else None
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        self._redis.set(self._prefix + key, value, ex=max(int(ttl), 1))
+
+    async def aget(self, key: str) -> Optional[str]:
+        # redis-py calls block on the network; keep them off the event loop
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: str, ttl: float) -> None:
+        await asyncio.to_thread(self.set, key, value, ttl)
+
+
+class _SemanticIndex:
+    """
+    Prompt embeddings for one partition of the cache.
+
+    Each entry maps to an exact cache key and expires with it, so the index
+    holds no more than the live entries (and at most `max_entries`).
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._next_id = 0
+        self._entries: Dict[int, Tuple[str, float]] = {}  # id -> (cache key, expires_at), oldest first
+        self._ids: Dict[str, int] = {}                     # cache key -> id
+        self._vectors: Dict[int, List[float]] = {}         # linear-scan storage without FAISS
+        self._index = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, vector: List[float], key: str, expires_at: float) -> None:
+        now = time.time()
+        stale = {i for i, (_, expires) in self._entries.items() if expires <= now}
+        if key in self._ids:
+            stale.add(self._ids[key])  # Re-stored: replaced by the new entry
+        # A full partition drops its oldest live entries to make room
+        excess = len(self._entries) - len(stale) + 1 - self.max_entries
+        if excess > 0:
+            stale.update(itertools.islice((i for i in self._entries if i not in stale), excess))
+        if stale:
+            self._remove(stale)
+
+        entry_id = self._next_id
+        self._next_id += 1
+        if faiss is not None:
+            if self._index is None:
+                self._index = faiss.IndexIDMap2(faiss.IndexFlatIP(len(vector)))
+            self._index.add_with_ids(
+                np.asarray([vector], dtype="float32"), np.asarray([entry_id], dtype="int64")
+            )
+        else:
+            self._vectors[entry_id] = vector
+        self._entries[entry_id] = (key, expires_at)
+        self._ids[key] = entry_id
+
+    def search(self, vector: List[float], threshold: float) -> Optional[str]:
+        if not self._entries:
+            return None
+
+        if faiss is not None:
+            scores, ids = self._index.search(np.asarray([vector], dtype="float32"), 1)
+            best_score, best_id = float(scores[0][0]), int(ids[0][0])
+        else:
+            best_score, best_id = -1.0, -1
+            for i, stored in self._vectors.items():
+                score = sum(a * b for a, b in zip(vector, stored))
+                if score > best_score:
+                    best_score, best_id = score, i
+
+        entry = self._entries.get(best_id)
+        if entry is None or best_score < threshold:
+            return None
+        key, expires_at = entry
+        return key if expires_at > time.time() else None
+
+    def _remove(self, ids: Set[int]) -> None:
+        for entry_id in ids:
+            key, _ = self._entries.pop(entry_id)
+            if self._ids.get(key) == entry_id:
+                del self._ids[key]
+            self._vectors.pop(entry_id, None)
+        if self._index is not None:
+            self._index.remove_ids(np.asarray(list(ids), dtype="int64"))
+
+
+class LLMCache:
+    """
+    Two-tier response cache in front of `generate_content`.
+
+    1. Exact match on sha256(model, contents, system_instruction[, use_search, response_schema])
+    2. Semantic match on normalized prompt embeddings (cosine >= threshold),
+       searched only among requests with the same model, system instruction,
+       search grounding and response schema
+    """
+
+    def __init__(
+        self,
+        backend=None,
+        ttl: float = 86400,
+        threshold: float = 0.92,
+        embedder: Optional[Callable[[str], List[float]]] = None,
+        max_index_entries: int = _MAX_INDEX_ENTRIES
+    ):
+        self.backend = backend or InMemoryCacheBackend()
+        self.ttl = ttl
+        self.threshold = threshold
+        self.embedder = embedder
+        self.stats = {"hits": 0, "semantic_hits": 0, "misses": 0}
+
+        # Semantic indexes, one per combination of the non-content key fields
+        self.max_index_entries = max_index_entries
+        self._indexes: Dict[str, _SemanticIndex] = {}
+
+        # Prompt embeddings computed by a missed aget(), reused by the aset()
+        # that follows so a miss costs one embedding call, not two
+        self._miss_vectors: Dict[str, Optional[List[float]]] = {}
+
+    @staticmethod
+    def make_key(
+        model: str, contents: str, system_instruction: Optional[str] = None, use_search: bool = False,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Build the exact-match cache key for a request."""
+        request = {"model": model, "contents": contents, "system_instruction": system_instruction}
+        if use_search:
+            # Grounded and ungrounded answers differ; keys without search are unchanged
+            request["use_search"] = True
+        if response_schema is not None:
+            request["response_schema"] = response_schema
+        payload = json.dumps(request, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(
+        self, model: str, contents: str, system_instruction: Optional[str] = None, use_search: bool = False,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """Return a cached response for the request, or None on a miss."""
+        key = self.make_key(model, contents, system_instruction, use_search, response_schema)
+        value = self.backend.get(key)
+        if value is not None:
+            self.stats["hits"] += 1
+            return value
+
+        index = self._indexes.get(self._partition(model, contents, None, system_instruction, use_search, response_schema))
+        if index:
+            vector = self._embed(contents)
+            similar_key = index.search(vector, self.threshold) if vector else None
+            if similar_key:
+                value = self.backend.get(similar_key)
+                if value is not None:
+                    self.stats["semantic_hits"] += 1
+                    return value
+
+        self.stats["misses"] += 1
+        return None
+
+    def set(
+        self, model: str, contents: str, response: str,
+        system_instruction: Optional[str] = None, use_search: bool = False,
+        ttl: Optional[float] = None, response_schema: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Store a response under its exact key and index its embedding (`ttl` overrides the default)."""
+        key = self.make_key(model, contents, system_instruction, use_search, response_schema)
+        ttl = self.ttl if ttl is None else ttl
+        self.backend.set(key, response, ttl)
+        partition = self._partition(model, contents, None, system_instruction, use_search, response_schema)
+        self._add_vector(partition, self._embed(contents), key, ttl)
+
+    async def aget(
+        self, model: str, contents: str, system_instruction: Optional[str] = None, use_search: bool = False,
+        semantic: bool = True, response_schema: Optional[Dict[str, Any]] = None,
+        semantic_text: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Async get() for use on the event loop.
+
+        Backend reads and prompt embedding (network or model calls) run off
+        the loop; the index itself is only touched from the loop.
+        `semantic=False` looks up the exact key only and embeds nothing.
+
+        For a prompt built from a fixed template, pass the part that varies
+        as `semantic_text`: only it is embedded, and it is matched only
+        against prompts built from the same template. Otherwise the template
+        dominates the embedding and unrelated prompts look alike.
+        """
+        key = self.make_key(model, contents, system_instruction, use_search, response_schema)
+        value = await self.backend.aget(key)
+        if value is not None:
+            self.stats["hits"] += 1
+            return value
+
+        if self.embedder and semantic:
+            vector = await asyncio.to_thread(self._embed, semantic_text or contents)
+            index = self._indexes.get(
+                self._partition(model, contents, semantic_text, system_instruction, use_search, response_schema)
+            )
+            similar_key = index.search(vector, self.threshold) if index and vector else None
+            if similar_key:
+                value = await self.backend.aget(similar_key)
+                if value is not None:
+                    self.stats["semantic_hits"] += 1
+                    return value
+            if len(self._miss_vectors) >= _MAX_MISS_VECTORS:
+                self._miss_vectors.clear()  # Misses that were never stored
+            self._miss_vectors[key] = vector
+
+        self.stats["misses"] += 1
+        return None
+
+    async def aset(
+        self, model: str, contents: str, response: str,
+        system_instruction: Optional[str] = None, use_search: bool = False,
+        ttl: Optional[float] = None, semantic: bool = True, response_schema: Optional[Dict[str, Any]] = None,
+        semantic_text: Optional[str] = None
+    ) -> None:
+        """Async set(): reuses the embedding from the preceding aget() miss (none when not `semantic`)."""
+        key = self.make_key(model, contents, system_instruction, use_search, response_schema)
+        ttl = self.ttl if ttl is None else ttl
+        await self.backend.aset(key, response, ttl)
+        if not self.embedder or not semantic:
+            return
+        if key in self._miss_vectors:
+            vector = self._miss_vectors.pop(key)
+        else:
+            vector = await asyncio.to_thread(self._embed, semantic_text or contents)
+        partition = self._partition(model, contents, semantic_text, system_instruction, use_search, response_schema)
+        self._add_vector(partition, vector, key, ttl)
+
+    # ===========================================
+    # SEMANTIC INDEX
+    # ===========================================
+
+    def _partition(
+        self, model: str, contents: str, semantic_text: Optional[str], system_instruction: Optional[str],
+        use_search: bool, response_schema: Optional[Dict[str, Any]]
+    ) -> str:
+        """Name the index a request searches: every key field except the embedded text."""
+        template = contents.replace(semantic_text, "") if semantic_text else ""
+        return self.make_key(model, template, system_instruction, use_search, response_schema)
+
+    def _embed(self, text: str) -> Optional[List[float]]:
+        """Embed and L2-normalize text so inner product equals cosine similarity."""
+        if not self.embedder:
+            return None
+        try:
+            vector = list(self.embedder(text))
+        except Exception as e:
+            log.warning("Embedding error: %s", e)
+            return None
+        norm = math.sqrt(sum(v * v for v in vector))
+        if not norm:
+            return None
+        return [v / norm for v in vector]
+
+    def _add_vector(self, partition: str, vector: Optional[List[float]], key: str, ttl: float) -> None:
+        if vector is None:
+            return
+        index = self._indexes.get(partition)
+        if index is None:
+            index = self._indexes[partition] = _SemanticIndex(self.max_index_entries)
+        index.add(vector, key, time.time() + ttl)
@@ -1,91 +1,258 @@
 """
 CHRONICLE Mission Store - Persistence for missions
-Uses local JSON files for simplicity (can upgrade to Firestore later)
+Uses local MessagePack files for simplicity (can upgrade to Firestore later)
+
+Each mission is split in two files: `{id}.msgpack` holds everything but the
+findings (plus a findings_count), and `{id}.findings` is an append-only log
+with one framed finding per entry. Saves append only the new findings, and
+listings read just the small header file.
 """
-import json
-import aiofiles
+import asyncio
+import os
 from pathlib import Path
-from typing import Optional, List
-from datetime import datetime
+from typing import Any, Optional, List, Dict, Set, Tuple
+
+from models._serde import loads, pack, unpack
+from models.domain import Mission, MissionMeta, MissionState
+from utils.log import get_logger
+from .frames import append_frames, encode_frames, read_frames, truncate_torn_tail
+from .write_behind import WriteBehindQueue
 
-from models.domain import Mission, MissionState
+log = get_logger(__name__)
 
 
 class MissionStore:
-    """Store and retrieve missions using local JSON files."""
+    """Store and retrieve missions using local MessagePack files."""
 
     def __init__(self, data_dir: str = "./data/missions"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self._cache: dict[str, Mission] = {}
+        self._writes = WriteBehindQueue(self._write)
+
+        # Per-mission locks: serialize cold loads and route read-modify-writes
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+        # mission_id -> (findings list, count) already in the findings log
+        self._findings_written: Dict[str, Tuple[List[Dict[str, Any]], int]] = {}
+
+        # Missions whose findings log ends on a frame boundary (safe to append)
+        self._clean_logs: Set[str] = set()
 
     def _get_path(self, mission_id: str) -> Path:
         """Get file path for a mission."""
+        return self.data_dir / f"{mission_id}.msgpack"
+
+    def _get_findings_path(self, mission_id: str) -> Path:
+        """Get the append-only findings log path for a mission."""
+        return self.data_dir / f"{mission_id}.findings"
+
+    def _get_legacy_path(self, mission_id: str) -> Path:
+        """Get the pre-MessagePack JSON path for a mission."""
         return self.data_dir / f"{mission_id}.json"
 
+    def mission_lock(self, mission_id: str) -> asyncio.Lock:
+        """
+        Lock for one mission, used as `async with mission_store.mission_lock(mid):`.
+
+        Not re-entrant: fetch the mission with get() before acquiring it.
+        """
+        lock = self._locks.get(mission_id)
+        if lock is None:
+            lock = self._locks[mission_id] = asyncio.Lock()
+        return lock
+
+    def get_cached(self, mission_id: str) -> Optional[Mission]:
+        """Get a mission only if it is already in memory (never touches disk)."""
+        return self._cache.get(mission_id)
+
     async def save(self, mission: Mission) -> None:
-        """Save a mission to storage."""
-        mission.updated_at = datetime.utcnow()
+        """
+        Save a mission to storage.
+
+        The cache is updated immediately; the file write happens in the
+        background, coalescing repeated saves of the same mission.
+        """
+        mission.touch()  # Integer stamp; no datetime built per save
         self._cache[mission.id] = mission
+        self._writes.schedule(mission.id, mission)
+
+    async def flush(self) -> None:
+        """Write any pending mission saves to disk."""
+        await self._writes.flush()
+
+    async def _write(self, mission: Mission) -> None:
+        # Only findings added since the last write are appended; the log is
+        # rewritten if `findings` was replaced (retry, resume) or never written
+        findings = mission.findings
+        count = len(findings)
+        written = self._findings_written.get(mission.id)
+        if written is not None and written[0] is findings and written[1] <= count:
+            rewrite, payloads = False, [pack(f) for f in findings[written[1]:count]]
+        else:
+            rewrite, payloads = True, [pack(f) for f in findings[:count]]
 
-        path = self._get_path(mission.id)
-        # Pydantic v2 with mode="json" handles datetime serialization automatically
-        data = mission.model_dump(mode="json")
+        header = {k: v for k, v in mission.to_storage_dict().items() if k != "findings"}
+        header["findings_count"] = count
 
-        async with aiofiles.open(path, "w") as f:
-            await f.write(json.dumps(data, indent=2, default=str))
+        # One thread-pool hop for both files
+        await asyncio.to_thread(self._write_files, mission.id, pack(header), payloads, rewrite)
+        self._findings_written[mission.id] = (findings, count)
+
+    def _write_files(self, mission_id: str, header: bytes, payloads: List[bytes], rewrite: bool) -> None:
+        # Findings first, so a crash in between never leaves the header ahead of the log
+        findings_path = self._get_findings_path(mission_id)
+        clean = mission_id in self._clean_logs
+        self._clean_logs.discard(mission_id)  # Until this write succeeds
+        if rewrite:
+            findings_path.write_bytes(encode_frames(payloads))
+        elif payloads:
+            # Writes are serialized by the write-behind queue, so a torn tail
+            # (crash, failed append) can be cut off without racing an append
+            if not clean:
+                truncate_torn_tail(findings_path)
+            append_frames(findings_path, payloads)
+        self._clean_logs.add(mission_id)
+        self._get_path(mission_id).write_bytes(header)
+
+    def _read_record(self, mission_id: str) -> Dict[str, Any]:
+        """Read a mission header and its findings log into one record."""
+        record = unpack(self._get_path(mission_id).read_bytes())
+        record.pop("findings_count", None)
+        findings_path = self._get_findings_path(mission_id)
+        if findings_path.exists():
+            record["findings"] = [unpack(payload) for _, payload in read_frames(findings_path)]
+        else:
+            # Single-file record from before the split (findings inline, or
+            # none yet); the first write produces the findings log
+            record["_inline_findings"] = True
+        return record
 
     async def get(self, mission_id: str) -> Optional[Mission]:
         """Get a mission by ID."""
         # Check cache first
-        if mission_id in self._cache:
-            return self._cache[mission_id]
+        mission = self.get_cached(mission_id)
+        if mission is not None:
+            return mission
+
+        # Concurrent cold reads of one mission share a single load, so every
+        # caller ends up holding the same cached object
+        async with self.mission_lock(mission_id):
+            mission = self.get_cached(mission_id)
+            if mission is not None:
+                return mission
+            mission = await self._load(mission_id)
 
+        if mission is None:
+            self._locks.pop(mission_id, None)  # Don't keep locks for unknown ids
+        return mission
+
+    async def _load(self, mission_id: str) -> Optional[Mission]:
+        """Read a mission from disk into the cache."""
         path = self._get_path(mission_id)
-        if not path.exists():
+        legacy_path = self._get_legacy_path(mission_id)
+        if not path.exists() and not legacy_path.exists():
             return None
 
         try:
-            async with aiofiles.open(path, "r") as f:
-                content = await f.read()
-                data = json.loads(content)
+            if path.exists():
+                record = await asyncio.to_thread(self._read_record, mission_id)
+                inline_findings = record.pop("_inline_findings", False)
+                mission = Mission(**record)
+                if not inline_findings:
+                    # The log already holds these findings; next write appends only
+                    self._findings_written[mission_id] = (mission.findings, len(mission.findings))
+            else:
+                # One-shot migration of a JSON mission file to MessagePack
+                mission = Mission(**loads(await asyncio.to_thread(legacy_path.read_bytes)))
+                await self._write(mission)
+                legacy_path.unlink()
 
-                # Convert state string back to enum
-                if "state" in data and isinstance(data["state"], str):
-                    data["state"] = MissionState(data["state"])
-
-                mission = Mission(**data)
-                self._cache[mission_id] = mission
-                return mission
+            self._cache[mission_id] = mission
+            return mission
         except Exception as e:
-            print(f"Error loading mission {mission_id}: {e}")
+            log.error("Error loading mission %s: %s", mission_id, e)
             return None
 
     async def delete(self, mission_id: str) -> bool:
         """Delete a mission."""
-        if mission_id in self._cache:
-            del self._cache[mission_id]
+        # Under the flush lock: a write already running finishes first,
+        # instead of recreating the files after they are unlinked
+        async with self._writes.exclusive():
+            if mission_id in self._cache:
+                del self._cache[mission_id]
+            self._locks.pop(mission_id, None)
+            self._findings_written.pop(mission_id, None)
+            self._clean_logs.discard(mission_id)
+            self._writes.discard(mission_id)
+
+            deleted = False
+            for path in (self._get_path(mission_id), self._get_legacy_path(mission_id)):
+                if path.exists():
+                    path.unlink()
+                    deleted = True
+            self._get_findings_path(mission_id).unlink(missing_ok=True)
+        return deleted
+
+    async def get_metadata(self, mission_id: str) -> Optional[MissionMeta]:
+        """
+        Get a mission's header without loading its findings.
+
+        Served from the cache when the mission is loaded; otherwise only the
+        small header file is read (and nothing is cached).
+        """
+        mission = self.get_cached(mission_id)
+        if mission is not None:
+            return MissionMeta.from_mission(mission)
 
         path = self._get_path(mission_id)
-        if path.exists():
-            path.unlink()
-            return True
-        return False
+        if not path.exists():
+            # Legacy JSON files are migrated by a full load
+            mission = await self.get(mission_id)
+            return MissionMeta.from_mission(mission) if mission else None
+
+        try:
+            record = unpack(await asyncio.to_thread(path.read_bytes))
+            if "findings_count" not in record:
+                record["findings_count"] = len(record.get("findings", ()))
+            return MissionMeta.model_validate(record)
+        except Exception as e:
+            log.error("Error loading mission %s: %s", mission_id, e)
+            return None
 
     async def list_all(self, limit: int = 10, offset: int = 0) -> List[Mission]:
         """List all missions."""
-        missions = []
+        await self.flush()
 
-        # Get all JSON files
-        files = sorted(self.data_dir.glob("*.json"), key=lambda x: x.stat().st_mtime, reverse=True)
+        # Newest first; only the requested page is loaded
+        mission_ids = await asyncio.to_thread(self._scan_ids)
+        page = mission_ids[offset:offset + limit]
 
-        for path in files[offset:offset + limit]:
-            mission_id = path.stem
-            mission = await self.get(mission_id)
-            if mission:
-                missions.append(mission)
+        # Load the page concurrently; file I/O runs on the thread pool
+        missions = await asyncio.gather(*(self.get(mission_id) for mission_id in page))
+        return [mission for mission in missions if mission]
+
+    async def list_metadata(self, limit: int = 10, offset: int = 0) -> List[MissionMeta]:
+        """List mission headers, newest first, without loading findings."""
+        await self.flush()
+        mission_ids = await asyncio.to_thread(self._scan_ids)
+        page = mission_ids[offset:offset + limit]
+
+        metas = await asyncio.gather(*(self.get_metadata(mission_id) for mission_id in page))
+        return [meta for meta in metas if meta]
 
-        return missions
+    def _scan_ids(self) -> List[str]:
+        """Mission ids on disk, newest first (legacy JSON ones are migrated as they load)."""
+        # Mission ids carry no time order, so each header file is stat'ed once
+        # (a syscall per entry on Linux; Windows fills it from the directory read).
+        # Other files (findings logs) are skipped by name without a stat.
+        mtimes: Dict[str, float] = {}
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                if ext in (".msgpack", ".json"):
+                    mtimes[stem] = max(mtimes.get(stem, 0.0), entry.stat().st_mtime)
+        return sorted(mtimes, key=mtimes.get, reverse=True)
 
     async def update_state(self, mission_id: str, state: MissionState, activity: str = None) -> Optional[Mission]:
         """Update mission state."""
@@ -0,0 +1,100 @@
+"""
+CHRONICLE Write-Behind Queue - Coalesced background writes for the stores
+"""
+import asyncio
+import contextlib
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, Iterable, Optional
+
+from utils.log import get_logger
+
+log = get_logger(__name__)
+
+
+class WriteBehindQueue:
+    """
+    Coalesce repeated saves of the same document into one background write.
+
+    `schedule()` records the latest object for a key and returns immediately;
+    a flusher task writes each dirty key once, however many times it was
+    saved in between (latest wins). `flush()` waits until everything
+    scheduled so far is on disk.
+
+    Pass `batch_writer` instead of `writer` to receive each flush's whole
+    batch ({key: obj}) in one call; it returns the keys that failed, which
+    are retried on the next flush.
+    """
+
+    def __init__(
+        self,
+        writer: Optional[Callable[[Any], Awaitable[None]]] = None,
+        *,
+        batch_writer: Optional[Callable[[Dict[Hashable, Any]], Awaitable[Iterable[Hashable]]]] = None
+    ):
+        self._writer = writer
+        self._batch_writer = batch_writer
+        self._pending: Dict[Hashable, Any] = {}
+        self._event: Optional[asyncio.Event] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def schedule(self, key: Hashable, obj: Any) -> None:
+        """Mark a document dirty; it will be written by the flusher."""
+        self._pending[key] = obj
+        self._ensure_flusher()
+        self._event.set()
+
+    def discard(self, key: Hashable) -> None:
+        """Drop a pending write (e.g. the document was deleted)."""
+        self._pending.pop(key, None)
+
+    @contextlib.asynccontextmanager
+    async def exclusive(self) -> AsyncIterator[None]:
+        """
+        Hold off writes for the duration of the block.
+
+        For rewriting a file the writer appends to: saves scheduled meanwhile
+        stay pending and are written after the block exits.
+        """
+        self._ensure_flusher()
+        async with self._lock:
+            yield
+
+    def _ensure_flusher(self) -> None:
+        # (Re)start the flusher on the running loop
+        if self._task is None or self._task.done():
+            self._event = asyncio.Event()
+            self._lock = asyncio.Lock()
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await self._event.wait()
+            self._event.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write all pending documents now."""
+        if self._task is None:
+            return
+        self._ensure_flusher()
+
+        async with self._lock:
+            batch, self._pending = self._pending, {}
+            if self._batch_writer is not None:
+                if batch:
+                    try:
+                        failed = await self._batch_writer(batch)
+                    except Exception as e:
+                        log.error("Error writing batch: %s", e)
+                        failed = batch.keys()
+                    for key in failed:
+                        self._pending.setdefault(key, batch[key])
+                return
+
+            for key, obj in batch.items():
+                try:
+                    await self._writer(obj)
+                except Exception as e:
+                    log.error("Error writing %s: %s", key, e)
+                    # Retry on the next flush unless a newer version was saved
+                    self._pending.setdefault(key, obj)
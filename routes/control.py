@@ -1,47 +1,47 @@
 """
 CHRONICLE Control Routes - Pause, resume, and control missions
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from datetime import datetime
 
 from models import Mission, MissionState, Checkpoint
 from persistence import mission_store, checkpoint_store
+from .dependencies import require_mission
 
 router = APIRouter()
 
 
 @router.post("/control/{mission_id}/pause")
-async def pause_mission(mission_id: str):
+async def pause_mission(mission_id: str, mission: Mission = Depends(require_mission)):
     """
     Pause a running mission.
 
     Creates a checkpoint with the current state and thought signature
     for seamless resume later.
     """
-    mission = await mission_store.get(mission_id)
-    if not mission:
-        raise HTTPException(status_code=404, detail=f"Mission {mission_id} not found")
-
-    if mission.state in [MissionState.COMPLETED, MissionState.FAILED]:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Cannot pause mission in state: {mission.state.value}"
-        )
-
-    if mission.state == MissionState.PAUSED:
-        return {
-            "mission_id": mission_id,
-            "status": "already_paused",
-            "message": "Mission is already paused"
-        }
-
-    # Create checkpoint
-    checkpoint = mission.to_checkpoint()
-    await checkpoint_store.save(checkpoint)
-
-    # Update mission state
-    mission.update_state(MissionState.PAUSED, "Mission paused by user")
-    await mission_store.save(mission)
+    # Read-modify-write under the mission lock so concurrent control calls don't interleave
+    async with mission_store.mission_lock(mission_id):
+        if mission.state in [MissionState.COMPLETED, MissionState.FAILED]:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Cannot pause mission in state: {mission.state.value}"
+            )
+
+        if mission.state == MissionState.PAUSED:
+            return {
+                "mission_id": mission_id,
+                "status": "already_paused",
+                "message": "Mission is already paused"
+            }
+
+        # Create checkpoint (encoded now, appended to disk in the background;
+        # the shutdown flush covers anything still pending)
+        checkpoint = mission.to_checkpoint()
+        await checkpoint_store.save(checkpoint)
+
+        # Update mission state
+        mission.update_state(MissionState.PAUSED, "Mission paused by user")
+        await mission_store.save(mission)
 
     return {
         "mission_id": mission_id,
@@ -54,7 +54,7 @@ async def pause_mission(mission_id: str):
 
 
 @router.post("/control/{mission_id}/resume")
-async def resume_mission(mission_id: str):
+async def resume_mission(mission_id: str, mission: Mission = Depends(require_mission)):
     """
     Resume a paused mission.
 
@@ -63,27 +63,25 @@ async def resume_mission(mission_id: str):
     """
     from services.mission_manager import MissionManager
 
-    mission = await mission_store.get(mission_id)
-    if not mission:
-        raise HTTPException(status_code=404, detail=f"Mission {mission_id} not found")
-
-    if mission.state != MissionState.PAUSED:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Cannot resume mission in state: {mission.state.value}. Mission must be paused."
-        )
-
-    # Load checkpoint
-    checkpoint = await checkpoint_store.get_latest(mission_id)
-    if not checkpoint:
-        raise HTTPException(
-            status_code=404,
-            detail=f"No checkpoint found for mission {mission_id}"
-        )
-
-    # Resume mission
-    mission.update_state(MissionState.RESEARCHING, "Resuming mission from checkpoint...")
-    await mission_store.save(mission)
+    async with mission_store.mission_lock(mission_id):
+        if mission.state != MissionState.PAUSED:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Cannot resume mission in state: {mission.state.value}. Mission must be paused."
+            )
+
+        # Load checkpoint
+        checkpoint = await checkpoint_store.get_latest(mission_id)
+        if not checkpoint:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No checkpoint found for mission {mission_id}"
+            )
+
+        # Resume mission
+        mission.update_state(MissionState.RESEARCHING, "Resuming mission from checkpoint...")
+        await mission_store.save(mission)
+        await mission_store.flush()
 
     # Start mission manager to continue
     mission_manager = MissionManager()
@@ -101,29 +99,26 @@ async def resume_mission(mission_id: str):
 
 
 @router.post("/control/{mission_id}/retry")
-async def retry_mission(mission_id: str):
+async def retry_mission(mission_id: str, mission: Mission = Depends(require_mission)):
     """Retry a failed mission from the beginning."""
-    mission = await mission_store.get(mission_id)
-    if not mission:
-        raise HTTPException(status_code=404, detail=f"Mission {mission_id} not found")
-
-    if mission.state != MissionState.FAILED:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Cannot retry mission in state: {mission.state.value}. Mission must be failed."
-        )
-
-    # Reset mission state
-    mission.state = MissionState.CREATED
-    mission.current_activity = "Retrying mission..."
-    mission.findings = []
-    mission.actions_completed = []
-    mission.completed_steps = 0
-    mission.corrections_made = 0
-    mission.thought_signature = None
-    mission.updated_at = datetime.utcnow()
-
-    await mission_store.save(mission)
+    async with mission_store.mission_lock(mission_id):
+        if mission.state != MissionState.FAILED:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Cannot retry mission in state: {mission.state.value}. Mission must be failed."
+            )
+
+        # Reset mission state
+        mission.state = MissionState.CREATED
+        mission.current_activity = "Retrying mission..."
+        mission.findings = []
+        mission.actions_completed = []
+        mission.completed_steps = 0
+        mission.corrections_made = 0
+        mission.thought_signature = None
+        mission.updated_at = datetime.utcnow()
+
+        await mission_store.save(mission)
 
     # Start mission
     from services.mission_manager import MissionManager
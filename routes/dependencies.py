@@ -0,0 +1,15 @@
+"""
+CHRONICLE Route Dependencies - Shared lookups for route handlers
+"""
+from fastapi import HTTPException
+
+from models import Mission
+from persistence import mission_store
+
+
+async def require_mission(mission_id: str) -> Mission:
+    """Resolve the `mission_id` path parameter to its Mission, or 404."""
+    mission = await mission_store.get(mission_id)
+    if not mission:
+        raise HTTPException(status_code=404, detail=f"Mission {mission_id} not found")
+    return mission
@@ -1,28 +1,25 @@
 """
 CHRONICLE Export Routes - Export mission findings
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from datetime import datetime
+import asyncio
 
 from models import ExportRequest, Mission
-from persistence import mission_store
 from tools.file_export import FileExporter
+from .dependencies import require_mission
 
 router = APIRouter()
 file_exporter = FileExporter()
 
 
 @router.post("/export/{mission_id}")
-async def export_findings(mission_id: str, request: ExportRequest = None):
+async def export_findings(mission_id: str, request: ExportRequest = None, mission: Mission = Depends(require_mission)):
     """
     Export mission findings to specified formats.
 
     Supports: json, csv, pdf, markdown
     """
-    mission = await mission_store.get(mission_id)
-    if not mission:
-        raise HTTPException(status_code=404, detail=f"Mission {mission_id} not found")
-
     if not mission.findings:
         raise HTTPException(
             status_code=400,
@@ -33,22 +30,21 @@ async def export_findings(mission_id: str, request: ExportRequest = None):
     if request is None:
         request = ExportRequest()
 
-    exports = []
-    for format in request.formats:
-        try:
-            result = await file_exporter.export(
-                mission=mission,
-                format=format,
-                include_metadata=request.include_metadata,
-                filename_prefix=request.filename_prefix
-            )
-            exports.append(result)
-        except Exception as e:
-            exports.append({
-                "format": format,
-                "status": "failed",
-                "error": str(e)
-            })
+    # Formats are independent: write them concurrently
+    results = await asyncio.gather(*(
+        file_exporter.export(
+            mission=mission,
+            format=format,
+            include_metadata=request.include_metadata,
+            filename_prefix=request.filename_prefix
+        )
+        for format in request.formats
+    ), return_exceptions=True)
+    exports = [
+        {"format": format, "status": "failed", "error": str(result)}
+        if isinstance(result, Exception) else result
+        for format, result in zip(request.formats, results)
+    ]
 
     return {
         "mission_id": mission_id,
@@ -59,17 +55,10 @@ async def export_findings(mission_id: str, request: ExportRequest = None):
 
 
 @router.get("/export/{mission_id}/files")
-async def list_exports(mission_id: str):
+async def list_exports(mission_id: str, mission: Mission = Depends(require_mission)):
     """List all exported files for a mission."""
-    mission = await mission_store.get(mission_id)
-    if not mission:
-        raise HTTPException(status_code=404, detail=f"Mission {mission_id} not found")
-
-    # Get exports from actions
-    exports = [
-        action for action in mission.actions_completed
-        if action.get("action_type") == "export"
-    ]
+    # Export actions are tracked by Mission.add_action
+    exports = mission.exports
 
     return {
         "mission_id": mission_id,
@@ -79,18 +68,14 @@ async def list_exports(mission_id: str):
 
 
 @router.get("/export/{mission_id}/download/{filename}")
-async def download_export(mission_id: str, filename: str):
+async def download_export(mission_id: str, filename: str, mission: Mission = Depends(require_mission)):
     """Download a specific export file."""
     from fastapi.responses import FileResponse
     from pathlib import Path
     from config import settings
 
-    mission = await mission_store.get(mission_id)
-    if not mission:
-        raise HTTPException(status_code=404, detail=f"Mission {mission_id} not found")
-
     file_path = settings.export_dir / mission_id / filename
-    if not file_path.exists():
+    if not await asyncio.to_thread(file_path.exists):  # Keep the stat off the event loop
         raise HTTPException(status_code=404, detail=f"File {filename} not found")
 
     return FileResponse(
@@ -1,7 +1,7 @@
 """
 CHRONICLE Research Routes - Start and manage research missions
 """
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, BackgroundTasks, Request, Response
 from datetime import datetime
 import asyncio
 
@@ -9,6 +9,8 @@ from models import ResearchRequest, MissionResponse, Mission, MissionState
 from models.responses import MissionStatusEnum
 from persistence import mission_store
 from services.mission_manager import MissionManager
+from utils import ORJSONResponse, not_modified
+from .dependencies import require_mission
 
 router = APIRouter()
 
@@ -16,7 +18,9 @@ router = APIRouter()
 mission_manager = MissionManager()
 
 
-@router.post("/research", response_model=MissionResponse)
+# Response built by hand: no response_model re-validation of an object we just made.
+# The schema is still advertised through `responses`.
+@router.post("/research", responses={200: {"model": MissionResponse}})
 async def start_research(request: ResearchRequest, background_tasks: BackgroundTasks):
     """
     Start a new research mission.
@@ -38,41 +42,38 @@ async def start_research(request: ResearchRequest, background_tasks: BackgroundT
     # Start mission in background (pass user's API key if provided)
     background_tasks.add_task(mission_manager.run_mission, mission.id, request.api_key)
 
-    return MissionResponse(
-        mission_id=mission.id,
-        status=MissionStatusEnum.PLANNING,
-        message="Mission started successfully. Research will begin shortly.",
-        stream_url=f"/api/status/{mission.id}/stream",
-        started_at=mission.created_at
-    )
+    return ORJSONResponse({
+        "mission_id": mission.id,
+        "status": MissionStatusEnum.PLANNING.value,
+        "message": "Mission started successfully. Research will begin shortly.",
+        "stream_url": f"/api/status/{mission.id}/stream",
+        "started_at": mission.created_at
+    })
 
 
 @router.get("/research/{mission_id}")
-async def get_mission(mission_id: str):
+async def get_mission(mission_id: str, request: Request, response: Response, mission: Mission = Depends(require_mission)):
     """Get details of a specific mission."""
-    mission = await mission_store.get(mission_id)
-    if not mission:
-        raise HTTPException(status_code=404, detail=f"Mission {mission_id} not found")
+    # Unchanged missions (cache hit, same updated_at) answer 304 with no body
+    not_modified_response = not_modified(request, response, mission)
+    if not_modified_response:
+        return not_modified_response
 
-    return {
+    return ORJSONResponse({
         "mission_id": mission.id,
         "goal": mission.goal,
         "state": mission.state.value,
         "current_activity": mission.current_activity,
-        "findings_count": len(mission.findings),
+        "findings_count": mission.findings_count,
         "actions_count": len(mission.actions_completed),
         "created_at": mission.created_at,
         "updated_at": mission.updated_at
-    }
+    }, headers=dict(response.headers))
 
 
 @router.delete("/research/{mission_id}")
-async def cancel_mission(mission_id: str):
+async def cancel_mission(mission_id: str, mission: Mission = Depends(require_mission)):
     """Cancel a running mission."""
-    mission = await mission_store.get(mission_id)
-    if not mission:
-        raise HTTPException(status_code=404, detail=f"Mission {mission_id} not found")
-
     mission.update_state(MissionState.FAILED, "Mission cancelled by user")
     await mission_store.save(mission)
 
@@ -82,19 +83,23 @@ async def cancel_mission(mission_id: str):
 @router.get("/research")
 async def list_missions(limit: int = 10, offset: int = 0):
     """List all missions."""
-    missions = await mission_store.list_all(limit=limit, offset=offset)
-    return {
-        "missions": [
-            {
-                "mission_id": m.id,
-                "goal": m.goal[:100] + "..." if len(m.goal) > 100 else m.goal,
-                "state": m.state.value,
-                "findings_count": len(m.findings),
-                "created_at": m.created_at
-            }
-            for m in missions
-        ],
-        "total": len(missions),
+    # Headers only: listing never deserializes findings
+    missions = await mission_store.list_metadata(limit=limit, offset=offset)
+    payload = [
+        {
+            "mission_id": m.id,
+            "goal": m.goal[:100] + "..." if len(m.goal) > 100 else m.goal,
+            "state": m.state.value,
+            "findings_count": m.findings_count,
+            "created_at": m.created_at
+        }
+        for m in missions
+    ]
+
+    # Returned directly so datetimes are encoded by orjson, not jsonable_encoder
+    return ORJSONResponse({
+        "missions": payload,
+        "total": len(payload),
         "limit": limit,
         "offset": offset
-    }
+    })
@@ -1,72 +1,110 @@
 """
 CHRONICLE Status Routes - Real-time status and SSE streaming
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, Request, Response
 from fastapi.responses import StreamingResponse
 from sse_starlette.sse import EventSourceResponse
 import asyncio
-import json
+import time
+import orjson
+from collections import OrderedDict
 from datetime import datetime
+from typing import Optional, Tuple
 
-from models import MissionStatus, StreamEvent
-from models.responses import MissionStatusEnum, MissionProgress, StreamEventType
-from persistence import mission_store, event_bus
+from config import settings
+from models import Mission, MissionStatus, StreamEvent
+from models._serde import dumps_compact
+from models.responses import MissionStatusEnum, StreamEventType
+from persistence import event_bus
+from utils import ORJSONResponse, not_modified
+from .dependencies import require_mission
 
 router = APIRouter()
 
-
-@router.get("/status/{mission_id}")
-async def get_status(mission_id: str) -> MissionStatus:
+# Map internal state to API status (MissionState is a str enum, so it looks up directly)
+_STATUS_MAP = {
+    "created": MissionStatusEnum.PENDING,
+    "planning": MissionStatusEnum.PLANNING,
+    "researching": MissionStatusEnum.RESEARCHING,
+    "analyzing": MissionStatusEnum.ANALYZING,
+    "scoring": MissionStatusEnum.SCORING,
+    "correcting": MissionStatusEnum.CORRECTING,
+    "exporting": MissionStatusEnum.EXPORTING,
+    "paused": MissionStatusEnum.PAUSED,
+    "completed": MissionStatusEnum.COMPLETED,
+    "failed": MissionStatusEnum.FAILED
+}
+
+# Events that end a stream (built once; checked per streamed event)
+_TERMINAL_EVENTS = frozenset({StreamEventType.COMPLETE, StreamEventType.ERROR})
+
+# Serialized status per mission: mission_id -> (monotonic time built, updated_at, JSON body).
+# Reused while the mission's updated_at is unchanged, for at most the TTL (which
+# also bounds staleness from fields assigned without a save). Least recently
+# polled missions are evicted past the size bound.
+_STATUS_CACHE_TTL = 0.5
+_STATUS_CACHE_SIZE = 256
+_status_cache: "OrderedDict[str, Tuple[float, datetime, bytes]]" = OrderedDict()
+
+
+# Polled constantly: skip response_model re-validation (schema kept via `responses`)
+@router.get("/status/{mission_id}", response_model=None, responses={200: {"model": MissionStatus}})
+async def get_status(mission_id: str, request: Request, response: Response, mission: Mission = Depends(require_mission)):
     """Get current status of a mission."""
-    mission = await mission_store.get(mission_id)
-    if not mission:
-        raise HTTPException(status_code=404, detail=f"Mission {mission_id} not found")
-
-    # Calculate progress
-    target_count = mission.criteria.get("max_results", 10)
-    findings_count = len(mission.findings)
-    quality_scores = [f.get("quality_score", 0) for f in mission.findings if f.get("quality_score")]
-    quality_avg = sum(quality_scores) / len(quality_scores) if quality_scores else 0.0
-
-    progress = MissionProgress(
-        total_steps=mission.total_steps,
-        completed_steps=mission.completed_steps,
-        current_phase=mission.state.value,
-        findings_count=findings_count,
-        target_count=target_count,
-        quality_average=quality_avg,
-        corrections_made=mission.corrections_made
-    )
-
-    # Map internal state to API status
-    status_map = {
-        "created": MissionStatusEnum.PENDING,
-        "planning": MissionStatusEnum.PLANNING,
-        "researching": MissionStatusEnum.RESEARCHING,
-        "analyzing": MissionStatusEnum.ANALYZING,
-        "scoring": MissionStatusEnum.SCORING,
-        "correcting": MissionStatusEnum.CORRECTING,
-        "exporting": MissionStatusEnum.EXPORTING,
-        "paused": MissionStatusEnum.PAUSED,
-        "completed": MissionStatusEnum.COMPLETED,
-        "failed": MissionStatusEnum.FAILED
-    }
-
-    return MissionStatus(
-        mission_id=mission.id,
-        status=status_map.get(mission.state.value, MissionStatusEnum.PENDING),
-        progress=progress,
-        current_activity=mission.current_activity,
-        started_at=mission.created_at,
-        updated_at=mission.updated_at
-    )
+    not_modified_response = not_modified(request, response, mission)
+    if not_modified_response:
+        return not_modified_response
+
+    updated_at = mission.updated_at
+    cached = _status_cache.get(mission_id)
+    if cached and cached[1] == updated_at and time.monotonic() - cached[0] < _STATUS_CACHE_TTL:
+        _status_cache.move_to_end(mission_id)
+        return Response(cached[2], media_type="application/json", headers=dict(response.headers))
+
+    # Built as a plain dict with MissionStatus's shape: no model validation pass
+    body = dumps_compact({
+        "mission_id": mission.id,
+        "status": _STATUS_MAP.get(mission.state, MissionStatusEnum.PENDING).value,
+        "progress": {
+            "total_steps": mission.total_steps,
+            "completed_steps": mission.completed_steps,
+            "current_phase": mission.state.value,
+            "findings_count": mission.findings_count,
+            "target_count": mission.criteria.get("max_results", 10),
+            "quality_average": mission.scored_quality_average(),  # Running total; no pass over findings
+            "corrections_made": mission.corrections_made
+        },
+        "current_activity": mission.current_activity,
+        "started_at": mission.created_at,
+        "updated_at": updated_at,
+        "estimated_completion": None
+    })
+    _status_cache[mission_id] = (time.monotonic(), updated_at, body)
+    _status_cache.move_to_end(mission_id)
+    if len(_status_cache) > _STATUS_CACHE_SIZE:
+        _status_cache.popitem(last=False)
+    return Response(body, media_type="application/json", headers=dict(response.headers))
+
+
+def _parse_event_id(event_id: Optional[str]) -> Optional[datetime]:
+    """The timestamp an SSE event id encodes, or None if it isn't one."""
+    if not event_id:
+        return None
+    try:
+        return datetime.fromisoformat(event_id)
+    except ValueError:
+        return None
 
 
 @router.get("/status/{mission_id}/stream")
-async def stream_status(mission_id: str):
+async def stream_status(mission_id: str, request: Request, since: Optional[datetime] = None, mission: Mission = Depends(require_mission)):
     """
     Stream real-time status updates via Server-Sent Events (SSE).
 
+    Each event's SSE `id` is its timestamp. Reconnecting clients replay the
+    buffered events published after it: browsers send it back as the
+    Last-Event-ID header, or pass it explicitly as `since`.
+
     Events include:
     - status: Mission state changes
     - progress: Progress updates
@@ -75,59 +113,98 @@ async def stream_status(mission_id: str):
     - error: Error occurred
     - complete: Mission completed
     """
-    mission = await mission_store.get(mission_id)
-    if not mission:
-        raise HTTPException(status_code=404, detail=f"Mission {mission_id} not found")
+    if since is None:
+        since = _parse_event_id(request.headers.get("last-event-id"))
 
     async def event_generator():
         """Generate SSE events for the mission."""
-        # Send initial status
+        # Replay and live stream meet at one cursor, taken before anything is
+        # sent: events published while the first frames go out are streamed,
+        # not dropped
+        start = event_bus.cursor(mission_id)
+        replay = event_bus.replay_window(mission_id, since) if since is not None else ()
+
+        # Events are yielded as pre-encoded SSE frames; each event is
+        # serialized once no matter how many clients are streaming it
         initial_event = StreamEvent(
             type=StreamEventType.STATUS,
             data={
                 "mission_id": mission_id,
                 "state": mission.state.value,
                 "activity": mission.current_activity,
-                "findings_count": len(mission.findings)
+                "findings_count": mission.findings_count
             }
         )
-        yield {
-            "event": initial_event.type.value,
-            "data": json.dumps(initial_event.data, default=str)
-        }
-
-        # Subscribe to mission events
-        async for event in event_bus.subscribe(mission_id):
-            yield {
-                "event": event.type.value,
-                "data": json.dumps(event.data, default=str)
-            }
-
-            # Stop streaming if mission is complete
-            if event.type in [StreamEventType.COMPLETE, StreamEventType.ERROR]:
+        yield initial_event.sse_frame()
+
+        # Replay what a reconnecting client missed
+        for event in replay:
+            yield event.sse_frame()
+
+        # Subscribe to mission events; a burst is written as one multi-frame chunk
+        async for batch in event_bus.subscribe_batches(mission_id, start):
+            # Stop encoding for a client that has already gone away
+            if await request.is_disconnected():
+                return
+
+            frames = []
+            finished = False
+            for event in batch:
+                frames.append(event.sse_frame())
+
+                # Stop streaming if mission is complete
+                if event.type in _TERMINAL_EVENTS:
+                    finished = True
+                    break
+            yield b"".join(frames)
+            if finished:
                 break
 
         # Final heartbeat
-        yield {
-            "event": "heartbeat",
-            "data": json.dumps({"status": "stream_ended"})
-        }
+        yield StreamEvent(
+            type=StreamEventType.HEARTBEAT,
+            data={"status": "stream_ended"}
+        ).sse_frame()
+
+    # send_timeout drops connections whose socket stops draining (dead peers);
+    # pings keep idle streams alive through proxies between bus heartbeats
+    return EventSourceResponse(
+        event_generator(),
+        ping=settings.sse_ping_seconds,
+        send_timeout=settings.sse_send_timeout_seconds
+    )
+
 
-    return EventSourceResponse(event_generator())
+# Upper bound on one activity request (the bus keeps a bounded history anyway)
+_MAX_ACTIVITY_LIMIT = 1000
 
 
 @router.get("/status/{mission_id}/activity")
-async def get_activity_log(mission_id: str, limit: int = 50):
-    """Get recent activity log for a mission."""
-    mission = await mission_store.get(mission_id)
-    if not mission:
-        raise HTTPException(status_code=404, detail=f"Mission {mission_id} not found")
+async def get_activity_log(
+    mission_id: str,
+    request: Request,
+    limit: int = 50,
+    mission: Mission = Depends(require_mission)
+):
+    """
+    Get recent activity log for a mission.
 
+    Clients sending `Accept: application/x-ndjson` get one event per line,
+    streamed, instead of a single JSON document.
+    """
     # Get activity log from event bus
+    limit = min(limit, _MAX_ACTIVITY_LIMIT)
     activities = await event_bus.get_history(mission_id, limit=limit)
 
-    return {
+    if "application/x-ndjson" in request.headers.get("accept", ""):
+        def ndjson():
+            for activity in activities:
+                yield activity + b"\n"
+        return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+    # History entries are already JSON; embed them without re-encoding
+    return ORJSONResponse({
         "mission_id": mission_id,
-        "activities": activities,
+        "activities": [orjson.Fragment(a) for a in activities],
         "count": len(activities)
-    }
+    })
@@ -1,14 +1,36 @@
 """
 CHRONICLE - Run the server
 """
+import importlib.util
+
 import uvicorn
 from config import settings
 
+
+def _pick(module: str, preferred: str, fallback: str) -> str:
+    """Use the C-accelerated implementation when it is installed."""
+    return preferred if importlib.util.find_spec(module) else fallback
+
+
 if __name__ == "__main__":
-    print("Starting CHRONICLE server...")
-    uvicorn.run(
-        "app.main:app",
+    workers = max(1, settings.workers)
+    print(f"Starting CHRONICLE server ({workers} worker{'s' if workers > 1 else ''})...")
+
+    options = dict(
         host=settings.host,
         port=settings.port,
-        reload=settings.debug
+        workers=workers,
+        # uvloop isn't available on Windows; fall back to the stdlib loop/parser there
+        loop=_pick("uvloop", "uvloop", "asyncio"),
+        http=_pick("httptools", "httptools", "h11"),
+        lifespan="on"
     )
+    if settings.debug:
+        # Dev mode: file watcher + auto-reload (only works with a single process)
+        options["reload"] = workers == 1
+    else:
+        # SSE runs over plain HTTP, so no WebSocket protocol; the proxy in front
+        # sets client addresses, and polled responses skip the Server header
+        options.update(ws="none", proxy_headers=True, server_header=False)
+
+    uvicorn.run("app.main:app", **options)
@@ -15,21 +15,274 @@ Phases:
 8. Synthesis - Generate comprehensive report
 """
 import asyncio
-import json
+import hashlib
+import heapq
+import itertools
 import re
+import time
+from collections import OrderedDict
+from json import JSONDecodeError  # orjson.JSONDecodeError subclasses it
+from operator import attrgetter
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from pathlib import Path
+from typing import Optional, Dict, Any, Awaitable, Callable, Iterator, List, Tuple, TypeVar
 import uuid
 
 from google import genai
-from google.genai import types
+from google.genai import errors as genai_errors, types
 
 from config import settings
+from models._serde import dumps_compact, loads
 from models.domain import (
     Mission, MissionState, Checkpoint, ResearchPlan, ResearchTask,
     DeepFinding, ResearchPhase, ResearchDepth
 )
 from persistence import mission_store, checkpoint_store, event_bus
+from persistence.llm_cache import LLMCache, InMemoryCacheBackend, RedisCacheBackend
+from tools.file_export import FileExporter
+from utils.http import http_client
+from utils.log import get_logger
+from utils.rate_limit import gemini_limiter
+
+log = get_logger(__name__)
+
+
+# Every Gemini client sends its async calls over the shared HTTP session
+_HTTP_OPTIONS = types.HttpOptions(httpx_async_client=http_client)
+
+# Client on the server's API key (None if not configured), shared by every manager
+_server_client = (
+    genai.Client(api_key=settings.gemini_api_key, http_options=_HTTP_OPTIONS)
+    if settings.gemini_api_key else None
+)
+
+
+# User-key Gemini clients kept alive for reuse (least recently used evicted),
+# shared by every MissionManager; keyed by a hash of the API key
+_MAX_USER_CLIENTS = 32
+_user_clients: "OrderedDict[str, genai.Client]" = OrderedDict()
+
+
+# Response cache for research queries: missions repeat the same prompts
+# ("{name} pricing" across overlapping entity sets, deepening retries).
+# Exact matches only: research prompts are fixed templates around an entity
+# name or query, so the template dominates their embeddings and "pricing for
+# Asana" would match "pricing for Trello". Entries expire after the TTL,
+# which bounds how stale a grounded (search) answer can get.
+response_cache = LLMCache(
+    backend=RedisCacheBackend(settings.redis_url) if settings.redis_url else InMemoryCacheBackend(),
+    ttl=settings.llm_cache_ttl_seconds
+)
+
+# Bounds Gemini calls in flight across all missions and phases (RPM quota);
+# phases still bound their own fan-out, this caps the sum of them
+_gemini_slots = asyncio.Semaphore(max(settings.max_concurrent_queries, 1))
+
+# Cleared once Gemini rejects JSON mode combined with the search tool;
+# grounded structured queries then go out as plain prompts
+_json_mode_with_search = True
+
+# Retries of a call Gemini rejected with 429, backing off 2s, 4s, 8s...
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_BACKOFF_SECONDS = 2.0
+
+_T = TypeVar("_T")
+
+
+async def _call_gemini(call: Callable[[], Awaitable[_T]]) -> _T:
+    """
+    Run one Gemini call paced by the shared token bucket and slot limit.
+
+    A 429 throttles the bucket for every caller and the call is retried with
+    exponential back-off; other errors propagate.
+    """
+    for attempt in itertools.count():
+        await gemini_limiter.acquire()
+        try:
+            async with _gemini_slots:
+                return await call()
+        except genai_errors.APIError as e:
+            if e.code != 429 or attempt >= _RATE_LIMIT_RETRIES:
+                raise
+            delay = _RATE_LIMIT_BACKOFF_SECONDS * 2 ** attempt
+            log.warning("Gemini rate limit hit; retrying in %.0fs", delay)
+            gemini_limiter.throttle(delay * 4)
+            await asyncio.sleep(delay)
+
+
+# (client id, cache key, cache TTL) -> task for queries currently
+# awaiting Gemini (single-flight); missions on different API keys never share
+_InflightKey = Tuple[int, str, Optional[float]]
+_inflight_queries: Dict[_InflightKey, "asyncio.Task[str]"] = {}
+
+
+def _release_inflight(key: _InflightKey, task: "asyncio.Task[str]") -> None:
+    """Forget a finished query so later callers go through the cache."""
+    if _inflight_queries.get(key) is task:
+        del _inflight_queries[key]
+
+
+# Values _sanitize_data passes through untouched (exact types)
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Replies longer than this are parsed in a worker thread
+_PARSE_OFFLOAD_CHARS = 64 * 1024
+
+# Characters that matter when scanning for a JSON span, per opening bracket
+_JSON_SCAN_PATTERNS = {
+    "{": re.compile(r'[{}"\\]'),
+    "[": re.compile(r'[\[\]"\\]')
+}
+
+# Sort key for top-k selections (C-level getter, no lambda call per finding)
+_by_depth = attrgetter("depth_score")
+
+# Constant parts of the fallback synthesis, built once (tuples: shared, never
+# mutated; _sanitize_data turns them into fresh lists)
+_FALLBACK_STATIC_FIELDS = {
+    "market_analysis": "See individual findings for detailed market analysis.",
+    "next_steps": (
+        "Review top recommendations in detail",
+        "Compare shortlisted options",
+        "Conduct trials with top picks"
+    )
+}
+
+# Streamed replies post an activity update every this many chunks
+_STREAM_PROGRESS_EVERY = 20
+
+
+def _find_json_span(text: str, opener: str) -> Optional[str]:
+    """
+    The first balanced JSON object ("{") or array ("[") in text, or None.
+
+    One linear pass that skips brackets inside string literals, instead of
+    a greedy regex that spans to the last closing bracket in the reply.
+    The pass jumps between significant characters with a precompiled
+    character-class pattern (no backtracking), so plain text is skipped in C.
+    """
+    closer = "}" if opener == "{" else "]"
+    start = text.find(opener)
+    if start < 0:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped_at = -1  # Index of the character a backslash escapes
+    for match in _JSON_SCAN_PATTERNS[opener].finditer(text, start):
+        i = match.start()
+        if i == escaped_at:
+            continue
+        char = match.group()
+        if in_string:
+            if char == "\\":
+                escaped_at = i + 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == opener:
+            depth += 1
+        elif char == closer:
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+def _entries_by_name(entries: List[Any], field: str) -> Dict[str, Dict[str, Any]]:
+    """Index the dict entries of a multi-entity reply by lowercased name."""
+    return {
+        str(entry.get(field, "")).strip().lower(): entry
+        for entry in entries
+        if isinstance(entry, dict)
+    }
+
+
+# ===========================================
+# RESPONSE SCHEMAS (Gemini structured output for the deep-dive queries)
+# ===========================================
+
+_STRING_LIST = {"type": "ARRAY", "items": {"type": "STRING"}}
+
+_PRICING_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "tiers": {
+            "type": "ARRAY",
+            "items": {
+                "type": "OBJECT",
+                "properties": {
+                    "name": {"type": "STRING"},
+                    "price": {"type": "STRING"},
+                    "billing": {"type": "STRING"},
+                    "features": _STRING_LIST
+                }
+            }
+        },
+        "starting_price": {"type": "STRING"},
+        "free_trial": {"type": "BOOLEAN"}
+    }
+}
+
+_FEATURES_SCHEMA = _STRING_LIST
+
+_PROS_CONS_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {"pros": _STRING_LIST, "cons": _STRING_LIST}
+}
+
+_USE_CASES_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "use_cases": _STRING_LIST,
+        "target_audience": {"type": "STRING"},
+        "best_for": {"type": "STRING"}
+    }
+}
+
+_COMPETITORS_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {"competitors": _STRING_LIST, "integrations": _STRING_LIST}
+}
+
+_COMPARISON_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            "entity": {"type": "STRING"},
+            "opponent": {"type": "STRING"},
+            "winner_overall": {"type": "STRING"},
+            "comparison": {"type": "STRING"}
+        }
+    }
+}
+
+_VALIDATION_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            "name": {"type": "STRING"},
+            "verified": {"type": "BOOLEAN"},
+            "current_pricing": {"type": "STRING"},
+            "source": {"type": "STRING"}
+        }
+    }
+}
+
+# All five aspects in one reply (settings.use_bundle_queries)
+_ENTITY_BUNDLE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "pricing": _PRICING_SCHEMA,
+        "features": _FEATURES_SCHEMA,
+        **_PROS_CONS_SCHEMA["properties"],
+        **_USE_CASES_SCHEMA["properties"],
+        **_COMPETITORS_SCHEMA["properties"]
+    }
+}
 
 
 class MissionManager:
@@ -43,15 +296,29 @@ class MissionManager:
 
     def __init__(self):
         # Default client using server's API key (may be None if not configured)
-        self.default_client = None
-        if settings.gemini_api_key:
-            self.default_client = genai.Client(api_key=settings.gemini_api_key)
+        self.default_client = _server_client
         self.client = self.default_client  # Current active client
 
+        # One exporter for every mission (it only holds the export directory)
+        self.exporter = FileExporter()
+
     def _get_client(self, api_key: Optional[str] = None):
-        """Get a Gemini client, using provided key or server default."""
+        """
+        Get a Gemini client, using provided key or server default.
+
+        Clients for user keys are memoized, so repeat missions from the same
+        user reuse its HTTP connection pool instead of building a new one.
+        """
         if api_key:
-            return genai.Client(api_key=api_key)
+            key_hash = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+            client = _user_clients.get(key_hash)
+            if client is None:
+                client = _user_clients[key_hash] = genai.Client(api_key=api_key, http_options=_HTTP_OPTIONS)
+                if len(_user_clients) > _MAX_USER_CLIENTS:
+                    _user_clients.popitem(last=False)
+            else:
+                _user_clients.move_to_end(key_hash)
+            return client
         if self.default_client:
             return self.default_client
         raise ValueError("No API key provided and no server default configured. Please provide your Gemini API key.")
@@ -62,8 +329,21 @@ class MissionManager:
 
     def _sanitize_data(self, data: any) -> any:
         """Recursively sanitize data to ensure all types are JSON-serializable."""
-        if data is None:
-            return None
+        # Exact-type dispatch for the common cases (one set lookup, no MRO walk)
+        data_type = type(data)
+        if data_type in _JSON_SCALAR_TYPES:
+            return data
+        if data_type is dict:
+            sanitize = self._sanitize_data
+            return {
+                (k if type(k) is str else str(k)): (v if type(v) in _JSON_SCALAR_TYPES else sanitize(v))
+                for k, v in data.items()
+            }
+        if data_type is list:
+            sanitize = self._sanitize_data
+            return [item if type(item) in _JSON_SCALAR_TYPES else sanitize(item) for item in data]
+
+        # Subclasses (str enums, OrderedDict, ...) take the general path
         if isinstance(data, (str, int, float, bool)):
             return data
         if isinstance(data, dict):
@@ -95,50 +375,177 @@ class MissionManager:
                         return '\n'.join(parts_text)
             return str(response)
         except Exception as e:
-            print(f"Error extracting text from response: {e}")
+            log.warning("Error extracting text from response: %s", e)
             return str(response)
 
     def _parse_json_from_text(self, text: str, default: any = None) -> any:
         """Extract and parse JSON from LLM response text."""
-        try:
-            # If default is a dict, prioritize finding object first
-            if isinstance(default, dict):
-                obj_match = re.search(r'\{[\s\S]*\}', text)
-                if obj_match:
-                    return json.loads(obj_match.group())
-                array_match = re.search(r'\[[\s\S]*\]', text)
-                if array_match:
-                    return json.loads(array_match.group())
-            else:
-                # Try to find JSON array first
-                array_match = re.search(r'\[[\s\S]*\]', text)
-                if array_match:
-                    return json.loads(array_match.group())
-                # Try to find JSON object
-                obj_match = re.search(r'\{[\s\S]*\}', text)
-                if obj_match:
-                    return json.loads(obj_match.group())
-        except json.JSONDecodeError:
-            pass
+        # Fast path: JSON-mode replies are the document itself. Only worth a
+        # full parse when the reply ends like a JSON document does
+        if isinstance(text, str) and text.rstrip()[-1:] in ("}", "]"):
+            try:
+                return loads(text)
+            except JSONDecodeError:
+                pass
+
+        # Fallback: dig the JSON out of surrounding prose. If default is a
+        # dict, look for an object first; otherwise an array first
+        openers = "{[" if isinstance(default, dict) else "[{"
+        if not isinstance(text, str):
+            openers = ""
+        for opener in openers:
+            try:
+                span = _find_json_span(text, opener)
+                if span is not None:
+                    return loads(span)
+            except JSONDecodeError:
+                continue  # e.g. a bracketed aside in the prose; try the other kind
         return default if default is not None else {}
 
-    async def _llm_query(self, prompt: str, use_search: bool = True) -> str:
-        """Execute LLM query with optional Google Search grounding."""
+    async def _parse_json(self, text: str, default: any = None) -> any:
+        """_parse_json_from_text, run off the event loop for very large replies."""
+        if text and len(text) > _PARSE_OFFLOAD_CHARS:
+            return await asyncio.to_thread(self._parse_json_from_text, text, default)
+        return self._parse_json_from_text(text, default)
+
+    async def _llm_query(
+        self, prompt: str, use_search: bool = True, response_schema: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None
+    ) -> str:
+        """
+        Execute LLM query with optional Google Search grounding.
+
+        With `response_schema`, Gemini answers in JSON mode constrained to
+        the schema, so the reply parses directly with orjson (if the model
+        rejects JSON mode with search grounding, the prompt's own JSON
+        instructions are relied on instead). `cache_ttl`
+        overrides how long the answer is cached (default: llm_cache_ttl_seconds).
+
+        Identical queries already in flight on the same client (from any
+        mission using the same API key) share one call, and with it one
+        cache lookup and one cache write.
+        """
+        use_search = use_search and settings.enable_google_search
+        client = self.client
+        # The task holds the client, so its id can't be reused while the entry exists
+        cache_key = LLMCache.make_key(
+            settings.researcher_model, prompt, use_search=use_search, response_schema=response_schema
+        )
+        key = (id(client), cache_key, cache_ttl)
+        task = _inflight_queries.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._llm_query_once(client, prompt, use_search, response_schema, cache_ttl)
+            )
+            _inflight_queries[key] = task
+            task.add_done_callback(lambda done: _release_inflight(key, done))
+        # Shielded so a cancelled caller doesn't cancel the call others are awaiting
+        return await asyncio.shield(task)
+
+    async def _llm_query_once(
+        self, client: genai.Client, prompt: str, use_search: bool,
+        response_schema: Optional[Dict[str, Any]] = None, cache_ttl: Optional[float] = None
+    ) -> str:
+        """Answer a query from the response cache, or Gemini on a miss."""
+        global _json_mode_with_search
         try:
+            cached = await response_cache.aget(
+                settings.researcher_model, prompt, use_search=use_search, response_schema=response_schema
+            )
+            if cached is not None:
+                return cached
+
+            json_mode = response_schema is not None and (_json_mode_with_search or not use_search)
+            try:
+                response = await self._generate(client, prompt, use_search, response_schema if json_mode else None)
+            except genai_errors.ClientError as e:
+                if not (json_mode and use_search and e.code == 400):
+                    raise
+                # Some models/API versions reject tools together with JSON
+                # mode; the prompts also ask for JSON, so ask again in prose
+                log.warning("JSON mode with search rejected; continuing without it: %s", e)
+                _json_mode_with_search = False
+                response = await self._generate(client, prompt, use_search, None)
+            text = self._extract_text_from_response(response)
+            if text:  # Don't cache empty (failed/blocked) answers
+                await response_cache.aset(
+                    settings.researcher_model, prompt, text, use_search=use_search, ttl=cache_ttl,
+                    response_schema=response_schema
+                )
+            return text
+        except Exception as e:
+            log.error("LLM query error: %s", e)
+            return ""
+
+    async def _generate(
+        self, client: genai.Client, prompt: str, use_search: bool, response_schema: Optional[Dict[str, Any]]
+    ) -> Any:
+        """One generate_content call, grounded and/or in JSON mode as requested."""
+        config = None
+        if use_search or response_schema:
+            config = types.GenerateContentConfig(
+                tools=[types.Tool(google_search=types.GoogleSearch())] if use_search else None,
+                response_mime_type="application/json" if response_schema else None,
+                response_schema=response_schema
+            )
+
+        # Async client: concurrent queries overlap instead of blocking the loop
+        return await _call_gemini(lambda: client.aio.models.generate_content(
+            model=settings.researcher_model,
+            contents=prompt,
+            config=config
+        ))
+
+    async def _llm_query_streamed(
+        self, prompt: str, mission_id: str, use_search: bool = False, json_output: bool = False
+    ) -> str:
+        """
+        Like _llm_query, but streams the reply (for long generations).
+
+        Chunks are collected in a list and joined once at the end, and the
+        mission's activity shows the report arriving instead of going quiet.
+        With `json_output` the reply is requested in JSON mode, so the joined
+        text is the document itself and parses in one orjson call.
+        """
+        use_search = use_search and settings.enable_google_search
+        try:
+            cached = await response_cache.aget(settings.researcher_model, prompt, use_search=use_search)
+            if cached is not None:
+                return cached
+
             config = None
-            if use_search and settings.enable_google_search:
+            if use_search or json_output:
                 config = types.GenerateContentConfig(
-                    tools=[types.Tool(google_search=types.GoogleSearch())]
+                    tools=[types.Tool(google_search=types.GoogleSearch())] if use_search else None,
+                    response_mime_type="application/json" if json_output else None
                 )
 
-            response = self.client.models.generate_content(
-                model=settings.researcher_model,
-                contents=prompt,
-                config=config
-            )
-            return self._extract_text_from_response(response)
+            async def stream_reply() -> str:
+                # Holds its Gemini slot until the last chunk arrives
+                chunks: List[str] = []
+                received = 0
+                stream = await self.client.aio.models.generate_content_stream(
+                    model=settings.researcher_model,
+                    contents=prompt,
+                    config=config
+                )
+                async for chunk in stream:
+                    piece = chunk.text or ""
+                    chunks.append(piece)
+                    received += len(piece)
+                    if len(chunks) % _STREAM_PROGRESS_EVERY == 0:
+                        await event_bus.emit_status(
+                            mission_id, MissionState.ANALYZING.value,
+                            f"Synthesizing comprehensive report... ({received:,} characters)"
+                        )
+                return "".join(chunks)
+
+            text = await _call_gemini(stream_reply)
+            if text:  # Don't cache empty (failed/blocked) answers
+                await response_cache.aset(settings.researcher_model, prompt, text, use_search=use_search)
+            return text
         except Exception as e:
-            print(f"LLM query error: {e}")
+            log.error("LLM query error: %s", e)
             return ""
 
     # ===========================================
@@ -171,7 +578,7 @@ class MissionManager:
 
         mission = await mission_store.get(mission_id)
         if not mission:
-            print(f"Mission {mission_id} not found")
+            log.warning("Mission %s not found", mission_id)
             return
 
         # Determine research depth from request
@@ -179,7 +586,7 @@ class MissionManager:
         target_count = mission.criteria.get("max_results", settings.target_entities)
 
         try:
-            start_time = datetime.utcnow()
+            start_time = time.monotonic()  # Duration clock: immune to wall-clock jumps
 
             # ============ PHASE 1: PLANNING ============
             await self._update_mission(mission, MissionState.PLANNING,
@@ -187,35 +594,30 @@ class MissionManager:
             plan = await self._create_deep_plan(mission)
             mission.plan = plan
             mission.total_steps = 8  # 8 phases
-            await mission_store.save(mission)
 
             # ============ PHASE 2: DISCOVERY ============
             await self._update_mission(mission, MissionState.RESEARCHING,
                                        "Phase 1/4: Discovering entities...")
             entities = await self._execute_discovery_phase(mission)
             mission.completed_steps = 1
-            await mission_store.save(mission)
 
             # ============ PHASE 3: DEEP DIVE ============
             await self._update_mission(mission, MissionState.RESEARCHING,
                                        "Phase 2/4: Deep diving into entities...")
             deep_findings = await self._execute_deep_dive_phase(mission, entities)
             mission.completed_steps = 2
-            await mission_store.save(mission)
 
             # ============ PHASE 4: COMPARISON ============
             await self._update_mission(mission, MissionState.ANALYZING,
                                        "Phase 3/4: Comparing entities...")
             compared_findings = await self._execute_comparison_phase(mission, deep_findings)
             mission.completed_steps = 3
-            await mission_store.save(mission)
 
             # ============ PHASE 5: VALIDATION ============
             await self._update_mission(mission, MissionState.ANALYZING,
                                        "Phase 4/4: Validating claims...")
             validated_findings = await self._execute_validation_phase(mission, compared_findings)
             mission.completed_steps = 4
-            await mission_store.save(mission)
 
             # ============ PHASE 6: SEMANTIC SCORING ============
             await self._update_mission(mission, MissionState.SCORING,
@@ -246,15 +648,12 @@ class MissionManager:
                 mission.add_finding(finding_dict)
                 await event_bus.emit_finding(mission_id, finding_dict)
 
-            await mission_store.save(mission)
-
             # ============ PHASE 8: SYNTHESIS ============
             await self._update_mission(mission, MissionState.ANALYZING,
                                        "Synthesizing comprehensive report...")
             synthesis = await self._synthesize_deep_report(mission, validated_findings, score_result)
             mission.synthesis = synthesis
             mission.completed_steps = 7
-            await mission_store.save(mission)
 
             # ============ EXPORT ============
             await self._update_mission(mission, MissionState.EXPORTING,
@@ -268,36 +667,48 @@ class MissionManager:
             # ============ COMPLETE ============
             mission.completed_at = datetime.utcnow()
             mission.completed_steps = 8
-            duration = (mission.completed_at - start_time).total_seconds()
+            duration = time.monotonic() - start_time
 
             await self._update_mission(mission, MissionState.COMPLETED,
                                        f"Deep research completed in {duration/60:.1f} minutes!")
 
             await event_bus.emit_complete(mission_id, {
-                "findings_count": len(mission.findings),
+                "findings_count": mission.findings_count,
                 "exports_count": len(exports),
                 "corrections_made": mission.corrections_made,
                 "duration_seconds": duration,
-                "average_depth_score": score_result.get("overall_score", 0)
+                "average_depth_score": score_result.get("overall_score", 0),
+                "cache_stats": dict(response_cache.stats)
             })
 
         except Exception as e:
             import traceback
             error_trace = traceback.format_exc()
-            print(f"Mission {mission_id} failed: {e}")
-            print(f"Full traceback:\n{error_trace}")
-            try:
-                with open(f"error_{mission_id}.log", "w") as f:
-                    f.write(f"Error: {e}\n\nTraceback:\n{error_trace}")
-            except:
-                pass
+            log.exception("Mission %s failed: %s", mission_id, e)
             await self._update_mission(mission, MissionState.FAILED, f"Error: {str(e)}")
             await event_bus.emit_error(mission_id, str(e))
 
+            # Failure is already announced; the log file is written off the event loop
+            try:
+                await asyncio.to_thread(
+                    Path(f"error_{mission_id}.log").write_text,
+                    f"Error: {e}\n\nTraceback:\n{error_trace}"
+                )
+            except OSError:
+                pass
+
     async def _update_mission(self, mission: Mission, state: MissionState, activity: str) -> None:
-        """Update mission state and emit event."""
+        """
+        Update mission state and emit event.
+
+        Saves are coalesced by the store's write-behind queue, so phase
+        boundaries only mark the mission dirty; terminal states are flushed
+        to disk before the event goes out.
+        """
         mission.update_state(state, activity)
         await mission_store.save(mission)
+        if state in (MissionState.COMPLETED, MissionState.FAILED):
+            await mission_store.flush()
         await event_bus.emit_status(mission.id, state.value, activity)
 
     # ===========================================
@@ -336,7 +747,7 @@ Return a JSON object:
 Return ONLY the JSON object."""
 
         text = await self._llm_query(prompt, use_search=False)
-        plan_data = self._parse_json_from_text(text, {
+        plan_data = await self._parse_json(text, {
             "strategy": "Systematic deep research",
             "discovery_queries": [mission.goal],
             "deep_dive_aspects": ["pricing", "features", "reviews"],
@@ -382,14 +793,17 @@ Return ONLY the JSON object."""
                     queries.append(task.query)
 
         total_queries = min(len(queries), settings.discovery_queries)
+        semaphore = asyncio.Semaphore(max(settings.max_concurrent_entities, 1))
+        progress = itertools.count(1)
 
-        for i, query in enumerate(queries[:total_queries]):
-            await event_bus.emit_progress(
-                mission.id, i + 1, total_queries,
-                f"Discovery: {query[:40]}..."
-            )
+        async def discover(query: str) -> Any:
+            async with semaphore:
+                await event_bus.emit_progress(
+                    mission.id, next(progress), total_queries,
+                    f"Discovery: {query[:40]}..."
+                )
 
-            prompt = f"""Search for: {query}
+                prompt = f"""Search for: {query}
 
 Find entities/products/services that match this query.
 For each one found, provide:
@@ -401,9 +815,16 @@ For each one found, provide:
 Return as JSON array. Find 5-10 relevant entities.
 Example: [{{"name": "Example", "category": "Software", "brief_description": "A tool for...", "website": "example.com"}}]"""
 
-            text = await self._llm_query(prompt, use_search=True)
-            entities = self._parse_json_from_text(text, [])
+                # No per-query pause: the global Gemini limiter paces this phase
+                text = await self._llm_query(prompt, use_search=True)
+                return await self._parse_json(text, [])
+
+        # Queries run concurrently; results are merged in query order so
+        # de-duplication keeps the same winner as a sequential run
+        selected = queries[:total_queries]
+        results = await asyncio.gather(*(discover(q) for q in selected), return_exceptions=True)
 
+        for query, entities in zip(selected, results):
             if isinstance(entities, list):
                 for entity in entities:
                     if isinstance(entity, dict):
@@ -414,8 +835,6 @@ Example: [{{"name": "Example", "category": "Software", "brief_description": "A t
                             entity["discovered_via"] = query
                             discovered.append(entity)
 
-            await asyncio.sleep(settings.delay_between_queries_seconds)
-
         # Limit to target count
         target = mission.criteria.get("max_results", settings.target_entities)
         return discovered[:target]
@@ -438,13 +857,25 @@ Example: [{{"name": "Example", "category": "Software", "brief_description": "A t
         - Use cases
         - Technical details
         """
-        deep_findings = []
-        total = len(entities)
-
-        for i, entity in enumerate(entities):
-            entity_name = entity.get("name", "Unknown")
+        semaphore = asyncio.Semaphore(max(settings.max_concurrent_entities, 1))
+        progress = itertools.count(1)
+
+        # Entities are researched concurrently (bounded to respect Gemini rate
+        # limits); gather keeps the findings in entity order
+        return list(await asyncio.gather(*(
+            self._deep_dive_one(mission, entity, len(entities), semaphore, progress)
+            for entity in entities
+        )))
+
+    async def _deep_dive_one(
+        self, mission: Mission, entity: Dict, total: int,
+        semaphore: asyncio.Semaphore, progress: Iterator[int]
+    ) -> DeepFinding:
+        """Run the deep-dive queries for one entity and build its DeepFinding."""
+        entity_name = entity.get("name", "Unknown")
+        async with semaphore:
             await event_bus.emit_progress(
-                mission.id, i + 1, total,
+                mission.id, next(progress), total,
                 f"Deep diving: {entity_name}"
             )
 
@@ -456,105 +887,145 @@ Example: [{{"name": "Example", "category": "Software", "brief_description": "A t
                 website=entity.get("website")
             )
 
-            # Query 1: PRICING
-            pricing_text = await self._llm_query(
-                f"Find detailed pricing information for {entity_name}. "
-                f"Include all pricing tiers, monthly/annual costs, free trial info. "
-                f"Return JSON: {{\"tiers\": [...], \"starting_price\": \"...\", \"free_trial\": true/false}}"
-            )
-            pricing_data = self._parse_json_from_text(pricing_text)
-            if pricing_data:
-                finding.pricing = self._sanitize_data(pricing_data)
-            finding.research_queries.append(f"{entity_name} pricing")
-            await asyncio.sleep(settings.delay_between_queries_seconds)
-
-            # Query 2: FEATURES
-            features_text = await self._llm_query(
-                f"List the main features and capabilities of {entity_name}. "
-                f"Be specific - what can users actually do with it? "
-                f"Return JSON array of feature strings: [\"feature1\", \"feature2\", ...]"
-            )
-            features = self._parse_json_from_text(features_text, [])
+            bundle = None
+            if settings.use_bundle_queries:
+                # All five aspects in one structured call
+                bundle = await self._query_entity_bundle(entity_name)
+                if isinstance(bundle, dict) and bundle:
+                    pricing_data, features = bundle.get("pricing"), bundle.get("features")
+                    proscons = usecases = compare = bundle
+                else:
+                    bundle = None  # Unusable reply; fall back to per-aspect queries
+
+            if bundle is None:
+                # The five attribute queries are independent: run them concurrently
+                pricing_data, features, proscons, usecases, compare = await asyncio.gather(
+                    self._query_pricing(entity_name),
+                    self._query_features(entity_name),
+                    self._query_pros_cons(entity_name),
+                    self._query_use_cases(entity_name),
+                    self._query_competitors(entity_name),
+                    return_exceptions=True
+                )
+
+            # PRICING (parsed JSON: already plain data, no sanitize pass needed)
+            if pricing_data and isinstance(pricing_data, dict):
+                finding.pricing = pricing_data
+
+            # FEATURES
             if isinstance(features, list):
                 finding.features = [str(f) for f in features[:15]]
-            finding.research_queries.append(f"{entity_name} features")
-            await asyncio.sleep(settings.delay_between_queries_seconds)
-
-            # Query 3: PROS AND CONS
-            proscons_text = await self._llm_query(
-                f"What are the pros and cons of {entity_name} based on user reviews? "
-                f"Be specific with real advantages and disadvantages. "
-                f"Return JSON: {{\"pros\": [...], \"cons\": [...]}}"
-            )
-            proscons = self._parse_json_from_text(proscons_text, {})
+
+            # PROS AND CONS
             if isinstance(proscons, dict):
                 finding.pros = [str(p) for p in proscons.get("pros", [])[:8]]
                 finding.cons = [str(c) for c in proscons.get("cons", [])[:8]]
-            finding.research_queries.append(f"{entity_name} reviews pros cons")
-            await asyncio.sleep(settings.delay_between_queries_seconds)
 
-            # Query 4: USE CASES & TARGET AUDIENCE
-            usecases_text = await self._llm_query(
-                f"Who should use {entity_name}? What are the best use cases? "
-                f"Return JSON: {{\"use_cases\": [...], \"target_audience\": \"...\", \"best_for\": \"...\"}}"
-            )
-            usecases = self._parse_json_from_text(usecases_text, {})
+            # USE CASES & TARGET AUDIENCE
             if isinstance(usecases, dict):
                 finding.use_cases = [str(u) for u in usecases.get("use_cases", [])[:8]]
                 finding.target_audience = str(usecases.get("target_audience", ""))
-            finding.research_queries.append(f"{entity_name} use cases")
-            await asyncio.sleep(settings.delay_between_queries_seconds)
 
-            # Query 5: COMPETITORS & INTEGRATIONS
-            compare_text = await self._llm_query(
-                f"What are the main competitors to {entity_name}? What integrations does it support? "
-                f"Return JSON: {{\"competitors\": [...], \"integrations\": [...]}}"
-            )
-            compare = self._parse_json_from_text(compare_text, {})
+            # COMPETITORS & INTEGRATIONS
             if isinstance(compare, dict):
                 finding.competitors = [str(c) for c in compare.get("competitors", [])[:8]]
                 finding.integrations = [str(i) for i in compare.get("integrations", [])[:10]]
-            finding.research_queries.append(f"{entity_name} competitors integrations")
+
+            if bundle is not None:
+                finding.research_queries.append(f"{entity_name} pricing features reviews use cases competitors")
+            else:
+                finding.research_queries.extend([
+                    f"{entity_name} pricing",
+                    f"{entity_name} features",
+                    f"{entity_name} reviews pros cons",
+                    f"{entity_name} use cases",
+                    f"{entity_name} competitors integrations"
+                ])
 
             # Calculate attribute count and initial depth score
-            finding.research_iterations = 5
-            finding.attribute_count = self._count_attributes(finding)
+            finding.research_iterations = 5  # Five aspects researched, bundled or not
             finding.depth_score = self._calculate_depth_score(finding)
             finding.last_deepened = datetime.utcnow()
 
-            deep_findings.append(finding)
-
-        return deep_findings
-
-    def _count_attributes(self, finding: DeepFinding) -> int:
-        """Count how many attributes have been populated."""
-        count = 0
-        if finding.pricing:
-            count += 1
-        if finding.features:
-            count += 1
-        if finding.pros:
-            count += 1
-        if finding.cons:
-            count += 1
-        if finding.use_cases:
-            count += 1
-        if finding.target_audience:
-            count += 1
-        if finding.competitors:
-            count += 1
-        if finding.integrations:
-            count += 1
-        if finding.website:
-            count += 1
-        if finding.description:
-            count += 1
-        return count
+        return finding
+
+    async def _query_entity_bundle(self, entity_name: str) -> Any:
+        """Queries 1-5 in one call: pricing, features, pros/cons, use cases, competitors."""
+        text = await self._llm_query(
+            f"Research {entity_name} in depth and report:\n"
+            f"- pricing: all pricing tiers, monthly/annual costs, starting price, free trial info\n"
+            f"- features: the main features and capabilities (be specific - what can users actually do with it?)\n"
+            f"- pros and cons based on user reviews (real advantages and disadvantages)\n"
+            f"- use_cases: who should use it and the best use cases; target_audience and best_for\n"
+            f"- competitors: the main competitors; integrations: the integrations it supports\n"
+            f"Return JSON: {{\"pricing\": {{\"tiers\": [...], \"starting_price\": \"...\", \"free_trial\": true/false}}, "
+            f"\"features\": [...], \"pros\": [...], \"cons\": [...], \"use_cases\": [...], "
+            f"\"target_audience\": \"...\", \"best_for\": \"...\", \"competitors\": [...], \"integrations\": [...]}}",
+            response_schema=_ENTITY_BUNDLE_SCHEMA
+        )
+        return await self._parse_json(text, {})
+
+    async def _query_pricing(self, entity_name: str) -> Any:
+        """Query 1: pricing tiers, costs and trial info."""
+        text = await self._llm_query(
+            f"Find detailed pricing information for {entity_name}. "
+            f"Include all pricing tiers, monthly/annual costs, free trial info. "
+            f"Return JSON: {{\"tiers\": [...], \"starting_price\": \"...\", \"free_trial\": true/false}}",
+            response_schema=_PRICING_SCHEMA
+        )
+        return await self._parse_json(text, {})
+
+    async def _query_features(self, entity_name: str) -> Any:
+        """Query 2: main features and capabilities."""
+        text = await self._llm_query(
+            f"List the main features and capabilities of {entity_name}. "
+            f"Be specific - what can users actually do with it? "
+            f"Return JSON array of feature strings: [\"feature1\", \"feature2\", ...]",
+            response_schema=_FEATURES_SCHEMA,
+            cache_ttl=settings.llm_cache_stable_ttl_seconds
+        )
+        return await self._parse_json(text, [])
+
+    async def _query_pros_cons(self, entity_name: str) -> Any:
+        """Query 3: pros and cons from user reviews."""
+        text = await self._llm_query(
+            f"What are the pros and cons of {entity_name} based on user reviews? "
+            f"Be specific with real advantages and disadvantages. "
+            f"Return JSON: {{\"pros\": [...], \"cons\": [...]}}",
+            response_schema=_PROS_CONS_SCHEMA,
+            cache_ttl=settings.llm_cache_stable_ttl_seconds
+        )
+        return await self._parse_json(text, {})
+
+    async def _query_use_cases(self, entity_name: str) -> Any:
+        """Query 4: use cases and target audience."""
+        text = await self._llm_query(
+            f"Who should use {entity_name}? What are the best use cases? "
+            f"Return JSON: {{\"use_cases\": [...], \"target_audience\": \"...\", \"best_for\": \"...\"}}",
+            response_schema=_USE_CASES_SCHEMA,
+            cache_ttl=settings.llm_cache_stable_ttl_seconds
+        )
+        return await self._parse_json(text, {})
+
+    async def _query_competitors(self, entity_name: str) -> Any:
+        """Query 5: competitors and integrations."""
+        text = await self._llm_query(
+            f"What are the main competitors to {entity_name}? What integrations does it support? "
+            f"Return JSON: {{\"competitors\": [...], \"integrations\": [...]}}",
+            response_schema=_COMPETITORS_SCHEMA,
+            cache_ttl=settings.llm_cache_stable_ttl_seconds
+        )
+        return await self._parse_json(text, {})
 
     def _calculate_depth_score(self, finding: DeepFinding) -> float:
-        """Calculate depth score based on attribute richness."""
+        """
+        Calculate depth score based on attribute richness.
+
+        Also refreshes finding.attribute_count, so attributes are counted
+        once per rescoring.
+        """
         max_score = 10  # 10 key attributes
-        score = self._count_attributes(finding)
+        score = finding.recompute_attribute_count()
 
         # Bonus for rich data
         if finding.features and len(finding.features) >= 5:
@@ -579,41 +1050,57 @@ Example: [{{"name": "Example", "category": "Software", "brief_description": "A t
         if len(findings) < 2:
             return findings
 
-        # Sort by depth score and compare top entities
-        sorted_findings = sorted(findings, key=lambda f: f.depth_score, reverse=True)
-        top_count = min(len(sorted_findings), 8)
-        top_findings = sorted_findings[:top_count]
+        # Compare the top entities by depth score
+        top_findings = heapq.nlargest(8, findings, key=_by_depth)
 
-        pairs_done = 0
         max_pairs = min(settings.comparison_pairs, 10)
 
-        for i, finding_a in enumerate(top_findings):
-            for finding_b in top_findings[i+1:i+3]:  # Compare with next 2
-                if pairs_done >= max_pairs:
-                    break
-
-                await event_bus.emit_progress(
-                    mission.id, pairs_done + 1, max_pairs,
-                    f"Comparing: {finding_a.name} vs {finding_b.name}"
-                )
-
-                compare_text = await self._llm_query(
-                    f"Compare {finding_a.name} vs {finding_b.name}. "
-                    f"Which is better for different use cases? "
-                    f"Return JSON: {{\"winner_overall\": \"...\", \"comparison\": \"2-3 sentence comparison\"}}"
-                )
-                compare_data = self._parse_json_from_text(compare_text, {})
-
-                if isinstance(compare_data, dict):
-                    comparison_note = compare_data.get("comparison", "")
-                    finding_a.comparison_notes[finding_b.name] = comparison_note
-                    finding_b.comparison_notes[finding_a.name] = comparison_note
-
-                pairs_done += 1
-                await asyncio.sleep(settings.delay_between_queries_seconds)
+        # Each entity is compared with the next 2, up to max_pairs
+        pairs = [
+            (finding_a, finding_b)
+            for i, finding_a in enumerate(top_findings)
+            for finding_b in top_findings[i+1:i+3]
+        ][:max_pairs]
+
+        # Every pair is compared in one call instead of one call per entity
+        await event_bus.emit_progress(
+            mission.id, 1, 1,
+            f"Comparing {len(pairs)} pairs of top entities"
+        )
+        pair_lines = "\n".join(
+            f"{n}. {finding_a.name} vs {finding_b.name}"
+            for n, (finding_a, finding_b) in enumerate(pairs, 1)
+        )
+        compare_text = await self._llm_query(
+            f"Compare each of these pairs of products. "
+            f"Which is better for different use cases?\n{pair_lines}\n"
+            f"Return a JSON array with one entry per pair, in the same order: "
+            f"[{{\"entity\": \"...\", \"opponent\": \"...\", \"winner_overall\": \"...\", "
+            f"\"comparison\": \"2-3 sentence comparison\"}}]",
+            response_schema=_COMPARISON_SCHEMA
+        )
+        compare_data = await self._parse_json(compare_text, [])
+        if isinstance(compare_data, dict):
+            compare_data = [compare_data]  # Single pair answered as one object
+        if not isinstance(compare_data, list):
+            return findings
 
-            if pairs_done >= max_pairs:
-                break
+        # Entries are matched by pair names (either order), else by position
+        by_pair = {
+            frozenset((str(entry.get("entity", "")).strip().lower(),
+                       str(entry.get("opponent", "")).strip().lower())): entry
+            for entry in compare_data
+            if isinstance(entry, dict)
+        }
+        positional = len(compare_data) == len(pairs)
+        for n, (finding_a, finding_b) in enumerate(pairs):
+            entry = by_pair.get(frozenset((finding_a.name.lower(), finding_b.name.lower())))
+            if entry is None and positional and isinstance(compare_data[n], dict):
+                entry = compare_data[n]
+            if entry is not None:
+                comparison_note = entry.get("comparison", "")
+                finding_a.comparison_notes[finding_b.name] = comparison_note
+                finding_b.comparison_notes[finding_a.name] = comparison_note
 
         return findings
 
@@ -626,28 +1113,48 @@ Example: [{{"name": "Example", "category": "Software", "brief_description": "A t
     ) -> List[DeepFinding]:
         """Validate key claims for top findings."""
         # Only validate top findings
-        sorted_findings = sorted(findings, key=lambda f: f.depth_score, reverse=True)
-        to_validate = sorted_findings[:min(len(sorted_findings), 10)]
+        to_validate = heapq.nlargest(10, findings, key=_by_depth)
 
-        for i, finding in enumerate(to_validate):
-            await event_bus.emit_progress(
-                mission.id, i + 1, len(to_validate),
-                f"Validating: {finding.name}"
-            )
+        # Pricing is verified for several findings per call
+        with_pricing = [finding for finding in to_validate if finding.pricing]
+        batch_size = max(settings.validation_batch_size, 1)
+        batches = [with_pricing[i:i + batch_size] for i in range(0, len(with_pricing), batch_size)]
 
-            # Validate pricing if present
-            if finding.pricing:
-                validation_text = await self._llm_query(
-                    f"Verify the pricing information for {finding.name}. "
-                    f"Find official pricing from their website. "
-                    f"Return JSON: {{\"verified\": true/false, \"current_pricing\": \"...\", \"source\": \"...\"}}"
+        semaphore = asyncio.Semaphore(max(settings.max_concurrent_entities, 1))
+        progress = itertools.count(1)
+
+        async def validate(batch: List[DeepFinding]) -> None:
+            async with semaphore:
+                names = ", ".join(f.name for f in batch)
+                await event_bus.emit_progress(
+                    mission.id, next(progress), len(batches),
+                    f"Validating: {names}"
                 )
-                validation = self._parse_json_from_text(validation_text, {})
-                if validation.get("source"):
-                    finding.sources.append(str(validation.get("source")))
 
+                validation_text = await self._llm_query(
+                    f"Verify the pricing information for each of the following products: {names}. "
+                    f"Find official pricing from their websites. "
+                    f"Return a JSON array with one entry per product: "
+                    f"[{{\"name\": \"...\", \"verified\": true/false, \"current_pricing\": \"...\", \"source\": \"...\"}}]",
+                    response_schema=_VALIDATION_SCHEMA
+                )
+                validation = await self._parse_json(validation_text, [])
+                if isinstance(validation, dict):
+                    validation = [validation]  # Single product answered as one object
+                if isinstance(validation, list):
+                    by_name = _entries_by_name(validation, "name")
+                    for finding in batch:
+                        entry = by_name.get(finding.name.lower())
+                        if entry is None and len(batch) == 1 and len(validation) == 1:
+                            entry = validation[0] if isinstance(validation[0], dict) else None
+                        if entry is not None and entry.get("source"):
+                            finding.sources.append(str(entry.get("source")))
+
+        # Each batch touches only its own findings, so batches can run side by side
+        await asyncio.gather(*(validate(batch) for batch in batches))
+
+        for finding in to_validate:
             finding.source_count = len(finding.sources)
-            await asyncio.sleep(settings.delay_between_queries_seconds)
 
         return findings
 
@@ -659,6 +1166,24 @@ Example: [{{"name": "Example", "category": "Software", "brief_description": "A t
         self, mission: Mission, findings: List[DeepFinding]
     ) -> Dict:
         """Use LLM to evaluate content depth, not just field presence."""
+        avg_depth = sum(f.depth_score for f in findings) / len(findings) if findings else 0
+        threshold = settings.depth_score_threshold
+
+        # The local depth rubric already settles the clear case: when no finding
+        # is shallow and the average is comfortably high, skip the LLM round-trip
+        if not findings or (
+            avg_depth >= settings.acceptable_depth_score
+            and all(f.depth_score >= threshold for f in findings)
+        ):
+            return {
+                "overall_score": avg_depth,
+                "needs_more_depth": False,
+                "shallow_findings": [],
+                "missing_attributes": [],
+                "recommendations": [],
+                "average_depth_score": avg_depth
+            }
+
         # Prepare summary for evaluation
         summary = []
         for f in findings[:15]:
@@ -676,7 +1201,7 @@ Example: [{{"name": "Example", "category": "Software", "brief_description": "A t
 
 GOAL: {mission.goal}
 FINDINGS COUNT: {len(findings)}
-SAMPLE: {json.dumps(summary, indent=2)}
+SAMPLE: {dumps_compact(summary).decode()}
 
 Evaluate on:
 1. SPECIFICITY - Are details specific (actual prices, named features) or vague?
@@ -693,7 +1218,7 @@ Return JSON:
 }}"""
 
         text = await self._llm_query(prompt, use_search=False)
-        result = self._parse_json_from_text(text, {
+        result = await self._parse_json(text, {
             "overall_score": 0.7,
             "needs_more_depth": False,
             "shallow_findings": [],
@@ -701,8 +1226,6 @@ Return JSON:
             "recommendations": []
         })
 
-        # Calculate aggregate score
-        avg_depth = sum(f.depth_score for f in findings) / len(findings) if findings else 0
         result["average_depth_score"] = avg_depth
 
         return result
@@ -715,41 +1238,63 @@ Return JSON:
         self, mission: Mission, findings: List[DeepFinding], score_result: Dict
     ) -> List[DeepFinding]:
         """Re-research shallow findings with targeted queries."""
-        shallow_names = set(score_result.get("shallow_findings", []))
-        missing_attrs = score_result.get("missing_attributes", [])
+        # Built once: O(1) membership and no settings lookup per finding
+        shallow_names = frozenset(score_result.get("shallow_findings", ()))
+        missing_attrs = tuple(score_result.get("missing_attributes", ())[:3])
+        threshold = settings.depth_score_threshold
+
+        shallow = [
+            f for f in findings
+            if f.name in shallow_names or f.depth_score < threshold
+        ]
+
+        # One job per (finding, missing attribute), all dispatched together
+        jobs = [
+            (finding, attr)
+            for finding in shallow
+            for attr in missing_attrs
+            if (attr == "pricing" and not finding.pricing)
+            or (attr == "features" and len(finding.features) < 5)
+        ]
+        semaphore = asyncio.Semaphore(max(settings.max_concurrent_queries, 1))
+        progress = itertools.count(1)
 
-        for finding in findings:
-            if finding.name in shallow_names or finding.depth_score < settings.depth_score_threshold:
+        async def deepen(finding: DeepFinding, attr: str) -> Any:
+            async with semaphore:
                 await event_bus.emit_progress(
-                    mission.id, 0, 1,
-                    f"Deepening: {finding.name}"
+                    mission.id, next(progress), len(jobs),
+                    f"Deepening: {finding.name} ({attr})"
                 )
-
-                # Target missing attributes
-                for attr in missing_attrs[:3]:
-                    if attr == "pricing" and not finding.pricing:
-                        text = await self._llm_query(
-                            f"Find SPECIFIC pricing for {finding.name}. "
-                            f"Include exact prices, tiers, and what's included."
-                        )
-                        data = self._parse_json_from_text(text)
-                        if data:
-                            finding.pricing = self._sanitize_data(data)
-
-                    elif attr == "features" and len(finding.features) < 5:
-                        text = await self._llm_query(
-                            f"List SPECIFIC features of {finding.name}. "
-                            f"Not generic descriptions - actual capabilities."
-                        )
-                        features = self._parse_json_from_text(text, [])
-                        if features:
-                            finding.features.extend([str(f) for f in features[:10]])
-
-                    await asyncio.sleep(settings.delay_between_queries_seconds)
-
-                # Recalculate scores
-                finding.research_iterations += 1
-                finding.attribute_count = self._count_attributes(finding)
+                if attr == "pricing":
+                    text = await self._llm_query(
+                        f"Find SPECIFIC pricing for {finding.name}. "
+                        f"Include exact prices, tiers, and what's included."
+                    )
+                    return await self._parse_json(text, {})
+                text = await self._llm_query(
+                    f"List SPECIFIC features of {finding.name}. "
+                    f"Not generic descriptions - actual capabilities.",
+                    cache_ttl=settings.llm_cache_stable_ttl_seconds
+                )
+                return await self._parse_json(text, [])
+
+        results = await asyncio.gather(*(deepen(f, attr) for f, attr in jobs), return_exceptions=True)
+
+        # Mutations are applied after the gather, in job order
+        changed = set()
+        for (finding, attr), data in zip(jobs, results):
+            if attr == "pricing" and isinstance(data, dict) and data:
+                finding.pricing = data  # Parsed JSON is already plain data
+                changed.add(id(finding))
+            elif attr == "features" and isinstance(data, list) and data:
+                finding.features.extend([str(f) for f in data[:10]])
+                changed.add(id(finding))
+
+        # Each finding is rescored once, however many of its attributes came back;
+        # nothing new learned leaves the score and deepening stamp as they were
+        for finding in shallow:
+            finding.research_iterations += 1
+            if id(finding) in changed:
                 finding.depth_score = self._calculate_depth_score(finding)
                 finding.last_deepened = datetime.utcnow()
 
@@ -763,22 +1308,8 @@ Return JSON:
         self, mission: Mission, findings: List[DeepFinding], score_result: Dict
     ) -> Dict:
         """Generate comprehensive synthesis report from deep findings."""
-        # Prepare findings data
-        findings_data = []
-        for f in findings[:30]:
-            findings_data.append({
-                "name": f.name,
-                "category": f.category,
-                "description": f.description,
-                "pricing": f.pricing,
-                "features": f.features[:10],
-                "pros": f.pros[:5],
-                "cons": f.cons[:5],
-                "use_cases": f.use_cases[:5],
-                "target_audience": f.target_audience,
-                "competitors": f.competitors[:5],
-                "depth_score": f.depth_score
-            })
+        # Prepare findings data (truncated projections, empty fields dropped)
+        findings_data = [f.synthesis_view() for f in findings[:30]]
 
         prompt = f"""Create a comprehensive research report based on deep analysis.
 
@@ -788,7 +1319,7 @@ QUALITY METRICS:
 - Average depth score: {score_result.get('average_depth_score', 0):.2f}
 
 FINDINGS DATA:
-{json.dumps(findings_data, indent=2, default=str)}
+{dumps_compact(findings_data).decode()}
 
 Generate a detailed JSON report:
 {{
@@ -822,24 +1353,30 @@ Generate a detailed JSON report:
 
 Be SPECIFIC - use actual names, prices, and data from the findings."""
 
-        text = await self._llm_query(prompt, use_search=False)
-        synthesis = self._parse_json_from_text(text, self._generate_fallback_synthesis(mission, findings, score_result))
-
-        # Ensure synthesis is a dict (fallback if LLM returned a list)
-        if not isinstance(synthesis, dict):
-            synthesis = self._generate_fallback_synthesis(mission, findings, score_result)
+        text = await self._llm_query_streamed(
+            prompt, mission.id, use_search=False, json_output=True
+        )
+        synthesis = await self._parse_json(text, {})
+
+        # Fallback built only when needed: no reply, unparseable, or not an object.
+        # A parsed report is plain JSON data already; only the fallback (tuples,
+        # values taken from findings) goes through the sanitize walk
+        if not isinstance(synthesis, dict) or not synthesis:
+            synthesis = self._sanitize_data(
+                self._generate_fallback_synthesis(mission, findings, score_result)
+            )
 
         synthesis["generated_at"] = datetime.utcnow().isoformat()
         synthesis["total_findings_analyzed"] = len(findings)
         synthesis["average_depth_score"] = score_result.get("average_depth_score", 0)
 
-        return self._sanitize_data(synthesis)
+        return synthesis
 
     def _generate_fallback_synthesis(
         self, mission: Mission, findings: List[DeepFinding], score_result: Dict
     ) -> Dict:
         """Generate basic synthesis if LLM fails."""
-        top_items = sorted(findings, key=lambda f: f.depth_score, reverse=True)[:10]
+        top_items = heapq.nlargest(10, findings, key=_by_depth)
 
         return {
             "executive_summary": f"Deep research completed for: {mission.goal}. "
@@ -863,7 +1400,7 @@ Be SPECIFIC - use actual names, prices, and data from the findings."""
                 "headers": ["Name", "Category", "Depth Score"],
                 "rows": [[f.name, f.category, f"{f.depth_score:.2f}"] for f in top_items[:10]]
             },
-            "market_analysis": "See individual findings for detailed market analysis.",
+            **_FALLBACK_STATIC_FIELDS,
             "strengths_weaknesses": [
                 {
                     "name": f.name,
@@ -873,11 +1410,6 @@ Be SPECIFIC - use actual names, prices, and data from the findings."""
                 }
                 for f in top_items[:5]
             ],
-            "next_steps": [
-                "Review top recommendations in detail",
-                "Compare shortlisted options",
-                "Conduct trials with top picks"
-            ],
             "methodology": f"Deep research using {sum(f.research_iterations for f in findings)} targeted queries "
                           f"across {len(findings)} entities."
         }
@@ -888,29 +1420,19 @@ Be SPECIFIC - use actual names, prices, and data from the findings."""
 
     async def _export_results(self, mission: Mission) -> List[Dict]:
         """Export mission results to configured formats."""
-        from tools.file_export import FileExporter
-
-        exporter = FileExporter()
-        exports = []
-
         formats = mission.actions_config.get("export_formats", ["json", "md"])
 
-        for format in formats:
-            try:
-                result = await exporter.export(
-                    mission=mission,
-                    format=format,
-                    include_metadata=True
-                )
-                exports.append(result)
-            except Exception as e:
-                exports.append({
-                    "format": format,
-                    "status": "failed",
-                    "error": str(e)
-                })
-
-        return exports
+        # Formats are independent: write them concurrently
+        results = await asyncio.gather(*(
+            self.exporter.export(mission=mission, format=format, include_metadata=True)
+            for format in formats
+        ), return_exceptions=True)
+
+        return [
+            {"format": format, "status": "failed", "error": str(result)}
+            if isinstance(result, Exception) else result
+            for format, result in zip(formats, results)
+        ]
 
     # ===========================================
     # RESUME SUPPORT
@@ -1,14 +1,102 @@
 """
 CHRONICLE File Export Tools - Export deep research findings to various formats
 """
-import json
+import asyncio
 import csv
+import heapq
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import ClassVar, Optional, Dict, Any, List, Tuple
+from xml.sax.saxutils import escape
+
+from pydantic import TypeAdapter
 
 from config import settings
+from models._serde import dumps, dumps_compact
 from models.domain import Mission, DeepFinding
+from utils.log import get_logger
+
+log = get_logger(__name__)
+
+# Dumps a whole list of DeepFindings in one pydantic-core call
+_FINDINGS_ADAPTER = TypeAdapter(List[DeepFinding])
+
+# CSV list columns: (column, finding field, items joined with "; ")
+_CSV_LIST_COLUMNS = (
+    ("features_summary", "features", 5),
+    ("pros_summary", "pros", 3),
+    ("cons_summary", "cons", 3),
+    ("use_cases_summary", "use_cases", 3),
+    ("competitors_summary", "competitors", 5),
+    ("integrations_summary", "integrations", 5),
+    ("sources_list", "sources", 3),
+)
+
+# Pricing summary parts: (pricing key, label, whether the value follows the label)
+_PRICING_LABELS = (
+    ("free_tier", "Free tier available", False),
+    ("monthly", "Monthly", True),
+    ("annual", "Annual", True),
+    ("enterprise", "Enterprise", True),
+)
+
+# Numeric stats fields, fetched from a finding in one C-level call
+_stat_numbers = itemgetter("depth_score", "attribute_count", "source_count", "research_iterations")
+
+
+def _truncate(text: Optional[str], limit: int) -> str:
+    """At most `limit` characters of text ("" for a missing/None value); short text is returned as is."""
+    if not text:
+        return ""
+    return text if len(text) <= limit else text[:limit]
+
+
+@lru_cache(maxsize=1)
+def _reportlab() -> SimpleNamespace:
+    """
+    The reportlab names the PDF export uses, imported on first use.
+
+    reportlab is optional and heavy to import, so JSON/CSV/Markdown exports
+    never load it; raises ImportError when it is not installed.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import (
+        SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, ListFlowable, ListItem
+    )
+    return SimpleNamespace(
+        colors=colors, letter=letter, inch=inch,
+        getSampleStyleSheet=getSampleStyleSheet, ParagraphStyle=ParagraphStyle,
+        SimpleDocTemplate=SimpleDocTemplate, Paragraph=Paragraph, Spacer=Spacer, Table=Table,
+        TableStyle=TableStyle, PageBreak=PageBreak, ListFlowable=ListFlowable, ListItem=ListItem,
+    )
+
+
+def _comparison_row(finding: Dict[str, Any], get=dict.get) -> Tuple[str, str, str, str, str]:
+    """Cells of a finding's row in the PDF comparison table (fixed five-column schema)."""
+    return (
+        _truncate(get(finding, "name", "Unknown"), 25),
+        _truncate(get(finding, "category", "-"), 12),
+        f"{get(finding, 'depth_score', 0):.2f}",
+        "Yes" if get(finding, "pricing") else "No",
+        str(len(get(finding, "features") or ())),
+    )
+
+
+def _depth_score(finding: Dict[str, Any]) -> float:
+    """Sort key for top-finding selections (normalized findings are dicts)."""
+    return finding.get("depth_score", 0)
 
 
 class FileExporter:
@@ -19,19 +107,28 @@ class FileExporter:
     Optimized for rich DeepFinding data with pricing, features, pros/cons, etc.
     """
 
+    # reportlab styles are constants: built on the first PDF export by any
+    # exporter and shared by all of them (reportlab stays an optional import)
+    _pdf_styles: ClassVar[Optional[Tuple[Any, Any, Any, Any, Any]]] = None
+    _pdf_table_styles: ClassVar[Optional[Tuple[Any, Any]]] = None
+    _paragraph_frags: ClassVar[Dict[Tuple[str, str], Tuple[Any, List[Any]]]] = {}
+
     def __init__(self, export_dir: Path = None):
         self.export_dir = export_dir or settings.export_dir
         self.export_dir.mkdir(parents=True, exist_ok=True)
 
+        # (findings list, its length, normalized dicts) for the last mission exported
+        self._normalized: Optional[Tuple[List[Any], int, List[Dict[str, Any]]]] = None
+
     def _get_mission_dir(self, mission_id: str) -> Path:
         """Get export directory for a mission."""
         path = self.export_dir / mission_id
         path.mkdir(parents=True, exist_ok=True)
         return path
 
-    def _generate_filename(self, mission: Mission, format: str, prefix: str = None) -> str:
+    def _generate_filename(self, mission: Mission, format: str, prefix: str = None, now: datetime = None) -> str:
         """Generate a unique filename for export."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = (now or datetime.now()).strftime("%Y%m%d_%H%M%S")
         base = prefix or f"chronicle_{mission.id}"
         return f"{base}_{timestamp}.{format}"
 
@@ -50,6 +147,29 @@ class FileExporter:
         else:
             return {"name": str(finding), "description": ""}
 
+    def _normalize_all(self, mission: Mission) -> List[Dict[str, Any]]:
+        """
+        The mission's findings as dicts, normalized once per findings snapshot.
+
+        Every format of one export run (and repeat exports of an unchanged
+        mission) reuses the same list instead of re-dumping DeepFindings.
+        """
+        source = mission.findings
+        cached = self._normalized
+        if cached is not None and cached[0] is source and cached[1] == len(source):
+            return cached[2]
+        # Findings lists hold one type in practice: dispatch once on it, and
+        # only fall back to per-element checks for mixed lists
+        types = set(map(type, source))
+        if types == {dict}:
+            normalized = list(source)
+        elif types == {DeepFinding}:
+            normalized = _FINDINGS_ADAPTER.dump_python(source)
+        else:
+            normalized = [self._normalize_finding(f) for f in source]
+        self._normalized = (source, len(source), normalized)  # One atomic swap (formats run in threads)
+        return normalized
+
     def _safe_get(self, obj, key, default=None):
         """Safely get a value from an object, handling non-dict types."""
         if isinstance(obj, dict):
@@ -85,8 +205,19 @@ class FileExporter:
             }
 
         try:
-            result = await exporter(mission, include_metadata, filename_prefix)
-            return result
+            if format == "pdf":
+                # reportlab layout is CPU-bound Python: render in a worker process
+                # so concurrent PDF exports use separate cores instead of sharing the GIL
+                try:
+                    return await asyncio.get_running_loop().run_in_executor(
+                        _get_pdf_pool(), _export_pdf_in_process,
+                        self.export_dir, mission, include_metadata, filename_prefix
+                    )
+                except BrokenProcessPool as e:
+                    log.warning("PDF worker pool failed (%s); rendering in a thread", e)
+                    shutdown_pdf_pool()
+            # Format writers are blocking (file and PDF I/O): run them off the event loop
+            return await asyncio.to_thread(exporter, mission, include_metadata, filename_prefix)
         except Exception as e:
             return {
                 "status": "failed",
@@ -94,7 +225,7 @@ class FileExporter:
                 "error": str(e)
             }
 
-    async def _export_json(
+    def _export_json(
         self,
         mission: Mission,
         include_metadata: bool,
@@ -102,11 +233,12 @@ class FileExporter:
     ) -> Dict[str, Any]:
         """Export to JSON format with full deep research data."""
         mission_dir = self._get_mission_dir(mission.id)
-        filename = self._generate_filename(mission, "json", filename_prefix)
+        now = datetime.now()  # One clock read for the file name and export id
+        filename = self._generate_filename(mission, "json", filename_prefix, now)
         filepath = mission_dir / filename
 
         # Normalize findings
-        normalized_findings = [self._normalize_finding(f) for f in mission.findings]
+        normalized_findings = self._normalize_all(mission)
 
         data = {
             "synthesis": mission.synthesis if mission.synthesis else {},
@@ -122,23 +254,23 @@ class FileExporter:
                 "total_findings": len(mission.findings),
                 "deep_findings_count": sum(1 for f in normalized_findings if f.get("depth_score", 0) > 0.5),
                 "has_synthesis": mission.synthesis is not None,
-                "created_at": mission.created_at.isoformat(),
-                "exported_at": datetime.utcnow().isoformat(),
+                "created_at": mission.created_at,  # orjson encodes datetimes natively
+                "exported_at": datetime.utcnow(),
                 "research_depth": getattr(mission, 'depth', 'deep')
             }
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+        payload = dumps(data)
+        filepath.write_bytes(payload)
 
         return {
             "status": "success",
             "format": "json",
             "action_type": "export",
-            "id": f"exp_{datetime.now().strftime('%H%M%S')}",
+            "id": f"exp_{now:%H%M%S}",
             "file_path": str(filepath),
             "file_url": f"/exports/{mission.id}/{filename}",
             "records_exported": len(mission.findings),
-            "file_size_bytes": filepath.stat().st_size
+            "file_size_bytes": len(payload)  # Bytes just written; no stat() needed
         }
 
     def _calculate_research_stats(self, findings: List[Dict]) -> Dict[str, Any]:
@@ -146,22 +278,43 @@ class FileExporter:
         if not findings:
             return {"total": 0}
 
-        depth_scores = [f.get("depth_score", 0) for f in findings]
-        attr_counts = [f.get("attribute_count", 0) for f in findings]
-        source_counts = [f.get("source_count", 0) for f in findings]
-
+        # One pass over the findings, accumulating every total at once
+        depth_total = attr_total = source_total = iteration_total = 0
+        high_quality = with_pricing = with_features = with_pros_cons = 0
+        for f in findings:
+            get = f.get
+            try:
+                depth, attrs, sources, iterations = _stat_numbers(f)
+            except KeyError:  # Raw finding dicts may lack the scored keys
+                depth, attrs, sources = get("depth_score", 0), get("attribute_count", 0), get("source_count", 0)
+                iterations = get("research_iterations", 0)
+            depth_total += depth
+            attr_total += attrs
+            source_total += sources
+            iteration_total += iterations
+            if depth >= 0.7:
+                high_quality += 1
+            if get("pricing"):
+                with_pricing += 1
+            if get("features"):
+                with_features += 1
+            if get("pros") or get("cons"):
+                with_pros_cons += 1
+
+        count = len(findings)
         return {
-            "total_findings": len(findings),
-            "avg_depth_score": sum(depth_scores) / len(depth_scores) if depth_scores else 0,
-            "avg_attributes": sum(attr_counts) / len(attr_counts) if attr_counts else 0,
-            "avg_sources": sum(source_counts) / len(source_counts) if source_counts else 0,
-            "high_quality_count": sum(1 for s in depth_scores if s >= 0.7),
-            "with_pricing": sum(1 for f in findings if f.get("pricing")),
-            "with_features": sum(1 for f in findings if f.get("features")),
-            "with_pros_cons": sum(1 for f in findings if f.get("pros") or f.get("cons")),
+            "total_findings": count,
+            "avg_depth_score": depth_total / count,
+            "avg_attributes": attr_total / count,
+            "avg_sources": source_total / count,
+            "high_quality_count": high_quality,
+            "with_pricing": with_pricing,
+            "with_features": with_features,
+            "with_pros_cons": with_pros_cons,
+            "total_iterations": iteration_total,
         }
 
-    async def _export_csv(
+    def _export_csv(
         self,
         mission: Mission,
         include_metadata: bool,
@@ -169,10 +322,11 @@ class FileExporter:
     ) -> Dict[str, Any]:
         """Export to CSV format optimized for DeepFinding data."""
         mission_dir = self._get_mission_dir(mission.id)
-        filename = self._generate_filename(mission, "csv", filename_prefix)
+        now = datetime.now()  # One clock read for the file name and export id
+        filename = self._generate_filename(mission, "csv", filename_prefix, now)
         filepath = mission_dir / filename
 
-        findings = [self._normalize_finding(f) for f in mission.findings]
+        findings = self._normalize_all(mission)
         if not findings:
             with open(filepath, "w", encoding="utf-8", newline="") as f:
                 f.write("No findings to export\n")
@@ -180,7 +334,7 @@ class FileExporter:
                 "status": "success",
                 "format": "csv",
                 "action_type": "export",
-                "id": f"exp_{datetime.now().strftime('%H%M%S')}",
+                "id": f"exp_{now:%H%M%S}",
                 "file_path": str(filepath),
                 "file_url": f"/exports/{mission.id}/{filename}",
                 "records_exported": 0
@@ -194,61 +348,87 @@ class FileExporter:
             "founded", "funding", "integrations_summary", "reviews_summary",
             "source_count", "sources_list"
         ]
-
-        # Flatten complex fields for CSV
+        # Each row holds the scalar columns, then the list columns in table order
+        row_names = [
+            "name", "category", "description", "depth_score", "attribute_count", "website",
+            "pricing_summary", "target_audience", "founded", "funding", "reviews_summary",
+            "source_count"
+        ] + [column for column, _, _ in _CSV_LIST_COLUMNS]
+        column_count = len(row_names)
+
+        # Flatten complex fields for CSV, noting in the same pass which
+        # columns ever hold a value
         csv_rows = []
+        filled = set()
+        pricing_cache: Dict[bytes, str] = {}
         for finding in findings:
-            row = {
-                "name": finding.get("name", ""),
-                "category": finding.get("category", ""),
-                "description": finding.get("description", "")[:500],  # Truncate
-                "depth_score": f"{finding.get('depth_score', 0):.2f}",
-                "attribute_count": finding.get("attribute_count", 0),
-                "website": finding.get("website", ""),
-                "target_audience": finding.get("target_audience", ""),
-                "founded": finding.get("founded", ""),
-                "funding": finding.get("funding", ""),
-                "reviews_summary": finding.get("reviews_summary", "")[:300],
-                "source_count": finding.get("source_count", 0),
-            }
+            get = finding.get
 
             # Flatten pricing dict
-            pricing = finding.get("pricing", {})
+            pricing = get("pricing", {})
             if isinstance(pricing, dict):
-                row["pricing_summary"] = self._format_pricing_summary(pricing)
+                pricing_summary = self._format_pricing_cached(pricing, pricing_cache)
             else:
-                row["pricing_summary"] = str(pricing) if pricing else ""
-
+                pricing_summary = str(pricing) if pricing else ""
+
+            row = [
+                get("name", ""),
+                get("category", ""),
+                _truncate(get("description"), 500),
+                f"{get('depth_score', 0):.2f}",
+                get("attribute_count", 0),
+                get("website", ""),
+                pricing_summary,
+                get("target_audience", ""),
+                get("founded", ""),
+                get("funding", ""),
+                _truncate(get("reviews_summary"), 300),
+                get("source_count", 0),
+            ]
             # Flatten lists
-            row["features_summary"] = "; ".join(finding.get("features", [])[:5])
-            row["pros_summary"] = "; ".join(finding.get("pros", [])[:3])
-            row["cons_summary"] = "; ".join(finding.get("cons", [])[:3])
-            row["use_cases_summary"] = "; ".join(finding.get("use_cases", [])[:3])
-            row["competitors_summary"] = "; ".join(finding.get("competitors", [])[:5])
-            row["integrations_summary"] = "; ".join(finding.get("integrations", [])[:5])
-            row["sources_list"] = "; ".join(finding.get("sources", [])[:3])
+            for _, field, limit in _CSV_LIST_COLUMNS:
+                values = get(field)
+                row.append("; ".join(values[:limit]) if values else "")
 
+            if len(filled) < column_count:
+                filled.update(i for i, value in enumerate(row) if value)
             csv_rows.append(row)
 
-        # Write CSV
-        fieldnames = [col for col in preferred_order if any(row.get(col) for row in csv_rows)]
+        # Write CSV (only columns with data, in preferred order)
+        columns = sorted(filled, key=lambda i: preferred_order.index(row_names[i]))
 
-        with open(filepath, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-            writer.writeheader()
-            writer.writerows(csv_rows)
+        with open(filepath, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow([row_names[i] for i in columns])
+            writer.writerows([row[i] for i in columns] for row in csv_rows)
+            file_size = f.tell()  # Write-only UTF-8 stream: tell() is the byte offset
 
         return {
             "status": "success",
             "format": "csv",
             "action_type": "export",
-            "id": f"exp_{datetime.now().strftime('%H%M%S')}",
+            "id": f"exp_{now:%H%M%S}",
             "file_path": str(filepath),
             "file_url": f"/exports/{mission.id}/{filename}",
             "records_exported": len(findings),
-            "file_size_bytes": filepath.stat().st_size
+            "file_size_bytes": file_size
         }
 
+    def _format_pricing_cached(self, pricing, cache: Dict[bytes, str]) -> str:
+        """
+        _format_pricing_summary memoized in `cache` (one dict per export).
+
+        Findings in a mission often share the same pricing blob ("Free",
+        "Contact sales"); dicts are keyed by their compact JSON encoding.
+        """
+        if not pricing or not isinstance(pricing, dict):
+            return self._format_pricing_summary(pricing)
+        key = dumps_compact(pricing)
+        summary = cache.get(key)
+        if summary is None:
+            summary = cache[key] = self._format_pricing_summary(pricing)
+        return summary
+
     def _format_pricing_summary(self, pricing) -> str:
         """Format pricing dict into readable summary."""
         if not pricing:
@@ -260,22 +440,18 @@ class FileExporter:
             return pricing
         if not isinstance(pricing, dict):
             return str(pricing)
+        get = pricing.get
         parts = []
-        if pricing.get("free_tier"):
-            parts.append("Free tier available")
-        if pricing.get("monthly"):
-            parts.append(f"Monthly: {pricing['monthly']}")
-        if pricing.get("annual"):
-            parts.append(f"Annual: {pricing['annual']}")
-        if pricing.get("enterprise"):
-            parts.append(f"Enterprise: {pricing['enterprise']}")
-        if pricing.get("tiers"):
-            tiers = pricing["tiers"]
-            if isinstance(tiers, list):
-                parts.append(f"Tiers: {', '.join(str(t) for t in tiers[:3])}")
-        return " | ".join(parts) if parts else json.dumps(pricing)
-
-    async def _export_markdown(
+        for key, label, show_value in _PRICING_LABELS:
+            value = get(key)
+            if value:
+                parts.append(f"{label}: {value}" if show_value else label)
+        tiers = get("tiers")
+        if tiers and isinstance(tiers, list):
+            parts.append(f"Tiers: {', '.join(str(t) for t in tiers[:3])}")
+        return " | ".join(parts) if parts else dumps_compact(pricing).decode()
+
+    def _export_markdown(
         self,
         mission: Mission,
         include_metadata: bool,
@@ -283,10 +459,11 @@ class FileExporter:
     ) -> Dict[str, Any]:
         """Export to rich Markdown format showcasing deep research data."""
         mission_dir = self._get_mission_dir(mission.id)
-        filename = self._generate_filename(mission, "md", filename_prefix)
+        now = datetime.now()  # One clock read for the file name and export id
+        filename = self._generate_filename(mission, "md", filename_prefix, now)
         filepath = mission_dir / filename
 
-        findings = [self._normalize_finding(f) for f in mission.findings]
+        findings = self._normalize_all(mission)
         stats = self._calculate_research_stats(findings)
 
         lines = []
@@ -319,15 +496,15 @@ class FileExporter:
             lines.extend(self._render_synthesis_markdown(syn))
 
         # Quick Comparison Table (top findings)
-        top_findings = sorted(findings, key=lambda f: f.get("depth_score", 0) if isinstance(f, dict) else 0, reverse=True)[:10]
+        top_findings = heapq.nlargest(10, findings, key=_depth_score)
         if top_findings:
             lines.append("## Quick Comparison: Top Findings")
             lines.append("")
             lines.append("| Name | Category | Depth Score | Has Pricing | Features | Pros | Cons |")
             lines.append("|------|----------|-------------|-------------|----------|------|------|")
             for f in top_findings:
-                name = f.get("name", "Unknown")[:30]
-                cat = f.get("category", "-")[:15]
+                name = _truncate(f.get("name", "Unknown"), 30)
+                cat = _truncate(f.get("category", "-"), 15)
                 score = f"{f.get('depth_score', 0):.2f}"
                 has_pricing = "Yes" if f.get("pricing") else "No"
                 feat_count = len(f.get("features", []))
@@ -342,41 +519,54 @@ class FileExporter:
         lines.append("## Detailed Research Findings")
         lines.append("")
 
-        for i, finding in enumerate(findings, 1):
-            lines.extend(self._render_finding_markdown(i, finding))
+        # The report is written section by section through a large buffer
+        # instead of joined into one string first (the findings dominate it).
+        # Binary mode: each section is encoded in one call, with no newline
+        # translation or per-line encoding in a text wrapper
+        with open(filepath, "wb", buffering=1 << 20) as out:
+            def write_section(section: List[str]) -> None:
+                out.write(("\n".join(section) + "\n").encode("utf-8"))
+
+            write_section(lines)
+
+            for i, finding in enumerate(findings, 1):
+                write_section(self._render_finding_markdown(i, finding))
+
+            lines = []
+
+            # Sources
+            # Dedupe on the fly (dict keys keep first-seen order), stopping at 50
+            unique_sources = {}
+            for source in chain.from_iterable(f.get("sources") or () for f in findings):
+                unique_sources[source] = None
+                if len(unique_sources) == 50:
+                    break
+            if unique_sources:
+                lines.append("---")
+                lines.append("")
+                lines.append("## Sources & References")
+                lines.append("")
+                for source in unique_sources:
+                    lines.append(f"- {source}")
+                lines.append("")
 
-        # Sources
-        all_sources = []
-        for f in findings:
-            all_sources.extend(f.get("sources", []))
-        if all_sources:
-            lines.append("---")
-            lines.append("")
-            lines.append("## Sources & References")
+            # Footer
             lines.append("")
-            unique_sources = list(dict.fromkeys(all_sources))[:50]  # Dedupe, limit to 50
-            for source in unique_sources:
-                lines.append(f"- {source}")
-            lines.append("")
-
-        # Footer
-        lines.append("")
-        lines.append("---")
-        lines.append("*Generated by CHRONICLE - Marathon Research-to-Action Agent*")
-        lines.append(f"*Research completed with {sum(f.get('research_iterations', 0) for f in findings)} total queries*")
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+            lines.append("---")
+            lines.append("*Generated by CHRONICLE - Marathon Research-to-Action Agent*")
+            lines.append(f"*Research completed with {stats.get('total_iterations', 0)} total queries*")
+            write_section(lines)
+            file_size = out.tell()
 
         return {
             "status": "success",
             "format": "markdown",
             "action_type": "export",
-            "id": f"exp_{datetime.now().strftime('%H%M%S')}",
+            "id": f"exp_{now:%H%M%S}",
             "file_path": str(filepath),
             "file_url": f"/exports/{mission.id}/{filename}",
             "records_exported": len(mission.findings),
-            "file_size_bytes": filepath.stat().st_size
+            "file_size_bytes": file_size
         }
 
     def _render_synthesis_markdown(self, syn: Dict) -> List[str]:
@@ -463,38 +653,39 @@ class FileExporter:
             lines.append("")
             return lines
 
-        name = finding.get("name", "Unknown")
-        category = finding.get("category", "")
-        depth_score = finding.get("depth_score", 0)
+        # Sections are emitted as multi-line blocks (the caller joins entries
+        # with newlines), so a finding is a handful of appends, not dozens
+        get = finding.get
+        name = get("name", "Unknown")
+        category = get("category", "")
+        depth_score = get("depth_score", 0)
 
         # Header with badge
         badge = "Deep" if depth_score >= 0.7 else "Moderate" if depth_score >= 0.4 else "Basic"
-        lines.append(f"### {index}. {name}")
         if category:
-            lines.append(f"**Category:** {category} | **Depth:** {badge} ({depth_score:.2f})")
+            depth_line = f"**Category:** {category} | **Depth:** {badge} ({depth_score:.2f})"
         else:
-            lines.append(f"**Depth:** {badge} ({depth_score:.2f})")
-        lines.append("")
+            depth_line = f"**Depth:** {badge} ({depth_score:.2f})"
+        block = f"### {index}. {name}\n{depth_line}\n"
 
         # Description
-        if finding.get("description"):
-            lines.append(finding["description"])
-            lines.append("")
+        if get("description"):
+            block += f"\n{finding['description']}\n"
 
         # Website & Basic Info
         info_parts = []
-        if finding.get("website"):
+        if get("website"):
             info_parts.append(f"[Website]({finding['website']})")
-        if finding.get("founded"):
+        if get("founded"):
             info_parts.append(f"Founded: {finding['founded']}")
-        if finding.get("funding"):
+        if get("funding"):
             info_parts.append(f"Funding: {finding['funding']}")
         if info_parts:
-            lines.append(" | ".join(info_parts))
-            lines.append("")
+            block += f"\n{' | '.join(info_parts)}\n"
+        lines.append(block)
 
         # Pricing Table
-        pricing = finding.get("pricing", {})
+        pricing = get("pricing", {})
         if pricing and isinstance(pricing, dict):
             lines.append("#### Pricing")
             lines.append("")
@@ -521,19 +712,17 @@ class FileExporter:
             lines.append("")
 
         # Features
-        features = finding.get("features", [])
+        features = get("features", [])
         if features:
-            lines.append("#### Key Features")
-            lines.append("")
-            for feat in features[:10]:  # Limit to 10
-                lines.append(f"- {feat}")
-            if len(features) > 10:
-                lines.append(f"- *...and {len(features) - 10} more*")
-            lines.append("")
+            block = "#### Key Features\n\n" + "\n".join([f"- {feat}" for feat in features[:10]])  # Limit to 10
+            extra = len(features) - 10
+            if extra > 0:
+                block += f"\n- *...and {extra} more*"
+            lines.append(block + "\n")
 
         # Pros & Cons side by side
-        pros = finding.get("pros", [])
-        cons = finding.get("cons", [])
+        pros = get("pros", [])
+        cons = get("cons", [])
         if pros or cons:
             lines.append("#### Pros & Cons")
             lines.append("")
@@ -547,40 +736,30 @@ class FileExporter:
             lines.append("")
 
         # Use Cases
-        use_cases = finding.get("use_cases", [])
+        use_cases = get("use_cases", [])
         if use_cases:
-            lines.append("#### Best For")
-            lines.append("")
-            for uc in use_cases[:5]:
-                lines.append(f"- {uc}")
-            lines.append("")
+            lines.append("#### Best For\n\n" + "\n".join([f"- {uc}" for uc in use_cases[:5]]) + "\n")
 
         # Target Audience
-        if finding.get("target_audience"):
-            lines.append(f"**Target Audience:** {finding['target_audience']}")
-            lines.append("")
+        if get("target_audience"):
+            lines.append(f"**Target Audience:** {finding['target_audience']}\n")
 
         # Competitors
-        competitors = finding.get("competitors", [])
+        competitors = get("competitors", [])
         if competitors:
-            lines.append(f"**Competitors:** {', '.join(competitors[:5])}")
-            lines.append("")
+            lines.append(f"**Competitors:** {', '.join(competitors[:5])}\n")
 
         # Integrations
-        integrations = finding.get("integrations", [])
+        integrations = get("integrations", [])
         if integrations:
-            lines.append(f"**Integrations:** {', '.join(integrations[:8])}")
-            lines.append("")
+            lines.append(f"**Integrations:** {', '.join(integrations[:8])}\n")
 
         # Reviews Summary
-        if finding.get("reviews_summary"):
-            lines.append("#### User Reviews Summary")
-            lines.append("")
-            lines.append(f"*{finding['reviews_summary']}*")
-            lines.append("")
+        if get("reviews_summary"):
+            lines.append(f"#### User Reviews Summary\n\n*{finding['reviews_summary']}*\n")
 
         # Comparison Notes (if any)
-        comparison_notes = finding.get("comparison_notes", {})
+        comparison_notes = get("comparison_notes", {})
         if comparison_notes and isinstance(comparison_notes, dict):
             lines.append("#### Comparison Notes")
             lines.append("")
@@ -595,14 +774,148 @@ class FileExporter:
             lines.append("")
 
         # Research metadata
-        lines.append(f"*Research iterations: {finding.get('research_iterations', 0)} | Attributes: {finding.get('attribute_count', 0)} | Sources: {finding.get('source_count', 0)}*")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        lines.append(
+            f"*Research iterations: {get('research_iterations', 0)} | Attributes: {get('attribute_count', 0)} "
+            f"| Sources: {get('source_count', 0)}*\n\n---\n"
+        )
 
         return lines
 
-    async def _export_pdf(
+    def _render_finding_pdf(self, finding: Dict[str, Any], pricing_cache: Dict[bytes, str]) -> str:
+        """
+        Paragraph markup for a finding's body in the PDF report.
+
+        Category, description, pricing, features and pros/cons go into one
+        Paragraph (lines split by <br/>) instead of one Paragraph each.
+        """
+        get = finding.get
+        parts = []
+
+        category = get("category")
+        if category:
+            parts.append(
+                f'<font size="12" color="grey"><i>Category: {escape(str(category))} | '
+                f'Depth Score: {get("depth_score", 0):.2f}</i></font>'
+            )
+        parts.append(escape(_truncate(get("description", "No description"), 300)))
+
+        # Pricing summary
+        pricing = get("pricing", {})
+        if pricing:
+            parts.append(f"<b>Pricing:</b> {escape(self._format_pricing_cached(pricing, pricing_cache))}")
+
+        # Features (brief)
+        features = get("features", [])
+        if features:
+            feat_text = escape(", ".join(islice(features, 5)))
+            extra = len(features) - 5
+            if extra > 0:
+                feat_text += f" (+{extra} more)"
+            parts.append(f"<b>Features:</b> {feat_text}")
+
+        # Pros/Cons summary
+        pros = get("pros", [])
+        cons = get("cons", [])
+        if pros:
+            parts.append(f"<b>Pros:</b> {escape('; '.join(islice(pros, 3)))}")
+        if cons:
+            parts.append(f"<b>Cons:</b> {escape('; '.join(islice(cons, 3)))}")
+
+        return "<br/>".join(parts)
+
+    def _get_pdf_styles(self) -> Tuple[Any, Any, Any, Any, Any]:
+        """
+        (stylesheet, title, subtitle, section, finding body) styles for PDF reports.
+
+        Built on the first PDF export and shared by every exporter; reportlab
+        only reads them while laying out a document.
+        """
+        if self._pdf_styles is None:
+            rl = _reportlab()
+            colors, ParagraphStyle = rl.colors, rl.ParagraphStyle
+
+            styles = rl.getSampleStyleSheet()
+
+            # Custom styles
+            title_style = ParagraphStyle(
+                'CustomTitle',
+                parent=styles['Heading1'],
+                fontSize=24,
+                spaceAfter=30,
+                textColor=colors.HexColor('#1a365d')
+            )
+            subtitle_style = ParagraphStyle(
+                'SubTitle',
+                parent=styles['Normal'],
+                fontSize=12,
+                textColor=colors.grey
+            )
+            section_style = ParagraphStyle(
+                'Section',
+                parent=styles['Heading2'],
+                fontSize=16,
+                spaceBefore=20,
+                spaceAfter=10,
+                textColor=colors.HexColor('#2c5282')
+            )
+            # Finding bodies carry the gap before the next finding (no Spacer flowable)
+            finding_style = ParagraphStyle(
+                'FindingBody',
+                parent=styles['Normal'],
+                spaceAfter=15
+            )
+            FileExporter._pdf_styles = (styles, title_style, subtitle_style, section_style, finding_style)
+        return self._pdf_styles
+
+    def _fixed_paragraph(self, text: str, style) -> Any:
+        """
+        Paragraph for constant text (headings, footer), parsing its markup once.
+
+        A Paragraph can't be shared between documents (wrapping stores layout
+        state on it), so the parsed style and fragments are cached instead and
+        each report gets a fresh Paragraph built from them.
+        """
+        Paragraph = _reportlab().Paragraph
+
+        key = (text, style.name)
+        cached = self._paragraph_frags.get(key)
+        if cached is None:
+            paragraph = Paragraph(text, style)
+            self._paragraph_frags[key] = (paragraph.style, paragraph.frags)
+            return paragraph
+        parsed_style, frags = cached
+        return Paragraph(text, parsed_style, frags=frags)
+
+    def _get_pdf_table_styles(self) -> Tuple[Any, Any]:
+        """(quality metrics, comparison) TableStyles, built once like the paragraph styles."""
+        if self._pdf_table_styles is None:
+            rl = _reportlab()
+            colors, TableStyle = rl.colors, rl.TableStyle
+
+            # Palette shared by both tables, resolved once
+            header, header_text, grid = colors.HexColor('#2c5282'), colors.whitesmoke, colors.grey
+            row_backgrounds = [colors.white, colors.HexColor('#f7fafc')]
+
+            quality = TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), header),
+                ('TEXTCOLOR', (0, 0), (-1, 0), header_text),
+                ('BACKGROUND', (0, 1), (0, -1), colors.HexColor('#e2e8f0')),
+                ('GRID', (0, 0), (-1, -1), 0.5, grid),
+                ('PADDING', (0, 0), (-1, -1), 8),
+                ('ALIGN', (1, 0), (1, -1), 'CENTER'),
+            ])
+            comparison = TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), header),
+                ('TEXTCOLOR', (0, 0), (-1, 0), header_text),
+                ('FONTSIZE', (0, 0), (-1, -1), 9),
+                ('GRID', (0, 0), (-1, -1), 0.5, grid),
+                ('PADDING', (0, 0), (-1, -1), 6),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), row_backgrounds),
+            ])
+            FileExporter._pdf_table_styles = (quality, comparison)
+        return self._pdf_table_styles
+
+    def _export_pdf(
         self,
         mission: Mission,
         include_metadata: bool,
@@ -610,11 +923,7 @@ class FileExporter:
     ) -> Dict[str, Any]:
         """Export to PDF format with rich DeepFinding data."""
         try:
-            from reportlab.lib import colors
-            from reportlab.lib.pagesizes import letter
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.lib.units import inch
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+            rl = _reportlab()
         except ImportError:
             return {
                 "status": "failed",
@@ -622,52 +931,40 @@ class FileExporter:
                 "error": "reportlab not installed. Install with: pip install reportlab"
             }
 
+        letter, inch = rl.letter, rl.inch
+        SimpleDocTemplate, Paragraph, Spacer, Table = rl.SimpleDocTemplate, rl.Paragraph, rl.Spacer, rl.Table
+        PageBreak, ListFlowable, ListItem = rl.PageBreak, rl.ListFlowable, rl.ListItem
+
         mission_dir = self._get_mission_dir(mission.id)
-        filename = self._generate_filename(mission, "pdf", filename_prefix)
+        now = datetime.now()  # One clock read for the file name and export id
+        filename = self._generate_filename(mission, "pdf", filename_prefix, now)
         filepath = mission_dir / filename
 
-        findings = [self._normalize_finding(f) for f in mission.findings]
+        findings = self._normalize_all(mission)
         stats = self._calculate_research_stats(findings)
 
-        doc = SimpleDocTemplate(str(filepath), pagesize=letter)
-        styles = getSampleStyleSheet()
-
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            textColor=colors.HexColor('#1a365d')
-        )
-        subtitle_style = ParagraphStyle(
-            'SubTitle',
-            parent=styles['Normal'],
-            fontSize=12,
-            textColor=colors.grey
-        )
-        section_style = ParagraphStyle(
-            'Section',
-            parent=styles['Heading2'],
-            fontSize=16,
-            spaceBefore=20,
-            spaceAfter=10,
-            textColor=colors.HexColor('#2c5282')
-        )
+        # Rendered in memory and written with one write, not reportlab's many small ones
+        buffer = io.BytesIO()
+        doc = SimpleDocTemplate(buffer, pagesize=letter)
+        styles, title_style, subtitle_style, section_style, finding_style = self._get_pdf_styles()
+        quality_table_style, comparison_table_style = self._get_pdf_table_styles()
 
+        # Fixed runs of flowables are added with one extend() each
         story = []
+        fixed_paragraph = self._fixed_paragraph
 
         # Title Page
-        story.append(Paragraph("CHRONICLE", title_style))
-        story.append(Paragraph("Deep Research Report", subtitle_style))
-        story.append(Spacer(1, 20))
-        story.append(Paragraph(f"<b>Research Goal:</b> {mission.goal}", styles['Normal']))
-        story.append(Paragraph(f"<b>Mission ID:</b> {mission.id}", styles['Normal']))
-        story.append(Paragraph(f"<b>Generated:</b> {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}", styles['Normal']))
-        story.append(Spacer(1, 30))
+        story.extend((
+            fixed_paragraph("CHRONICLE", title_style),
+            fixed_paragraph("Deep Research Report", subtitle_style),
+            Spacer(1, 20),
+            Paragraph(f"<b>Research Goal:</b> {escape(mission.goal)}", styles['Normal']),
+            Paragraph(f"<b>Mission ID:</b> {mission.id}", styles['Normal']),
+            Paragraph(f"<b>Generated:</b> {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}", styles['Normal']),
+            Spacer(1, 30),
+        ))
 
         # Research Quality Summary
-        story.append(Paragraph("Research Quality Metrics", section_style))
         quality_data = [
             ["Metric", "Value"],
             ["Total Entities Researched", str(stats['total_findings'])],
@@ -676,133 +973,132 @@ class FileExporter:
             ["With Pricing Data", str(stats['with_pricing'])],
             ["With Pros/Cons Analysis", str(stats['with_pros_cons'])],
         ]
-        quality_table = Table(quality_data, colWidths=[3*inch, 2*inch])
-        quality_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5282')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('BACKGROUND', (0, 1), (0, -1), colors.HexColor('#e2e8f0')),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('PADDING', (0, 0), (-1, -1), 8),
-            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-        ]))
-        story.append(quality_table)
-        story.append(Spacer(1, 20))
+        quality_table = Table(quality_data, colWidths=[3*inch, 2*inch], spaceAfter=20)
+        quality_table.setStyle(quality_table_style)
+        story.extend((fixed_paragraph("Research Quality Metrics", section_style), quality_table))
 
         # Synthesis sections
         if mission.synthesis and isinstance(mission.synthesis, dict):
             syn = mission.synthesis
 
             if syn.get('executive_summary'):
-                story.append(Paragraph("Executive Summary", section_style))
-                for para in syn['executive_summary'].split('\n\n')[:3]:
-                    if para.strip():
-                        story.append(Paragraph(para.strip()[:600], styles['Normal']))
-                        story.append(Spacer(1, 8))
-                story.append(Spacer(1, 12))
+                story.append(fixed_paragraph("Executive Summary", section_style))
+                # One Paragraph for the whole summary: a single paraparser pass
+                paras = [escape(p.strip()[:600]) for p in syn['executive_summary'].split('\n\n')[:3] if p.strip()]
+                story.append(Paragraph("<br/><br/>".join(paras), styles['Normal']))
+                story.append(Spacer(1, 20))
 
             if syn.get('key_insights'):
-                story.append(Paragraph("Key Insights", section_style))
-                for insight in syn['key_insights'][:8]:
-                    story.append(Paragraph(f"• {insight}", styles['Normal']))
+                story.append(fixed_paragraph("Key Insights", section_style))
+                story.append(ListFlowable(
+                    [ListItem(Paragraph(escape(str(insight)), styles['Normal'])) for insight in syn['key_insights'][:8]],
+                    bulletType='bullet'
+                ))
                 story.append(Spacer(1, 12))
 
             if syn.get('top_recommendations'):
-                story.append(Paragraph("Top Recommendations", section_style))
+                story.append(fixed_paragraph("Top Recommendations", section_style))
                 for rec in syn['top_recommendations'][:5]:
                     # Handle case where rec might not be a dict
                     if not isinstance(rec, dict):
-                        story.append(Paragraph(f"• {str(rec)[:200]}", styles['Normal']))
+                        story.append(Paragraph(f"• {escape(str(rec)[:200])}", styles['Normal']))
                         continue
                     rank = rec.get('rank', '')
                     name = rec.get('name', 'Unknown')
-                    story.append(Paragraph(f"<b>{rank}. {name}</b>", styles['Heading3']))
+                    story.append(Paragraph(f"{escape(str(rank))}. {escape(str(name))}", styles['Heading3']))  # Heading3 is already bold
                     if rec.get('reasoning'):
-                        story.append(Paragraph(f"<i>{rec['reasoning'][:250]}</i>", styles['Normal']))
+                        story.append(Paragraph(f"<i>{escape(str(rec['reasoning'])[:250])}</i>", styles['Normal']))
                     story.append(Spacer(1, 8))
                 story.append(Spacer(1, 12))
 
         # Quick Comparison Table
-        top_findings = sorted(findings, key=lambda f: f.get("depth_score", 0) if isinstance(f, dict) else 0, reverse=True)[:8]
-        if top_findings:
+        top_findings = heapq.nlargest(8, findings, key=_depth_score)
+        if len(top_findings) >= 2:  # A single finding has nothing to compare against
             story.append(PageBreak())
-            story.append(Paragraph("Quick Comparison: Top Findings", section_style))
+            story.append(fixed_paragraph("Quick Comparison: Top Findings", section_style))
 
-            comp_data = [["Name", "Category", "Score", "Pricing", "Features"]]
-            for f in top_findings:
-                comp_data.append([
-                    f.get("name", "Unknown")[:25],
-                    f.get("category", "-")[:12],
-                    f"{f.get('depth_score', 0):.2f}",
-                    "Yes" if f.get("pricing") else "No",
-                    str(len(f.get("features", [])))
-                ])
-
-            comp_table = Table(comp_data, colWidths=[2*inch, 1.2*inch, 0.7*inch, 0.8*inch, 0.8*inch])
-            comp_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5282')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('PADDING', (0, 0), (-1, -1), 6),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f7fafc')]),
-            ]))
+            comp_data = [("Name", "Category", "Score", "Pricing", "Features")]
+            comp_data.extend(map(_comparison_row, top_findings))
+
+            comp_table = Table(comp_data, colWidths=[2*inch, 1.2*inch, 0.7*inch, 0.8*inch, 0.8*inch], spaceAfter=20)
+            comp_table.setStyle(comparison_table_style)
             story.append(comp_table)
-            story.append(Spacer(1, 20))
 
         # Detailed Findings
-        story.append(Paragraph("Detailed Research Findings", section_style))
-        story.append(Spacer(1, 10))
-
-        for i, finding in enumerate(findings[:15], 1):  # Limit to 15 for PDF
-            name = finding.get("name", "Unknown")
-            category = finding.get("category", "")
-            depth_score = finding.get("depth_score", 0)
-            desc = finding.get("description", "No description")[:300]
-
-            story.append(Paragraph(f"<b>{i}. {name}</b>", styles['Heading3']))
-            if category:
-                story.append(Paragraph(f"<i>Category: {category} | Depth Score: {depth_score:.2f}</i>", subtitle_style))
-            story.append(Paragraph(desc, styles['Normal']))
-
-            # Pricing summary
-            pricing = finding.get("pricing", {})
-            if pricing:
-                pricing_text = self._format_pricing_summary(pricing)
-                story.append(Paragraph(f"<b>Pricing:</b> {pricing_text}", styles['Normal']))
-
-            # Features (brief)
-            features = finding.get("features", [])
-            if features:
-                feat_text = ", ".join(features[:5])
-                if len(features) > 5:
-                    feat_text += f" (+{len(features)-5} more)"
-                story.append(Paragraph(f"<b>Features:</b> {feat_text}", styles['Normal']))
-
-            # Pros/Cons summary
-            pros = finding.get("pros", [])
-            cons = finding.get("cons", [])
-            if pros:
-                story.append(Paragraph(f"<b>Pros:</b> {'; '.join(pros[:3])}", styles['Normal']))
-            if cons:
-                story.append(Paragraph(f"<b>Cons:</b> {'; '.join(cons[:3])}", styles['Normal']))
-
-            story.append(Spacer(1, 15))
+        story.extend((fixed_paragraph("Detailed Research Findings", section_style), Spacer(1, 10)))
+
+        pricing_cache: Dict[bytes, str] = {}
+        extend = story.extend
+        for i, finding in enumerate(islice(findings, 15), 1):  # Limit to 15 for PDF
+            # Finding text is escaped once so paraparser never sees a stray & or <
+            name = escape(str(finding.get("name", "Unknown")))
+            extend((
+                Paragraph(f"{i}. {name}", styles['Heading3']),  # Heading3 is already bold
+                Paragraph(self._render_finding_pdf(finding, pricing_cache), finding_style),
+            ))
 
         # Footer
-        story.append(Spacer(1, 30))
-        story.append(Paragraph("---", styles['Normal']))
-        story.append(Paragraph("<i>Generated by CHRONICLE - Marathon Research-to-Action Agent</i>", subtitle_style))
+        story.extend((
+            Spacer(1, 30),
+            fixed_paragraph("---", styles['Normal']),
+            fixed_paragraph("<i>Generated by CHRONICLE - Marathon Research-to-Action Agent</i>", subtitle_style),
+        ))
 
         # Build PDF
         doc.build(story)
+        pdf_bytes = buffer.getvalue()
+        filepath.write_bytes(pdf_bytes)
 
         return {
             "status": "success",
             "format": "pdf",
             "action_type": "export",
-            "id": f"exp_{datetime.now().strftime('%H%M%S')}",
+            "id": f"exp_{now:%H%M%S}",
             "file_path": str(filepath),
             "file_url": f"/exports/{mission.id}/{filename}",
             "records_exported": len(mission.findings),
-            "file_size_bytes": filepath.stat().st_size
+            "file_size_bytes": len(pdf_bytes)
         }
+
+
+# ===========================================
+# PDF WORKER PROCESSES
+# ===========================================
+
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+
+# export_dir -> this worker process's exporter (keeps its style caches warm)
+_process_exporters: Dict[Path, FileExporter] = {}
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """The PDF rendering pool, started on the first PDF export."""
+    global _pdf_pool
+    if _pdf_pool is None:
+        # spawn: forking a process that runs an event loop and logging threads is unsafe
+        _pdf_pool = ProcessPoolExecutor(
+            max_workers=settings.pdf_export_processes or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pdf_pool
+
+
+def _export_pdf_in_process(
+    export_dir: Path,
+    mission: Mission,
+    include_metadata: bool,
+    filename_prefix: str = None
+) -> Dict[str, Any]:
+    """Worker-process entry point: render a mission's PDF report."""
+    exporter = _process_exporters.get(export_dir)
+    if exporter is None:
+        exporter = _process_exporters[export_dir] = FileExporter(export_dir)
+    return exporter._export_pdf(mission, include_metadata, filename_prefix)
+
+
+def shutdown_pdf_pool() -> None:
+    """Stop the PDF worker processes (application shutdown)."""
+    global _pdf_pool
+    if _pdf_pool is not None:
+        _pdf_pool.shutdown(wait=False, cancel_futures=True)
+        _pdf_pool = None
@@ -0,0 +1,10 @@
+from .clock import CoarseClock, coarse_clock
+from .etag import mission_etag, not_modified
+from .log import get_logger
+from .orjson_response import ORJSONResponse
+from .rate_limit import TokenBucket, gemini_limiter
+
+__all__ = [
+    "CoarseClock", "coarse_clock", "get_logger", "mission_etag", "not_modified",
+    "ORJSONResponse", "TokenBucket", "gemini_limiter"
+]
@@ -0,0 +1,43 @@
+"""
+CHRONICLE Clock - Coarse cached timestamps for non-critical paths
+"""
+import time
+from datetime import datetime
+
+
+class CoarseClock:
+    """
+    UTC "now" refreshed at most once per `resolution` seconds.
+
+    Heartbeats and similar informational timestamps reuse the cached value
+    instead of allocating a new datetime (and ISO string) per call. Anything
+    ordering-sensitive, such as event timestamps used for SSE replay, should
+    keep reading the real clock.
+    """
+
+    def __init__(self, resolution: float = 0.05):
+        self._resolution_ns = int(resolution * 1_000_000_000)
+        self._next_refresh_ns = 0
+        self._now = datetime.utcnow()
+        self._now_iso = self._now.isoformat()
+
+    def _refresh(self) -> None:
+        mono = time.monotonic_ns()
+        if mono >= self._next_refresh_ns:
+            self._now = datetime.utcnow()
+            self._now_iso = self._now.isoformat()
+            self._next_refresh_ns = mono + self._resolution_ns
+
+    def now(self) -> datetime:
+        """Current UTC time, accurate to the clock's resolution."""
+        self._refresh()
+        return self._now
+
+    def now_iso(self) -> str:
+        """now() as a cached ISO-8601 string."""
+        self._refresh()
+        return self._now_iso
+
+
+# Global instance
+coarse_clock = CoarseClock()
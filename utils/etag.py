@@ -0,0 +1,25 @@
+"""
+CHRONICLE ETags - Conditional GET support for polled mission routes
+"""
+from typing import Optional
+
+from fastapi import Request, Response
+
+
+def mission_etag(mission) -> str:
+    """Weak ETag derived from the mission's id and updated_at."""
+    return f'W/"{mission.id}-{mission.updated_at.timestamp():.6f}"'
+
+
+def not_modified(request: Request, response: Response, mission) -> Optional[Response]:
+    """
+    Tag the response with the mission's ETag.
+
+    Returns a 304 response when the client's If-None-Match already matches,
+    so unchanged polls skip rebuilding and sending the payload.
+    """
+    etag = mission_etag(mission)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return None
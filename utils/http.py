@@ -0,0 +1,22 @@
+"""
+CHRONICLE HTTP - Shared async HTTP session for Gemini clients
+"""
+import httpx
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 multiplexing in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+# Fan-out queries from every mission reuse pooled (and, with h2, multiplexed)
+# connections instead of paying a TLS handshake per call
+_SHARED_TRANSPORT = httpx.AsyncHTTPTransport(
+    http2=HTTP2_AVAILABLE,
+    retries=2,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+)
+
+# Global instance (closed on application shutdown)
+http_client = httpx.AsyncClient(transport=_SHARED_TRANSPORT, timeout=httpx.Timeout(60.0, connect=5.0))
@@ -0,0 +1,40 @@
+"""
+CHRONICLE Logging - Queue-backed loggers for the async code paths
+"""
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+_ROOT_NAME = "chronicle"
+_LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+
+def _configure() -> QueueListener:
+    """
+    Route every chronicle.* logger through an unbounded queue.
+
+    A log call from a coroutine is only an enqueue; formatting and the
+    stderr write happen on the listener's background thread.
+    """
+    records: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter(_LOG_FORMAT))
+
+    root = logging.getLogger(_ROOT_NAME)
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(records))
+    root.propagate = False
+
+    listener = QueueListener(records, stream, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # Drain queued records on shutdown
+    return listener
+
+
+_listener = _configure()
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger for a module, e.g. `log = get_logger(__name__)`."""
+    return logging.getLogger(f"{_ROOT_NAME}.{name}")
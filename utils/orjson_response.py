@@ -0,0 +1,24 @@
+"""
+CHRONICLE ORJSON Response - Fast JSON rendering for API responses
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered by orjson.
+
+    Datetimes, enums, UUIDs and NumPy values are encoded natively, so routes
+    can return this directly and skip FastAPI's jsonable_encoder pass.
+    Naive datetimes are rendered without an offset, matching jsonable_encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
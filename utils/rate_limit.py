@@ -0,0 +1,60 @@
+"""
+CHRONICLE Rate Limiting - Token bucket pacing for Gemini calls
+"""
+import asyncio
+import time
+
+from config import settings
+
+
+class TokenBucket:
+    """
+    Async token bucket: `rate` tokens per second, bursting up to `capacity`.
+
+    Callers take one token per request with `await bucket.acquire()`. While
+    tokens are available nothing waits, so independent coroutines only slow
+    down when the quota is actually spent. Waiters are served in FIFO order.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._base_rate = rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._throttled_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        if self.rate != self._base_rate and now >= self._throttled_until:
+            self.rate = self._base_rate  # Throttle window over
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def throttle(self, seconds: float) -> None:
+        """
+        Back off after the API reported a rate limit (HTTP 429).
+
+        Drains the bucket and halves the refill rate for `seconds`; repeated
+        429s keep halving it, and the configured rate returns afterwards.
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens = 0.0
+        self.rate = max(self.rate / 2, self._base_rate / 64)
+        self._throttled_until = max(self._throttled_until, now + seconds)
+
+
+# Global instance shared by every Gemini caller in the process
+gemini_limiter = TokenBucket(rate=settings.gemini_rpm / 60, capacity=settings.gemini_rpm)